@@ -77,6 +77,21 @@ class ASMExpr(object):
         # Use the Pratt parser to evaluate the expression
         return self.pratt.evaluate(external,debug=debug,trace=trace)
 
+    # Compiles the prepared Pratt expression for repeated evaluation, along with
+    # the expressions embedded in its complex terms.  A quick expression is
+    # already evaluated without the Pratt parser and is not itself compiled.
+    # Method Argument:
+    #   engine   the asmmacs.MacroEngine object of the macro being compiled
+    def compile(self,engine):
+        assert self.pratt is not None,"%s pratt attribute is None" \
+            % assembler.eloc(self,"compile",module=this_module)
+
+        for ptok in self.pratt.toks:
+            if isinstance(ptok,asmtokens.PLitCTerm):
+                ptok.compile(engine)
+        if not self.quick:
+            self.pratt.compile(self.pratt.evaluator)
+
     # Finds the first tid in an expression list.  Used mainly for address expressions
     # that need to find the first tid.  The user must know the TID.
     def find_first_ltok(self,tid=[]):
@@ -514,6 +529,8 @@ class CTerm(ASMOperand):
 
 
 class ASMPLoc(object):
+    __slots__=("source","pndx")
+
     def __init__(self,source=None,pndx=None):
         self.source=source  # Physical line asminput.Source object
         self.pndx=pndx      # Index within the physical line of this input location
@@ -1651,10 +1668,15 @@ class ASMProcessor(object):
 
     # Drive one or more processes.  Called by the subclass to drive its processing
     def process(self):
+        prof=assembler.Stats.profiler
         for n,phaset in enumerate(self.phases):
             self.phase=n                       # Set the current phase number
             self.cur_phase,phase=phaset        # Set the name of the current phase
-            self.result=phase(self.asm,fail=self.asm.fail)  # Execute it!
+            if prof is None:
+                self.result=phase(self.asm,fail=self.asm.fail)  # Execute it!
+            else:
+                self.result=prof.phase(self.cur_phase,phase,self.asm,\
+                    fail=self.asm.fail)
         #print("%s.process '%s' result: class: %s - %s" \
         #    % (self.__class__.__name__,self.cur_phase,\
         #        self.result.__class__.__name__,self.result))
@@ -26,7 +26,8 @@ this_module="asmbin.py"
 import assembler
 
 # SATK imports:
-from translate import A2E  # Character translation table
+import codepage                # Access shared translation tables
+from translate import A2E,E2A  # Character translation tables
 
 #
 #  +---------------------------+
@@ -40,6 +41,8 @@ class AsmBinary(object):
     TXT=b"\x02\xE3\xE7\xE3"
     END=b"\x02\xC5\xD5\xC4"
     SPACE=b"\x40"
+    # Shared translator of the character translation tables
+    trans=codepage.tables("translate.py",A2E,E2A)
     def __init__(self):
         # Binary work in progress.  See __find_contig() method
         self.contig=None
@@ -130,9 +133,13 @@ class AsmBinary(object):
         return hexdata
 
     def card_sequence(self,number):
-        num="%08d" % number
-        num=num.translate(A2E)
-        return bytearray(AsmBinary.str2array(num))
+        return AsmBinary.trans.a2eba("%08d" % number)
+
+    # Returns the EBCDIC card sequence numbers, columns 73-80, of a deck as a
+    # single bytes sequence.  Card n's sequence number is found at (n-1)*8.
+    def card_sequences(self,cards):
+        nums=["%08d" % number for number in range(1,cards+1)]
+        return AsmBinary.trans.a2eb("".join(nums))
 
     # Return a object deck for loading assembled content from statements.
     def deck(self,asm):
@@ -158,42 +165,35 @@ class AsmBinary(object):
         TXT=bytearray(AsmBinary.TXT)
         END=bytearray(AsmBinary.END)
         ESDID=(0).to_bytes(2,byteorder="big")  # Positions 15 and 16 in TXT record
-        number=1
-        deck=[]
+        # The sequence numbers of all cards are translated in one operation
+        seqs=self.card_sequences(len(chunks)+1)
+        seq=0
+        deck=bytearray()
 
         # Generate TXT records
         for c in chunks:
-            record=[]
-            record.extend(TXT)                        # Pos 1-4
-            record.extend(blank1)                     # Pos 5
-            addr=c.addr.to_bytes(3,byteorder="big")
-            record.extend(addr)                       # Pos 6-8
-            record.extend(blank2)                     # Pos 9,10
-            bytes=len(c.data).to_bytes(2,byteorder="big")
-            record.extend(bytes)                      # Pos 11,12
-            record.extend(blank2)                     # Pos 13,14
-            record.extend(ESDID)                      # Pos 15,16
-            blanks=56-len(c.data)
-            blanks=blanks*blank1
-            record.extend(c.data)
-            record.extend(blanks)                     # Pos 17-72
-            record.extend(self.card_sequence(number)) # Pos 73-80
-            number+=1
-            deck.extend(record)
+            deck+=TXT                                 # Pos 1-4
+            deck+=blank1                              # Pos 5
+            deck+=c.addr.to_bytes(3,byteorder="big")  # Pos 6-8
+            deck+=blank2                              # Pos 9,10
+            deck+=len(c.data).to_bytes(2,byteorder="big") # Pos 11,12
+            deck+=blank2                              # Pos 13,14
+            deck+=ESDID                               # Pos 15,16
+            deck.extend(c.data)
+            deck+=(56-len(c.data))*blank1             # Pos 17-72
+            deck+=seqs[seq:seq+8]                     # Pos 73-80
+            seq+=8
 
         # Generate END record
-        record=[]
-        record.extend(END)                            # Pos 1-4
-        record.extend(blank1)                         # Pos 5
-        entry=entry.to_bytes(3,byteorder="big")
-        record.extend(entry)                          # Pos 6-8
-        record.extend(6*blank1)                       # Pos 9-14
-        record.extend(ESDID)                          # Pos 15,16
-        record.extend(56*blank1)                      # Pos 17-72
-        record.extend(self.card_sequence(number))     # Pos 73-80
-        deck.extend(record)
-
-        return bytearray(deck)
+        deck+=END                                     # Pos 1-4
+        deck+=blank1                                  # Pos 5
+        deck+=entry.to_bytes(3,byteorder="big")       # Pos 6-8
+        deck+=6*blank1                                # Pos 9-14
+        deck+=ESDID                                   # Pos 15,16
+        deck+=56*blank1                               # Pos 17-72
+        deck+=seqs[seq:seq+8]                         # Pos 73-80
+
+        return deck
 
     # Create tuple list of list for directed IPL content.
     # Each tuple contains:
@@ -157,6 +157,21 @@ class asma(config.Tool):
                  "omitted, a command file is not created.",\
             cl=True,cfg=True))
 
+        # Path and filename of the written assembly profile
+        cfg.arg(config.Option_SV("profile",full="profile",metavar="FILEPATH",\
+            help="JSON file of the assembly profile: time and calls by assembler "
+                 "phase, statement class and pass, and macro.  If omitted, the "
+                 "assembly is not profiled.",\
+            cl=True,cfg=True))
+
+        # Path and filename of the incremental assembly dependency manifest
+        cfg.arg(config.Option_SV("deps",full="deps",metavar="FILEPATH",\
+            help="JSON dependency manifest of the assembly's options, input files "
+                 "and output files.  When none have changed since the manifest was "
+                 "written, the assembly is skipped.  If omitted, the assembly is "
+                 "always performed.",\
+            cl=True,cfg=True))
+
         # Set case sensitivity
         cfg.arg(config.Enable("case",full="case",\
             help="Enable case sensitivity for labels, symbolic variables, and "
@@ -188,6 +203,28 @@ class asma(config.Tool):
                  "specified by the MSLPATH environment variable.",\
             cl=True,cfg=True))
 
+        # Persistent cache of expanded MSL CPU definitions
+        cfg.arg(config.Option_SV("mslcache",full="msl-cache",metavar="DIR",\
+            help="directory of the persistent cache of expanded MSL CPU "
+                 "definitions.  A valid cache entry avoids processing of the MSL "
+                 "files.  If omitted, the MSL files are always processed.",\
+            cl=True,cfg=True))
+
+        # Persistent cache of macro library definitions
+        cfg.arg(config.Option_SV("maccache",full="mac-cache",metavar="DIR",\
+            help="directory of the persistent cache of macro library definitions. "
+                 "A valid cache entry avoids reading and defining the macros of a "
+                 "MACLIB file.  If omitted, MACLIB files are always processed.",\
+            cl=True,cfg=True))
+
+        # Persistent cache of floating point constant conversion results
+        cfg.arg(config.Option_SV("fpcache",full="fp-cache",metavar="DIR",\
+            help="directory of the persistent cache of floating point constant "
+                 "conversion results.  Cached results avoid converting the same "
+                 "constant again.  If omitted, results are cached only during the "
+                 "run.",\
+            cl=True,cfg=True))
+
         # Maximum depth of nested input sources.
         # May be specified in a local configuration
         nest_default="20"
@@ -1086,6 +1086,11 @@ class DCDS_Operand(asmbase.AsmFSMScope):
                 linepos=self._typ_tok.linepos,\
                     msg="constant operand requires a nominal value")
 
+        # Build a duplicated group of nominal values once when its content does
+        # not depend upon its location.
+        if self.dup>1 and Duplicated.eligible(self.values):
+            return [Duplicated(self.values,self.dup,self.T),]
+
         # Unroll the nominal values per duplication factor
         nominal_values=[]
         for n in range(self.dup):
@@ -1135,11 +1140,20 @@ class DCDS_Operand(asmbase.AsmFSMScope):
 #   signed      Specify True if by default the nominal value is signed.  Defaults
 #               to None.  None is not equivalent to False.
 class Nominal(object):
+    # Whether the assembled content is independent of the nominal value's location
+    # allowing duplicates to be built once.  See the Duplicated class.
+    repeatable=False
 
     # Accepts a string of digits and converts them to bytes using the supplied
     # base and number of characters per byte.
     @staticmethod
     def base2bytes(digits,base,cpb):
+        chars=len(digits)
+        # When each byte's characters exactly represent a byte, all of the bytes
+        # are converted at once.
+        if chars and chars%cpb==0 and base**cpb==256:
+            return int(digits,base).to_bytes(chars//cpb,byteorder="big")
+
         b=bytearray(0)
         chars=len(digits)
         for x in range(0,chars,cpb):
@@ -1246,6 +1260,11 @@ class Nominal(object):
     def length(self):
         return self._length
 
+    # Returns the number of bytes occupied by the nominal value.  Only differs
+    # from the length of a Duplicated object.
+    def size(self):
+        return self._length
+
     # Update the nominal value with the constant operand's explicit length.
     # This method is only called when a valid explicit length has been provided for
     # the constant's nominal values.  All subclasses use this method.
@@ -1285,7 +1304,6 @@ class Address(Nominal):
                     % (assembler.eloc(self,"build",module=this_module),self.content))
 
         asm.cur_loc.establish(self.content.loc,debug=trace)
-        self.content.barray=bytearray(self._length)
         data=self.ivalue.build(asm,asm.PM,stmt,n,self._length,trace=trace)
         self.content.update(data,full=True,finalize=True,trace=trace)
         self.cur_loc(asm)
@@ -1296,6 +1314,7 @@ class Address(Nominal):
 
 
 class BinaryBits(Nominal):
+    repeatable=True
     def __init__(self,ltok):
         length,align,cpb,base=self.__class__.attr
         super().__init__(ltok,length=length,alignment=align,signed=False)
@@ -1311,13 +1330,13 @@ class BinaryBits(Nominal):
                 self.content)
 
     def build(self,stmt,asm,n,debug=False,trace=False):
-        self.content.barray=bytearray(self._length)
         data=self.ivalue.build(self._length)
         self.content.update(data,full=True,finalize=True,trace=trace)
         self.cur_loc(asm)
 
 
 class Characters(Nominal):
+    repeatable=True
     def __init__(self,ltok,ccls):
         super().__init__(ltok,length=1,alignment=0,signed=False)
 
@@ -1333,13 +1352,13 @@ class Characters(Nominal):
                 self.content)
 
     def build(self,stmt,asm,n,debug=False,trace=False):
-        self.content.barray=bytearray(self._length)
         data=self.ivalue.build(self._length)
         self.content.update(data,full=True,finalize=True,trace=trace)
         self.cur_loc(asm)
 
 
 class DecimalPointed(Nominal):
+    repeatable=True
     def __init__(self,ltok,dcls):
         length,align=self.__class__.attr
         super().__init__(ltok,length=length,alignment=align,signed=True)
@@ -1360,7 +1379,6 @@ class DecimalPointed(Nominal):
                 self.content)
 
     def build(self,stmt,asm,n,debug=False,trace=True):
-        self.content.barray=bytearray(self._length)
         data=self.ivalue.build(self._length)
         self.content.update(data,full=True,finalize=True,trace=trace)
         self.cur_loc(asm)
@@ -1372,7 +1390,88 @@ class DecimalPointed(Nominal):
         #    % (assembler.eloc(self,"Pass1",module=this_module),self.T,self.S,self.I))
 
 
+# This object stands in for a duplicated group of nominal values whose content does
+# not depend upon their location.  The group is built once and repeated for each
+# duplication, rather than creating and building an object for each nominal value.
+# The duplicated group is laid out exactly as the unrolled nominal values would
+# be.  See the eligible() method.
+#
+# Instance Arguments:
+#   values   The list of Nominal objects of one duplication of the operand
+#   dup      The operand's duplication factor
+#   T        The operand's type attribute
+class Duplicated(Nominal):
+    def __init__(self,values,dup,T):
+        first=values[0]
+        super().__init__(None,length=first.length(),alignment=first.align(),\
+            signed=False)
+        self.values=[]     # Nominal objects of a single duplication
+        for value in values:
+            nom=value.clone()
+            nom.T=T
+            self.values.append(nom)
+        self.dup=dup
+        # The length of a single duplication
+        self.unit=sum([value.length() for value in values])
+
+        # The first nominal value provides the operand's attributes
+        self.T=T
+        self.S=first.S
+        self.I=first.I
+
+    # Returns whether a list of nominal values may be duplicated as a group: each
+    # value's content is independent of its location, the group starts with its
+    # most restrictive alignment and no value requires alignment padding within
+    # the group or between duplicates.
+    @staticmethod
+    def eligible(values):
+        if len(values)==0:
+            return False
+        align=0
+        for value in values:
+            if not value.repeatable:
+                return False
+            align=max(align,value.align())
+        if values[0].align()!=align:
+            return False
+        offset=0
+        for value in values:
+            value_align=value.align()
+            if value_align and offset % value_align:
+                return False
+            offset+=value.length()
+        return offset>0 and (align==0 or offset % align==0)
+
+    def __str__(self):
+        return "%s(dup=%s,unit=%s,alignment=%s,values=%s,content=%s" \
+            % (self.__class__.__name__,self.dup,self.unit,self._alignment,\
+                len(self.values),self.content)
+
+    # Builds the first duplicate from its nominal values and repeats it.
+    def build(self,stmt,asm,n,debug=False,trace=False):
+        loc=self.content.loc
+        data=[]
+        for value in self.values:
+            value.content=assembler.Binary(value.align(),value.length())
+            value.content.loc=loc
+            value.content.make_barray()
+            value.build(stmt,asm,n,debug=debug,trace=trace)
+            data.append(value.content.barray)
+            loc=loc+value.length()
+            value.content=None
+
+        self.content.update(b"".join(data)*self.dup,full=True,finalize=True,\
+            trace=trace)
+        asm.cur_loc.establish(self.content.loc)
+        self.cur_loc(asm)
+
+    # Returns the number of bytes occupied by all of the duplicates
+    def size(self):
+        return self.unit*self.dup
+
+
 class Float(Nominal):
+    repeatable=True
     def __init__(self,ltok,dcls):
         assert ltok.tid in ["DCFLOAT","DCFLSPL"],\
             "%s unexpected lexical token: %s"\
@@ -1395,7 +1494,6 @@ class Float(Nominal):
         #    raise assembler.AssemblerError(line=stmt.lineno,\
         #        msg="operand %s %s" % (n,ape.msg)) from None
 
-        self.content.barray=bytearray(self._length)
         data=self.ivalue.build()
 
         # Report any overflow or underflow
@@ -1423,7 +1521,6 @@ class SConstant(Nominal):
         self.ivalue=SCON(addrexpr,size=size)
 
     def build(self,stmt,asm,n,debug=False,trace=False):
-        self.content.barray=bytearray(self._length)
         data=self.ivalue.build(asm,asm.PM,stmt,n,self._length)
         self.content.update(data,full=True,finalize=True,trace=trace)
         self.cur_loc(asm)
@@ -1434,6 +1531,7 @@ class SConstant(Nominal):
 # objects if used when no nominal values are supplied for the operand.  Regular
 # nominal values are used if the DS statement actually has nominal values.
 class Storage(Nominal):
+    repeatable=True
     def __init__(self,typcls):
         attr=typcls.attr
         super().__init__(None,length=attr[0],alignment=attr[1],signed=False)
@@ -1466,6 +1564,7 @@ class Storage(Nominal):
 
 
 class TwosCompBin(Nominal):
+    repeatable=True
     def __init__(self,ltok):
         length,align=self.__class__.attr
         super().__init__(ltok,length=length,alignment=align,signed=True)
@@ -1480,7 +1579,6 @@ class TwosCompBin(Nominal):
                 self.content)
 
     def build(self,stmt,asm,n,debug=False,trace=False):
-        self.content.barray=bytearray(self._length)
         data=self.ivalue.build(self._length)
         self.content.update(data,full=True,finalize=True,trace=trace)
         self.cur_loc(asm)
@@ -1914,12 +2012,29 @@ class FixedPoint(object):
 
 # This object provides generic support for floating point constants.  Each
 # subclass tailors the actions for each type of floating point constant.
+#
+# Conversions are performed through the process-wide fp.Cache object.  A constant
+# already converted, for example by a macro generated statement or a literal
+# referenced by many statements, reuses the cached result.
 class FloatingPoint(object):
     def __init__(self,mo,length,debug=False):
         self.mo=mo           # Lexical token match object
         self.length=length   # Length of the floating point constant in bytes
         self.debug=debug     # Remember whether we are debugging or not
-        self.fp=None         # The fp.FP subclass associated with the FP datum
+        self.fp=None         # The fp.FP_Result object of the FP datum
+
+    # Converts the constant through the conversion result cache
+    # Method Arguments:
+    #   typ      The fp module constant type: 'b', 'd' or 'h'
+    #   special  The special value string or None
+    #   debug    Whether conversion debugging messages are enabled
+    # Returns:
+    #   the fp.FP_Result object of the conversion
+    # Exception:
+    #   fp.FPError if the conversion fails
+    def convert(self,typ,special=None,debug=False):
+        return fp.Cache.convert(typ,self.mo,length=self.length,special=special,\
+            stats=assembler.Stats.cache("fp conversion"),debug=debug)
 
     def build(self,trace=False):
         return self.fp.to_bytes()
@@ -1935,9 +2050,9 @@ class DFP(FloatingPoint):
     def __init__(self,mo,length,special=None,debug=False):
         super().__init__(mo,length)
         if special:
-            self.fp=fp.DFP(None,length=self.length,special=special,debug=debug)
+            self.fp=self.convert("d",special=special,debug=debug)
         else:
-            self.fp=fp.DFP(self.mo,length=self.length,debug=debug)
+            self.fp=self.convert("d",debug=debug)
 
 
 # This object builds S-type constants.  It is very similar to ADCON.
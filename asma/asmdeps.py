@@ -0,0 +1,238 @@
+#!/usr/bin/python3
+# Copyright (C) 2026 The SATK contributors
+#
+# This file is part of SATK.
+#
+#     SATK is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     SATK is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with SATK.  If not, see <http://www.gnu.org/licenses/>.
+
+# This module supports incremental assembly.  Following an assembly, a dependency
+# manifest is written recording everything upon which the assembly's output
+# depends:
+#   - the assembly's options, including directory search orders and -D symbols,
+#   - the initial source and COPY directive files,
+#   - the macro library files read and the macro file names not found,
+#   - the MSL files from which the targeted CPU was expanded,
+#   - a user supplied code page file, and
+#   - the output files written.
+# Each file is recorded with its size, modification time and SHA-1 digest.
+#
+# Before a later assembly with the same manifest file, the manifest is checked.
+# When the options are the same, every input file still resolves to the same path
+# with the same content, no missing macro file has appeared and every output file
+# is as written, the assembly is skipped.
+#
+# The manifest is a JSON document.
+
+this_module="asmdeps.py"
+
+# Python imports:
+import hashlib      # Access SHA-1 content digests
+import json         # Access the manifest file format
+import os           # Access file status and path manipulation
+import sys          # Access the Python version
+
+# SATK imports:
+import satkutil     # Access the PathMgr class
+
+
+# This class manages the dependency manifest of an assembly.
+#
+# Instance Arguments:
+#   filename   The path of the manifest file
+#   args       The config.Config object of the assembly's options
+#   aout       The assembler.AsmOut object of the assembly's output files
+class AsmDeps(object):
+    version=1       # Change when the manifest structure changes
+
+    # Options that do not influence the assembly's output
+    ignore=["deps","cinfo","stats"]
+
+    def __init__(self,filename,args,aout):
+        self.filename=filename
+        self.args=args
+        self.aout=aout
+
+    # Returns the value of an option suitable for JSON encoding
+    @staticmethod
+    def encode(value):
+        if value is None or isinstance(value,(bool,int,float,str)):
+            return value
+        if isinstance(value,(list,tuple)):
+            return [AsmDeps.encode(v) for v in value]
+        if isinstance(value,satkutil.PathMgr):
+            paths={}
+            for variable,path in value.paths.items():
+                paths[variable]=list(path.dir_list)
+            return paths
+        return str(value)
+
+    # Returns the dictionary of a file's size, modification time and SHA-1 digest
+    @staticmethod
+    def fingerprint(filepath):
+        st=os.stat(filepath)
+        with open(filepath,"rb") as fo:
+            digest=hashlib.sha1(fo.read()).hexdigest()
+        return {"path":filepath,
+                "size":st.st_size,
+                "mtime":st.st_mtime_ns,
+                "sha1":digest}
+
+    # Returns whether a file matches its recorded fingerprint
+    @staticmethod
+    def unchanged(entry):
+        filepath=entry["path"]
+        try:
+            st=os.stat(filepath)
+        except OSError:
+            return False
+        if st.st_size!=entry["size"]:
+            return False
+        if st.st_mtime_ns==entry["mtime"]:
+            return True
+        # File touched.  Only its content matters.
+        try:
+            with open(filepath,"rb") as fo:
+                return hashlib.sha1(fo.read()).hexdigest()==entry["sha1"]
+        except OSError:
+            return False
+
+    # Returns the absolute path to which a file name resolves in a directory search
+    # order or None if not found.
+    @staticmethod
+    def resolve(pathmgr,name,variable):
+        try:
+            filepath,fo=pathmgr.ropen(name,variable=variable)
+        except (OSError,ValueError):
+            return None
+        fo.close()
+        return os.path.abspath(filepath)
+
+    # Returns the assembly's output file paths
+    def __outputs(self):
+        aout=self.aout
+        files=[]
+        for filepath in [aout.deck,aout.image,aout.ldipl,aout.listing,aout.mc,\
+                         aout.rc,aout.vmc,aout.profile]:
+            if filepath is not None:
+                files.append(os.path.abspath(filepath))
+        return files
+
+    # Returns the dictionary of options influencing the assembly
+    def __options(self):
+        options={}
+        for name in self.args.names():
+            if name in AsmDeps.ignore:
+                continue
+            options[name]=AsmDeps.encode(self.args[name])
+        return options
+
+    # Returns the PathMgr object of a directory search order environment variable
+    def __pathmgr(self,variable):
+        return self.args[variable.lower()]
+
+    # Returns whether the assembly may be skipped because nothing has changed
+    # since the manifest was written.
+    def current(self):
+        try:
+            with open(self.filename,"rt") as fo:
+                manifest=json.load(fo)
+            if manifest["version"]!=AsmDeps.version \
+               or manifest["python"]!=sys.hexversion \
+               or manifest["options"]!=self.__options():
+                return False
+
+            # Search order files must resolve to the same file
+            for entry in manifest["sources"]:
+                pathmgr=self.__pathmgr(entry["variable"])
+                if AsmDeps.resolve(pathmgr,entry["name"],entry["variable"]) \
+                   != entry["path"]:
+                    return False
+
+            # Missing files must still be missing
+            for entry in manifest["missing"]:
+                pathmgr=self.__pathmgr(entry["variable"])
+                if AsmDeps.resolve(pathmgr,entry["name"],entry["variable"]) \
+                   is not None:
+                    return False
+
+            # All input and output files must be unchanged
+            for entry in manifest["files"]:
+                if not AsmDeps.unchanged(entry):
+                    return False
+            outputs=[]
+            for entry in manifest["outputs"]:
+                if not AsmDeps.unchanged(entry):
+                    return False
+                outputs.append(entry["path"])
+            return outputs==self.__outputs()
+        except Exception:
+            # Any problem with the manifest simply causes the assembly to be run
+            return False
+
+    # Remove the manifest of a previous assembly.  Failure to remove the manifest
+    # is reported but is not an error.
+    def remove(self):
+        try:
+            os.remove(self.filename)
+        except FileNotFoundError:
+            pass
+        except OSError as oe:
+            print("%s - could not remove dependency manifest %s: %s" \
+                % (this_module,self.filename,oe))
+
+    # Write the manifest of a completed assembly whose output has been written.
+    # Only an assembly without errors is recorded.
+    # Failure to write the manifest is reported but is not an error.
+    # Method Argument:
+    #   asm    The assembler.Assembler object of the assembly
+    def record(self,asm):
+        sources=[]     # Files located by a directory search order
+        files=[]       # Fingerprints of all input files
+        missing=[]     # Macro library files not found
+        try:
+            for variable,lb in [("ASMPATH",asm.IM.LB),("MACLIB",asm.MP.IM.LB)]:
+                for name,filepath in lb.InputFiles():
+                    filepath=os.path.abspath(filepath)
+                    sources.append({"name":name,"variable":variable,\
+                        "path":filepath})
+                    files.append(AsmDeps.fingerprint(filepath))
+            for name in asm.MP.notfound:
+                missing.append({"name":name,"variable":"MACLIB"})
+            for filepath in asm.OMF.cache.cpux.files:
+                files.append(AsmDeps.fingerprint(os.path.abspath(filepath)))
+            if asm.cpfile is not None:
+                files.append(AsmDeps.fingerprint(os.path.abspath(asm.cpfile)))
+
+            outputs=[]
+            for filepath in self.__outputs():
+                outputs.append(AsmDeps.fingerprint(filepath))
+
+            manifest={"version":AsmDeps.version,
+                      "python":sys.hexversion,
+                      "options":self.__options(),
+                      "sources":sources,
+                      "missing":missing,
+                      "files":files,
+                      "outputs":outputs}
+            tmpfile="%s.%s.tmp" % (self.filename,os.getpid())
+            with open(tmpfile,"wt") as fo:
+                json.dump(manifest,fo,indent=1)
+            os.replace(tmpfile,self.filename)
+        except OSError as oe:
+            print("%s - could not write dependency manifest %s: %s" \
+                % (this_module,self.filename,oe))
+
+
+if __name__ == "__main__":
+    raise NotImplementedError("%s - intended for import use only" % this_module)
@@ -379,8 +379,13 @@ class PoolSource(InjectableSource):
 #  +-------------------------------------+
 #
 
+# Physical lines persist for the life of the assembly.  Slots avoid a
+# per-instance dictionary.
 class PhysLine(object):
     conspaces=" "*15
+    __slots__=("typ","source","content","genlvl","literal","cont","empty","text",\
+               "comment","quiet","oper_start","operand_start","comment_start")
+
     def __init__(self,source,content,genlvl=None):
         assert source is None or isinstance(source,Source),\
             "%s 'source' argumenet must be an instance of Source: %s" \
@@ -474,6 +479,8 @@ class PhysLine(object):
 
 
 class StreamLine(PhysLine):
+    __slots__=("seq",)
+
     def __init__(self,source,content,genlvl=None,seq=False):
         self.seq=seq         # Enable 80 column card handling
         super().__init__(source,content,genlvl=genlvl)
@@ -665,6 +672,23 @@ class LineBuffer(object):
             return None
         return self._files[0].fname
 
+    # Returns a list of the file sources read by this LineBuffer.  Each list
+    # element is a tuple of the file name as requested and its absolute path.
+    def InputFiles(self):
+        files=[]
+        for src in self._files:
+            files.append((src.rname,src.fname))
+        return files
+
+    # Returns the absolute path of the current input file source
+    # Returns:
+    #   A Python string of the current file's absolute path
+    #   None  if the current source is not a file
+    def SourcePath(self):
+        if self._cur_src is None or self._cur_src._typ!="F":
+            return None
+        return self._cur_src.fname
+
     # Initiate a new file input source
     def newFile(self,filename,stmtno=None):
         fname=filename
@@ -720,6 +744,8 @@ class LineBuffer(object):
 
 # This encapsulates statement location information for consistent printing
 class Source(object):
+    __slots__=("fileno","lineno","linepos")
+
     def __init__(self,fileno=None,lineno=None,linepos=None):
         self.fileno=fileno
         self.lineno=lineno
@@ -731,6 +731,11 @@ class cfsm(fsm.FSM):
 class LogLine(object):
     #                       label       sp       oper             sp
     fieldre=re.compile("(?P<label>[^ ]+)?([ ]+)(?P<oper>[^ ]+)(?P<sp>[ ]*)")
+    # Logical lines persist for the life of the assembly.  Slots avoid a
+    # per-instance dictionary.
+    __slots__=("plines","source","genlvl","literal","error","label_fld","oper_fld",\
+               "opnd_fld","operu","T","spaces","sep","alt","optn","info","operands",\
+               "comment","quiet","empty","cont","bend","ignore")
     def __init__(self,pline,bend=False):
         assert isinstance(pline,asminput.PhysLine),\
             "LogLine object pline argument not a asminput.PhysLine object: %s" % pline
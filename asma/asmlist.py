@@ -20,11 +20,12 @@
 
 this_module="asmlist.py"
 
-# Python imports: none
+# Python imports:
+import collections         # Access the deque detail line buffer
 # SATK imports:
 from listing import *      # Access the listing generator tools
-from satkutil import byte2str   # Function that converts bytes to a string
-from translate import E2A  # Character translation table
+import codepage            # Access shared translation tables
+from translate import A2E,E2A  # Character translation tables
 
 # ASMA imports
 import assembler           # Access to some assembler objects
@@ -57,16 +58,21 @@ class ListingLine(object):
 
 class AsmListing(Listing):
 
+    # Shared translator of the character translation tables
+    trans=codepage.tables("translate.py",A2E,E2A)
+
     # This static method converts a single byte into a printable character.
     # EBCDIC and ASCII characters are both recognized.  Unprintable characters
     # are replaced with '.'.
     @staticmethod
     def print_hex(byte):
-        char=E2A[byte]
-        chrnum=ord(char)
-        if chrnum<0x20 or chrnum>0x7E:
-                char="."
-        return char
+        return AsmListing.trans.dumpa([byte,])
+
+    # This static method converts a bytes sequence into a string of printable
+    # characters as print_hex() does for a single byte.
+    @staticmethod
+    def print_chars(byts):
+        return AsmListing.trans.dumpa(byts)
 
     addr_max={16:0xFFFF,24:0xFFFFFF,31:0x7FFFFFFF,64:0xFFFFFFFFFFFFFFFF}
     def __init__(self,asm):
@@ -85,7 +91,7 @@ class AsmListing(Listing):
         # More than one detail line may be created per assembly statement or other
         # components of the listing.  The following list is used to buffer such
         # details lines until requested by the super class.
-        self.details=[]
+        self.details=collections.deque()
 
         # Title established by create_title() method
         self.dir_title=""       # Title as supplied by TITLE assembler directive
@@ -165,7 +171,7 @@ class AsmListing(Listing):
         self.part4_hdr=False    # Do a hearder without eject
         self.image_info=None    # The Map object for the image.
         self.reg_list=[]        # Regions in image order for dumping
-        self.dumprecs=[]        # Dump object used to create dump output
+        self.dumprecs=None      # Iterator of Dump objects creating dump output
         self.barray=None
 
         # Deck information
@@ -297,40 +303,6 @@ class AsmListing(Listing):
             file_list.append(files[num])
         self.files=file_list
 
-        # Build the dump records list
-        if self.dump:
-            dlines=[]
-            for rndx in range(len(reg_list)):
-                region=reg_list[rndx]
-                regndx=rndx
-                addr=region.bound
-                pos=region.pos
-                if region.length==0:
-                    dlines.append(Dump(addr,pos,0,supbeg=32,region=regndx,empty=True))
-                    continue
-                # Region has something to actually dump
-                endaddr=region.bnd_end+1
-                while addr<endaddr:
-                    beg_bounds=32*(addr // 32)   # 32 bytes per line
-                    end_bounds=addr+32
-                    supbeg=0
-                    supend=0
-                    if beg_bounds<addr:
-                        supbeg=addr-beg_bounds
-                    bytes_left=max(endaddr-addr,0)
-                    bytes=min(bytes_left,32-supbeg)
-                    filled=supbeg+bytes
-                    if filled<32:
-                        supend=32-filled
-
-                    d=Dump(addr,pos,bytes,supbeg=supbeg,supend=supend,region=regndx)
-                    regndx=None
-                    dlines.append(d)
-                    addr+=bytes   # Increment next address
-                    pos+=bytes    # Increment the image position
-
-            self.dumprecs=dlines
-
         # Build the assembler error list
         self.sorted_errors=sorted(self.errors,key=assembler.AssemblerError.sort)
         errors=0
@@ -340,8 +312,47 @@ class AsmListing(Listing):
             errors+=1
         self.num_errors=errors
 
-    # This method acts as the interface with the super class.  
-    def create(self):
+    # This generator creates the Dump objects of the image regions as Part 4 of the
+    # listing needs them.  Dump objects are never all present at the same time.
+    def __dumps(self):
+        for rndx in range(len(self.reg_list)):
+            region=self.reg_list[rndx]
+            regndx=rndx
+            addr=region.bound
+            pos=region.pos
+            if region.length==0:
+                yield Dump(addr,pos,0,supbeg=32,region=regndx,empty=True)
+                continue
+            # Region has something to actually dump
+            endaddr=region.bnd_end+1
+            while addr<endaddr:
+                beg_bounds=32*(addr // 32)   # 32 bytes per line
+                end_bounds=addr+32
+                supbeg=0
+                supend=0
+                if beg_bounds<addr:
+                    supbeg=addr-beg_bounds
+                bytes_left=max(endaddr-addr,0)
+                bytes=min(bytes_left,32-supbeg)
+                filled=supbeg+bytes
+                if filled<32:
+                    supend=32-filled
+
+                d=Dump(addr,pos,bytes,supbeg=supbeg,supend=supend,region=regndx)
+                regndx=None
+                yield d
+                addr+=bytes   # Increment next address
+                pos+=bytes    # Increment the image position
+
+    # This method acts as the interface with the super class.
+    # Method Argument:
+    #   stream   Specify True to defer generation of the listing until it is
+    #            written.  The Image object's listing attribute is then this object
+    #            and the listing is streamed to the listing file by the
+    #            AsmOut.write_listing() method.  Otherwise the listing is generated
+    #            and the Image object's listing attribute is the listing string.
+    #            Defaults to False.
+    def create(self,stream=False):
         # Get access to the assembler data needed for creating the listing
         self.stmts=self.asm.stmts     # Make available the Stmt objects
         self.ST=self.asm.ST           # Make available the Symbol Table
@@ -370,12 +381,19 @@ class AsmListing(Listing):
                 self.prtparts.append(p)
 
         self.__build()                # Build data for listing
+        if self.dump:
+            self.dumprecs=self.__dumps()
 
         for p in self.prtparts:
             p.create()
         self.create_title()           # Create the default title
         self.new_part()               # Setup for part 1 of the listing
 
+        if stream:
+            # The listing is generated when written
+            self.image.listing=self
+            return
+
         # Generate the listing
         listing=self.generate()
         # Add it to the file Image object
@@ -1248,9 +1266,7 @@ class AsmListing(Listing):
         chrend= m.supend * " "
 
         # Translate barray integers into ASCII printable string
-        chrbytes=""
-        chrbytes=byte2str(objbyt)
-        chrbytes=assembler.CPTRANS.dumpa(chrbytes)
+        chrbytes=assembler.CPTRANS.dumpa(objbyt)
 
         # Create the character data group string
         chrs="%s%s%s" % (chrbeg,chrbytes,chrend)
@@ -1348,13 +1364,12 @@ class AsmListing(Listing):
             group=rec[ndx:ndx+10]
             hexa=""
             hexb=""
-            chrs=""
             for n in group:
                 col=hexchr[(n & 0xF0)>>4]
                 hexa="%s%s" % (hexa,col)
                 col=hexchr[n & 0x0f]
                 hexb="%s%s" % (hexb,col)
-                chrs="%s%s" % (chrs,AsmListing.print_hex(n))
+            chrs=AsmListing.print_chars(group)
             hexacol.append(hexa)
             hexbcol.append(hexb)
             chrcol.append(chrs)
@@ -1467,11 +1482,14 @@ class AsmListing(Listing):
         self.next+=1
         return stmt
 
-    # Return a Dump object.  IndexError indicates the end of the list
+    # Return a Dump object.  IndexError indicates the end of the dump
     def fetch_dump(self):
-       dump=self.dumprecs[self.next]
-       self.next+=1
-       return dump
+        try:
+            dump=next(self.dumprecs)
+        except StopIteration:
+            raise IndexError() from None
+        self.next+=1
+        return dump
 
     # Return an AssemblerError object
     def fetch_error(self):
@@ -1520,9 +1538,7 @@ class AsmListing(Listing):
     # Return a detail line from the buffer.
     # An IndexError indicates the buffer is empty
     def pop(self):
-        det=self.details[0]
-        del self.details[0]
-        return det
+        return self.details.popleft()
 
     # Provide a detail line to the buffer.
     def push(self,lines,trace=False):
@@ -68,12 +68,17 @@
 this_module="%s.py" % __name__
 
 # Python imports:
+import copyreg                # Access the default pickle dispatch table
 import datetime               # Access UTC time
 import os.path                # For file path manipulation
+import pickle                 # Access macro definition serialization
 import re                     # Access regular expressions
+import sys                    # Access the Python version
 
 # SATK imports:
 from satkutil import method_name       # Access the method names in method objects
+import satkutil               # Access the persistent cache files
+import lexer                  # Access the serializable match object
 import pratt3                 # Access a number of expression evaluator objects
 
 # ASMA imports:
@@ -244,7 +249,7 @@ class Macro(object):
         self.name=prototype.macid  # Macro Name
         self.prototype=prototype   # Prototype object
         self.case=case             # Specifies if case sensitivity is enabled
-        self.engine=MacroEngine(self.name) # My definition in terms of MacroOp objects
+        self.engine=MacroEngine(self.name,case) # Definition as MacroOp objects
         self._defined=defn         # source statement number where definition occurs
         self._refs=[]              # source statements referencing this macro
         # XREF object for my references
@@ -524,14 +529,33 @@ class Built_In(Macro):
 # interface used by both user defined macros and built-in macros for defining
 # the engines functionality.
 class MacroEngine(object):
-    def __init__(self,name):
+    def __init__(self,name,case):
         # These attributes are built during macro definition by calls to the
         # define() method.
         self.name=name   # Name of the macro using this engine
+        self.case=case   # Specifies if case sensitivity is enabled
         self.ops=[]      # List of macro operations defining the macro's functions
         self.seq={}      # Dictionary of sequence symbols used to control flow
         self.syslist=False  # Whether to build &SYSLIST when invoked.
         self.done=False  # Set to True when Mend object added
+        self.compiled=False  # Set to True when the operations have been compiled
+        # Local symbol frame slot index by symbol name.  See the symid() method
+        self.slots={}
+
+    # Compiled expressions are not pickled (see the pratt3.PExpr.__getstate__()
+    # method).  A restored engine compiles its operations when first run.
+    def __getstate__(self):
+        state=self.__dict__.copy()
+        state["compiled"]=False
+        return state
+
+    # This method compiles the expressions of each operation once the macro's
+    # definition is complete.  Each invocation of the macro then evaluates the
+    # compiled expressions.
+    def __compile(self):
+        for op in self.ops:
+            op.compile(self)
+        self.compiled=True
 
     # This method drives the resolution of operation's sequence symbol usage.
     def __resolve(self):
@@ -584,6 +608,39 @@ class MacroEngine(object):
         op.location(next_loc)
         self.ops.append(op)
 
+        if self.done:
+            self.__compile()
+
+    # Returns the slots dictionary of the local symbols referenced by the macro's
+    # operations, compiling the operations if needed.  Used to create the local
+    # symbol frame of an invocation.  See the Mac_Symbols class.
+    def locals(self):
+        if not self.compiled:
+            self.__compile()
+        return self.slots
+
+    # Returns the local symbol frame slot index of a symbol, assigning the next
+    # available slot to a symbol name not previously encountered.
+    # Method Argument:
+    #   name    the symbol's name as used by the Mac_Symbols object
+    def slot(self,name):
+        try:
+            return self.slots[name]
+        except KeyError:
+            slot=self.slots[name]=len(self.slots)
+            return slot
+
+    # Returns a macsyms.SymbolID object carrying the symbol's local frame slot.
+    # Used while compiling the macro's operations.
+    # Method Arguments:
+    #   name     the symbolic variable name referenced by the operation
+    #   indices  the list of subscript values.  Defaults to an empty list.
+    def symid(self,name,indices=[]):
+        if not self.case:
+            name=name.upper()
+        return macsyms.SymbolID(name,indices=indices,slot=self.slot(name),\
+            slots=self.slots)
+
     # Converts an macro operation index into its relevant statement
     # Method Argument:
     #   n   macro operation index value
@@ -762,6 +819,13 @@ class MacroOp(object):
     def post_resolve(self):
         pass
 
+    # Compiles the operation's expressions when the macro definition is complete.
+    # For operations without expressions, this method does nothing.
+    # Method Argument:
+    #   engine   the MacroEngine object of the macro being compiled
+    def compile(self,engine):
+        pass
+
   #
   # Macro Operation Execution Helper Methods
   #
@@ -833,6 +897,10 @@ class ACTR(MacroOp):
     def __init__(self,lineno,expr):
         super().__init__(lineno)
         self.expr=expr        # Computed ACTR arithmetic expression
+
+    def compile(self,engine):
+        self.expr.compile(engine)
+
     def operation(self,state,debug=False):
         value=self.evaluate_expr(state,self.expr,debug=debug,trace=False)
 
@@ -875,6 +943,9 @@ class AGOC(MacroOp):
         super().__init__(lineno,dest=dest)
         self.expr=expr        # Computed AGO arithmetic expression
 
+    def compile(self,engine):
+        self.expr.compile(engine)
+
     def operation(self,state,debug=False):
         #value=self.evaluate(state,self.expr,Macro.Arith,debug=debug,trace=False)
         value=self.evaluate_expr(state,self.expr,debug=debug,trace=False)
@@ -910,6 +981,9 @@ class AIF(MacroOp):
         super().__init__(lineno,dest=dest)
         self.expr=expr        # AIF logical expression
 
+    def compile(self,engine):
+        self.expr.compile(engine)
+
     def operation(self,state,debug=False):
         state.exp.mhelp_04()   # Dump variable symbols if requested
 
@@ -1071,6 +1145,9 @@ class Model(MacroOp):
         self.model=model
         super().__init__(lineno)
 
+    def compile(self,engine):
+        self.model.compile(engine)
+
     def operation(self,state,debug=False):
         
         #self.model.replace(state.exp)  # Perform any symbolic replacements
@@ -1090,6 +1167,25 @@ class Model(MacroOp):
 class SETx(MacroOp):
     def __init__(self,lineno):
         super().__init__(lineno)
+        # SymbolID of an unsubscripted symbol being set (see the compile() method)
+        self.symid=None
+        # Local symbol frame slot of a subscripted symbol being set
+        self.slot=None
+        self.slots=None
+
+    # Compiles the operand expressions and the subscript expression.  The
+    # SymbolID of an unsubscripted symbol is created once, here.
+    def compile(self,engine):
+        setsym=self.setsym
+        if setsym.hasSubscript():
+            setsym[0].compile(engine)
+            symid=engine.symid(setsym.symname)
+            self.slot=symid.slot
+            self.slots=symid.slots
+        else:
+            self.symid=engine.symid(setsym.symname)
+        for expr in self.expr:
+            expr.compile(engine)
 
     # Shared process identifies symbol being set, and, for subscripted set symbols
     # drives the updating of successive symbols from each operand in the statement
@@ -1110,7 +1206,7 @@ class SETx(MacroOp):
                     print("%s set_val: %s" \
                         % (assembler.eloc(self,"process",module=this_module),\
                             set_val))
-            symid=macsyms.SymbolID(setname)
+            symid=self.symid or macsyms.SymbolID(setname)
             self.setx(state,symid,set_val,0,debug=debug)
             return
 
@@ -1127,7 +1223,8 @@ class SETx(MacroOp):
                 set_val=expr.evaluate(external=exp,debug=debug)
             except assembler.LabelError as le:
                 raise MacroError(invoke=True,msg=le.msg) from None
-            symid=macsyms.SymbolID(setname,indices=[ndx,])
+            symid=macsyms.SymbolID(setname,indices=[ndx,],slot=self.slot,\
+                slots=self.slots)
             # Let the subclass set the value
             self.setx(state,symid,set_val,n,debug=debug)
             ndx+=1   # Bump the subscript to the next index
@@ -1362,31 +1459,29 @@ class Invoker(object):
 
     # Initialize the macro's local variable symbols
     def __init_lcls(self):
-        l=Mac_Symbols(self.case,unique=True)
+        l=Mac_Symbols(self.case,unique=True,slots=self.engine.locals())
 
         # Make system global variables available to local macro.  Each of these are
-        # read only.
-        gbl=self.gbls
-        for sys in Invoker.gblc:
-            s=gbl._fetch(sys)
-            l._put(sys,s)
+        # read only.  Each is bound to the local symbols when first referenced.
+        l.share(self.gbls,Invoker.gblc)
 
+        # The system variable symbols are created when first referenced by the macro.
         # Macro expansion UTC time: YYYY-MM-DD HH:MM:SS.mmmmmm
         time=datetime.datetime.now(datetime.timezone.utc)
         tim="%04d-%02d-%02d %02d:%02d:%02d.%06d" % (time.year,time.month,time.day,\
             time.hour,time.minute,time.second,time.microsecond)
-        l._initc("&SYSCLOCK",tim)    # UTC date and time to microseconds
-        l._initc("&SYSECT",self.asm._sysect(),ro=True)
+        l._defer(l._initc,"&SYSCLOCK",tim,ro=False)  # UTC date and time to usecs
+        l._defer(l._initc,"&SYSECT",self.asm._sysect())
 
         # Note: update &SYSLOC when full location counter support is available
         # For now the location counter and the section name are the same.
-        l._initc("&SYSLOC",self.asm._sysect(),ro=True)
+        l._defer(l._initc,"&SYSLOC",self.asm._sysect())
 
-        l._initc("&SYSMAC",self.macro.name,ro=True)
+        l._defer(l._initc,"&SYSMAC",self.macro.name)
 
         self.sysndx=self.mgr.getSysNdx()
-        l._initc("&SYSNDX",self.sysndx,ro=True)
-        l._inita("&SYSNEST",self.mgr.nesting()+1,ro=True)
+        l._defer(l._initc,"&SYSNDX",self.sysndx)
+        l._defer(l._inita,"&SYSNEST",self.mgr.nesting()+1)
 
         # Establish ASMA specific system variable symbols
         # These allow a macro to interrogate the current XMODE settings for
@@ -1395,13 +1490,13 @@ class Invoker(object):
             ccw=self.asm.OMF.getXMODE("CCW")
         except KeyError:
             ccw=""
-        l._initc("&SYSCCW",ccw,ro=True)
+        l._defer(l._initc,"&SYSCCW",ccw)
 
         try:
             psw=self.asm.OMF.getXMODE("PSW")
         except KeyError:
             psw=""
-        l._initc("&SYSPSW",psw,ro=True)
+        l._defer(l._initc,"&SYSPSW",psw)
 
         return l
 
@@ -1482,6 +1577,9 @@ class Invoker(object):
         self.mhelp_01()                     # Trace macro entry if requested
         self.mhelp_10()                     # Dump parameters if requested
         self.state=self.engine.start(self)  # Start the macro engine
+        prof=assembler.Stats.profiler
+        if prof is not None:
+            prof.invoke(self.macro.name)    # Count the invocation when profiling
 
     # Creates a MacroError object from one supplied, adding macro specific
     # information to the error and reflecting the invoking statement as the error's
@@ -1503,8 +1601,12 @@ class Invoker(object):
     #     None to indicate the macro expansion has terminated.
     def generate(self):
         state=self.state
+        prof=assembler.Stats.profiler
         while True:
-            state=self.engine.run(state)
+            if prof is None:
+                state=self.engine.run(state)
+            else:
+                state=prof.engine(self.macro.name,self.engine,state)
             if state.isDone():
                 break
             # Macro is not done, so just return the model statement
@@ -1640,6 +1742,8 @@ class MacroBuilder(object):
         self.indefn=None
         # Switch to debug a macro definition.
         self.ddebug=False   # Set by define() method from MACRO assembler directive.
+        # Macro objects added by this instance.  Emptied by the user as needed.
+        self.built=[]
 
     # Add a defined macro to the operation management framework
     # Change state if triggered by an MEND directive
@@ -1649,6 +1753,7 @@ class MacroBuilder(object):
                 % (assembler.eloc(self,"addMacro",module=this_module),mac)
 
         self.asm.OMF.def_macro(mac,O=self.O_source)    # Add the macro the OMF
+        self.built.append(mac)
         if mend:
             self.flush()
 
@@ -1774,6 +1879,112 @@ class MacroBuilder(object):
         self.state=0                 # Change state to reflect this
 
 
+# This object manages a directory of macro library definitions saved by previous
+# assemblies.  Each MACLIB file's Macro objects are pickled following their
+# definition.  A later assembly loads the ready Macro objects, with their
+# MacroEngine, instead of reading the file and building the macros again.
+#
+# A cache file is used only when the MACLIB file's content is that recorded and
+# the assembler's case sensitivity and CZAM options are those of the saving
+# assembly.  A MACLIB file whose modification time differs but whose content is the
+# same is unchanged.  The satkutil.CacheFile object reads and writes the cache
+# files, rejecting those created by a different version of the modules defining
+# the Macro objects.  Any other cache file is simply replaced.
+#
+# Macro objects refer to the assembler.Assembler object that defined them.  The
+# reference is saved symbolically and restored to the loading assembler.
+#
+# Instance Arguments:
+#   directory  The cache directory path.  Created when the first file is saved.
+#   asm        The global assembler.Assembler object
+class MacroCache(object):
+    ext="macc"      # Cache file extension
+    # Modules defining the classes of the pickled Macro objects
+    modules=["asmbase","asminput","asmline","asmmacs","asmstmts","asmtokens",\
+             "lexer","macopnd","macsyms","model","pratt3"]
+
+    # Pickler of macro definitions
+    class Pickler(pickle.Pickler):
+        def __init__(self,fo,asm):
+            super().__init__(fo,protocol=pickle.HIGHEST_PROTOCOL)
+            self.asm=asm
+            self.dispatch_table=copyreg.dispatch_table.copy()
+            self.dispatch_table[re.Match]=lexer.MatchState.reduce
+
+        def persistent_id(self,obj):
+            if obj is self.asm:
+                return "asm"
+            return None
+
+    # Unpickler of macro definitions
+    class Unpickler(pickle.Unpickler):
+        def __init__(self,fo,asm):
+            super().__init__(fo)
+            self.asm=asm
+
+        def persistent_load(self,pid):
+            if pid=="asm":
+                return self.asm
+            raise pickle.UnpicklingError("unsupported persistent object: %s" % pid)
+
+    def __init__(self,directory,asm):
+        self.directory=directory
+        self.asm=asm
+        # Cache file reader and writer of the code creating Macro objects
+        self.files=satkutil.CacheFile(\
+            [sys.modules[name] for name in MacroCache.modules])
+
+        # Statistics of cache usage, reported by the --stats option
+        self.stats=assembler.Stats.cache("macro definition")
+
+    # Returns the cache file path for a MACLIB file
+    def cache_file(self,filepath):
+        digest=self.files.key(filepath,self.asm.case,self.asm.czam)
+        base=os.path.splitext(os.path.basename(filepath))[0]
+        return os.path.join(self.directory,"%s-%s.%s" % (base,digest,MacroCache.ext))
+
+    # Returns the header items identifying the MACLIB file and assembler options
+    def header(self,filepath):
+        return {"path":filepath,"case":self.asm.case,"czam":self.asm.czam}
+
+    # Load the macros defined by a MACLIB file
+    # Returns:
+    #   a list of Macro objects if the cache file is valid for the MACLIB file
+    #   None if the cache file is missing, stale or unreadable
+    def load(self,filepath):
+        macros=self.files.load(self.cache_file(filepath),self.header(filepath),\
+            valid=MacroCache.unchanged,loader=self.unpickle)
+        if macros is None:
+            self.stats.misses+=1
+            return None
+        self.stats.hits+=1
+        return macros
+
+    # Save the macros defined by a MACLIB file.  Failure to write the cache is not
+    # an error.
+    def save(self,filepath,macros):
+        try:
+            source=satkutil.CacheFile.source(filepath)
+        except OSError:
+            return
+        header=self.header(filepath)
+        header["source"]=source
+        self.files.save(self.cache_file(filepath),header,macros,dumper=self.pickle)
+
+    # Writes the Macro objects to an open cache file
+    def pickle(self,fo,macros):
+        MacroCache.Pickler(fo,self.asm).dump(macros)
+
+    # Returns the Macro objects read from an open cache file
+    def unpickle(self,fo):
+        return MacroCache.Unpickler(fo,self.asm).load()
+
+    # Returns whether the MACLIB file of a cache file header is unchanged
+    @staticmethod
+    def unchanged(header):
+        return satkutil.CacheFile.unchanged(header["path"],*header["source"])
+
+
 class MacroLanguage(object):
     def __init__(self,asm):
         self.asm=asm           # The assembler
@@ -1976,8 +2187,8 @@ class MacroLanguage(object):
             sysndx="%s" % sysndx
         return sysndx
 
-    # Start the invocation of a macro. Process a Stmt object that is a macro statement.  This method kicks off
-    # a macro expansion.
+    # Start the invocation of a macro. Process a Stmt object that is a macro
+    # statement.  This method kicks off a macro expansion.
     # Returns:
     #   the Invoker object for the statement
     #   None if MHELP &SYSNDX value has been reached
@@ -2069,24 +2280,76 @@ class MacroLanguage(object):
 #  +------------------------+
 #
 
-# Class for managing symbols.
-# Instance arguments:
-#   unique    Specify True if all variables must be unique when defined.
-#             Specify False if previously defined variables are allowed.
-#             Default is False.
-#             Note: Global variables are not required to be unique when defined.
-#                   Local variables and macro context variables must be unique
-#                   Unique=True may be forced by the defa(), defb() or defc() methods.
-#   gbl       Specifies a symbol's global attribute of True or False
-#   case      Enables case sensitivity for macro symbols if True.  Defaults to False
+# Class for managing symbols.  This class manages a dictionary of variable
+# symbols: the global symbols or the local symbols of a single macro invocation.
+#
+# The local symbols of an invocation may also be accessed by slot.  The
+# MacroEngine of the invoked macro assigns each local symbol name it references a
+# slot index when the macro definition is compiled.  The symbols are then also
+# held in a list, the frame, at their slot index.  A reference whose SymbolID
+# carries a slot from the same slots dictionary locates its symbol in the frame
+# without a dictionary lookup.
+#
+# Shared global symbols, for example, &SYSDATE, are not copied into the local
+# symbols when the invocation starts.  Each is bound by reference to the local
+# symbols when first used.
+#
+# Instance Arguments:
+#   case     Enables case sensitivity for macro symbols if True.
+#   unique   Specify True if all variables must be unique when defined.
+#            Specify False if previously defined variables are allowed.
+#            Default is False.
+#            Note: Global variables are not required to be unique when defined.
+#                  Local variables and macro context variables must be unique.
+#                  Unique=True may be forced by the defa(), defb() or defc()
+#                  methods.
+#   gbl      Specifies a symbol's global attribute of True or False.  Defaults to
+#            False.
+#   slots    The MacroEngine slots dictionary of the local symbols.  Defaults to
+#            None, indicating the symbols are not accessed by slot.
+#
 # Note: This class is heavily dependent upon module macsyms.
 class Mac_Symbols(object):
-    def __init__(self,case,unique=False,gbl=False):
+    def __init__(self,case,unique=False,gbl=False,slots=None):
         self.syms={}        # Dictionary of variable symbols
         self.unique=unique  # Only new unique symbols may be defined
         self.gbl=gbl        # Sets a symbol's gbl attribute
         self.case=case      # Enables case sensitivity for macro symbols
 
+        # Local symbol frame accessed by slot index
+        self.slots=slots
+        if slots is None:
+            self.frame=None
+        else:
+            self.frame=[None]*len(slots)
+
+        # Global symbols bound by reference when first used. See share() method
+        self.gbls=None
+        self.shared=[]
+
+        # System variable symbols created when first used.  See _defer() method
+        self.deferred={}
+
+    # Locates a symbol by name, creating a deferred system variable symbol or
+    # binding a shared global symbol if not yet done.
+    # Exceptions:
+    #   KeyError if the symbol is not defined
+    def __lookup(self,name):
+        try:
+            return self.syms[name]
+        except KeyError:
+            pass
+        try:
+            init,symbol,value,ro=self.deferred.pop(name)
+        except KeyError:
+            if name not in self.shared:
+                raise KeyError(name) from None
+            s=self.gbls._fetch(name)
+            self._put(name,s)
+            return s
+        init(symbol,value,ro=ro)
+        return self.syms[name]
+
     # Defines a symbol variable
     # Method Arguments:
     #   symbol    A SymbolID object defining the variable and its subscripts
@@ -2105,7 +2368,7 @@ class Mac_Symbols(object):
 
         name=symbol.var
         try:
-            s=self.syms[name]
+            s=self.__lookup(name)
             if self.unique or unique:
                 raise MacroError(msg="symbol already defined: '%s'" % name)
         except KeyError:
@@ -2113,7 +2376,7 @@ class Mac_Symbols(object):
             s.gbl=self.gbl     # Set symbol's gbl attribute
             s.parm=parm        # Identify if symbol is a macro parameter
             s.ro=ro            # Set the symbol's read-only status
-            self.syms[name]=s
+            self._put(name,s)
         return s
 
     def _add(self,sym,n=None,pos=None,unique=False):
@@ -2138,7 +2401,7 @@ class Mac_Symbols(object):
     # Exceptions:
     #   KeyError if symbol variable not defined
     def _fetch(self,sym):
-        return self.syms[sym]
+        return self.__lookup(sym)
 
     # These three methods create and initialize a variable symbol.
     #   _inita    establishes an arithmetic variable
@@ -2174,13 +2437,44 @@ class Mac_Symbols(object):
         s=self.defc(i,parm=parm,unique=unique,ro=ro)
         s.setValue(i,macsyms.C_Val(value),user=False)
 
-    # Returns the items() iterator for the symbol dictionary
+    # Defers the creation of a system variable symbol until it is first used.  Most
+    # macros reference few, if any, of the system variable symbols.
+    # Method Arguments:
+    #   init     the _inita, _initb or _initc method creating the symbol
+    #   symbol   System variable symbol name as a string with initial '&'
+    #   value    Value being assigned the system variable symbol
+    #   ro       If True, the symbol will be flagged as read-only.  Default is True
+    def _defer(self,init,symbol,value,ro=True):
+        if not self.case:
+            name=symbol.upper()
+        else:
+            name=symbol
+        self.deferred[name]=(init,symbol,value,ro)
+
+    # Makes global symbols available to the local symbols.  Each global symbol is
+    # bound to the local symbols when first used.
+    # Method Arguments:
+    #   gbls    the Mac_Symbols object of the global symbols
+    #   names   the list of shared global symbol names
+    def share(self,gbls,names):
+        self.gbls=gbls
+        self.shared=names
+
+    # Returns the items() iterator for the symbol dictionary, including all of the
+    # deferred system variable symbols and shared global symbols
     def _items(self):
+        for name in list(self.deferred.keys())+self.shared:
+            if name not in self.syms:
+                self.__lookup(name)
         return self.syms.items()
 
     # This is a low-level function for direct setting of a symbol's xSym object
     def _put(self,name,sym):
         self.syms[name]=sym
+        if self.frame is not None:
+            slot=self.slots.get(name)
+            if slot is not None:
+                self.frame[slot]=sym
 
     # References a symbolic variable value defined by a SymbolID object
     # Method Arguments:
@@ -2230,9 +2524,18 @@ class Mac_Symbols(object):
         assert self.case or symbol.var == symbol.var.upper(),\
             "symbol not case insensitive: %s" % symbol
 
-        try:
-            mac_sym=self.syms[symbol.var]   # Locate its MacroSymbol object
-        except KeyError:
+        # Locate its MacroSymbol object in the frame when its slot is known
+        frame=self.frame
+        if frame is not None and symbol.slots is self.slots:
+            mac_sym=frame[symbol.slot]
+        else:
+            mac_sym=None
+        if mac_sym is None:
+            try:
+                mac_sym=self.__lookup(symbol.var)
+            except KeyError:
+                mac_sym=None
+        if mac_sym is None:
             if implicit is None:
                 raise MacroError(invoke=True,msg="undefined symbol: '%s'" \
                     % symbol.var) from None
@@ -2268,7 +2571,7 @@ class Mac_Symbols(object):
             "symbol not case insensitive: %s" % symbol
 
         try:
-            mac_sym=self.syms[symbol.var]   # Locate its MacroSymbol object
+            mac_sym=self.__lookup(symbol.var)   # Locate its MacroSymbol object
         except KeyError:
              # We return None so that the T' attribute 'U' can be returned rather
              # than generating an error via an exception.
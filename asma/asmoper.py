@@ -111,6 +111,8 @@ class MSLentry(object):
 #   machine The MSL cpu definition being requested from the MSL file
 #   msl     The MSL filename requested
 #   mslpath PathMgr object of the MSL database
+#   mslcache Directory of the persistent expanded CPU cache or None to always
+#           build the CPU definition from the MSL database source.
 #   debug   Specify True to enable debugging of the file access operations
 class OperMgr(asmbase.ASMOperTable):
     # XMODE values accepted
@@ -128,7 +130,44 @@ class OperMgr(asmbase.ASMOperTable):
                "ZS":"PSWZS","PSWZS":"PSWZS",
                "none":None,"NONE":None}
 
-    def __init__(self,asm,machine,msl,mslpath,debug=False):
+    # Expanded CPU definitions shared by all assemblies of this process and of
+    # processes forked from it.  See the share_machine() static method.
+    shared={}
+
+    # Returns the expanded CPU, a CPUX object, from the MSL database
+    # Method arguments are those of the instance arguments.
+    @staticmethod
+    def expand(machine,mslfile,mslpath,mslcache=None,debug=False):
+        if mslcache:
+            # Use the expanded cpu from the persistent cache when still valid
+            cpuxcache=msldb.CPUXCache(mslcache,mslpath,\
+                stats=assembler.Stats.cache("expanded CPU"))
+            return cpuxcache.cpux(mslfile,machine,debug=debug)
+        mslproc=msldb.MSL(default=None,pathmgr=mslpath,debug=debug)
+        mslproc.build(mslfile,fail=True)
+        return mslproc.expand(machine)  # Return the expanded version of cpu
+
+    # Returns the key of a shared expanded CPU definition
+    @staticmethod
+    def shared_key(machine,mslfile,mslpath):
+        try:
+            dirs=tuple(mslpath.paths["MSLPATH"].dir_list)
+        except (AttributeError,KeyError):
+            dirs=()
+        return (mslfile,machine,dirs)
+
+    # Expand a CPU definition once for use by all following assemblies of this
+    # process.  A driver of multiple assemblies calls this method before the
+    # assemblies are started.
+    # Method arguments are those of the instance arguments.
+    @staticmethod
+    def share_machine(machine,mslfile,mslpath,mslcache=None,debug=False):
+        key=OperMgr.shared_key(machine,mslfile,mslpath)
+        if key not in OperMgr.shared:
+            OperMgr.shared[key]=OperMgr.expand(machine,mslfile,mslpath,\
+                mslcache=mslcache,debug=debug)
+
+    def __init__(self,asm,machine,msl,mslpath,mslcache=None,debug=False):
         super().__init__()
         self.asm=asm         # The Assembler object
         # Legacy AsmPasses objects for assembler directives
@@ -138,7 +177,8 @@ class OperMgr(asmbase.ASMOperTable):
         self.addrsize=None   # Maximum address size supported by the CPU
         self.ccw=None        # Expected CCw format used by the CPU
         self.psw=None        # Expected PSW format used by the CP
-        self.cache=self.__getMachine(machine,msl,mslpath=mslpath,debug=debug)
+        self.cache=self.__getMachine(machine,msl,mslpath=mslpath,\
+            mslcache=mslcache,debug=debug)
 
         # Manage Directive Statements
         self.def_adirs()     # Define Assembler directives
@@ -158,10 +198,12 @@ class OperMgr(asmbase.ASMOperTable):
 
     # Create the MSL cache and supplies maximum address size for listing
     # Method arguments are passed from the instance arguments.
-    def __getMachine(self,machine,mslfile,mslpath,debug=False):
-        mslproc=msldb.MSL(default=None,pathmgr=mslpath,debug=debug)
-        mslproc.build(mslfile,fail=True)
-        cpux=mslproc.expand(machine)  # Return the expanded version of cpu
+    def __getMachine(self,machine,mslfile,mslpath,mslcache=None,debug=False):
+        try:
+            cpux=OperMgr.shared[OperMgr.shared_key(machine,mslfile,mslpath)]
+        except KeyError:
+            cpux=OperMgr.expand(machine,mslfile,mslpath,mslcache=mslcache,\
+                debug=debug)
         self.addrsize=cpux.addrmax    # Set the maximum address size for CPU
         self.ccw=cpux.ccw             # Set the expected CCW format of the CPU
         self.psw=cpux.psw             # Set the expected PSW format of the CPU
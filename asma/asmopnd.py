@@ -58,7 +58,8 @@ this_module="asmopnd.py"
 #   - machine instructions
 #   - template based assembler directives (CCW's, PSW's, EQU and others)
 
-# Python imports: none
+# Python imports:
+import collections          # Access the ordered dictionary of the operand cache
 # SATK imports:
 import lexer                # Access the lexical analyzer
 import fsmparser            # Access the finite state machine based parser
@@ -154,6 +155,7 @@ class OperandParser(asmbase.AsmFSMParser):
     def __init__(self,dm,pm,trace=False):
         super().__init__(dm,pm,trace=False)
         self.asm=pm.asm      # The global assembler.Assembler object
+        self.cache=OperandCache()  # Results of previously parsed operands
 
     # Define operand parser states and action methods.
     #
@@ -319,6 +321,15 @@ class OperandParser(asmbase.AsmFSMParser):
     # Exception:
     #   AsmParserError if operand fails to be recognized
     def parse_operand(self,stmt,opnd,n,debug=False):
+        # The case sensitivity of the assembly is the only assembler state that
+        # influences the result of the parse.
+        key=(opnd.text,self.asm.case)
+        if not debug:
+            # When debugging, the parse is always performed so it may be seen
+            result=self.cache.fetch(key,stmt,opnd)
+            if result is not None:
+                return result
+
         if __debug__:
             if debug:
                 print('%s [%s] parsing opnd %s: "%s"' \
@@ -332,9 +343,10 @@ class OperandParser(asmbase.AsmFSMParser):
                 print("%s [%s] opnd %s: scope: %s" \
                     % (assembler.eloc(self,"parse_operand",module=this_module),\
                         stmt.lineno,n,scope))
-        opnd=scope.result()
-        if isinstance(opnd,asmbase.ASMOperand):
-            return opnd
+        result=scope.result()
+        if isinstance(result,asmbase.ASMOperand):
+            self.cache.add(key,scope.template)
+            return result
 
         raise ValueError("%s operand %s not returned from parse: %s" \
             % (assembler.eloc(self,"parse_operands",module=this_module),\
@@ -707,6 +719,12 @@ class OperandScope(asmbase.AsmFSMScope):
         self.lopnd=lopnd       # LOperand source object
         self.opnd=None         # ASMOperand result object
 
+        # The lexical tokens of each expression and their positions within the
+        # operand before being updated with the statement's locations.  Each entry
+        # is a list of tuples: (token,index).  An omitted secondary expression has
+        # an empty list.  See the OperandCache class.
+        self.template=[]
+
         # Whether the primary expression is being parsed (True) or a secondary
         # expression is being parsed (False).
         self.primary=True  # Initially the primary expression is being parsed
@@ -725,6 +743,7 @@ class OperandScope(asmbase.AsmFSMScope):
     # operand.
     def expression_end(self):
         #print(assembler.eloc(self,"expression_end",module=this_module))
+        self.template.append([(tok,tok.linepos) for tok in self._lextoks])
         if self.primary:
             expr=self.expr_end(source=self.lopnd,line=self._stmt.lineno)
             self.opnd.primary(asmbase.ASMExprArith(expr))
@@ -750,5 +769,120 @@ class OperandScope(asmbase.AsmFSMScope):
         #print("Operand Scope.opnd: %s" % self.opnd)
         return self.opnd
 
+# This class is a bounded least recently used cache of parsed operands.  Macros
+# frequently generate statements with the same operands.  A cached operand avoids
+# both the lexical analysis and the finite-state machine parse of the operand.
+#
+# The ASMOperand object and its expressions are specific to the statement in which
+# the operand occurs and are updated by later processing.  So the cache retains
+# the lexical tokens of each expression along with each token's position within
+# the operand text.  A cache hit creates a new ASMOperand object from copies of the
+# cached tokens, updated with the new statement's locations and current location
+# counter.  The result is the same as that created by the parse.
+#
+# Hits and misses are reported by the assembler.AsmStats object as the
+# 'operand parse' cache.
+#
+# Instance Argument:
+#   size   The maximum number of cached operands.  Defaults to OperandCache.size
+class OperandCache(object):
+    size=1024      # Default maximum number of cached operands
+    slots={}       # Slot names of each lexical token class by class
+
+    # Returns a shallow copy of a lexical token.  copy.copy() is avoided because
+    # of its overhead with objects using __slots__.
+    @staticmethod
+    def copy(tok):
+        cls=tok.__class__
+        try:
+            names=OperandCache.slots[cls]
+        except KeyError:
+            names=OperandCache.slots[cls]=OperandCache.slotnames(cls)
+        new=cls.__new__(cls)
+        for name in names:
+            try:
+                setattr(new,name,getattr(tok,name))
+            except AttributeError:
+                # Slot never set in the cached token
+                pass
+        try:
+            new.__dict__.update(tok.__dict__)
+        except AttributeError:
+            # Token class has no instance dictionary
+            pass
+        return new
+
+    # Returns the list of slot names defined by a class and its base classes.
+    # Private slot names are returned in their mangled form.
+    @staticmethod
+    def slotnames(cls):
+        names=[]
+        for c in cls.__mro__:
+            slots=c.__dict__.get("__slots__",())
+            if isinstance(slots,str):
+                slots=(slots,)
+            for name in slots:
+                if name in ("__dict__","__weakref__"):
+                    continue
+                if name.startswith("__") and not name.endswith("__"):
+                    name="_%s%s" % (c.__name__.lstrip("_"),name)
+                names.append(name)
+        return names
+
+    def __init__(self,size=None):
+        if size is None:
+            self.size=OperandCache.size
+        else:
+            self.size=size
+        # Cached operand templates in least to most recently used sequence
+        self.entries=collections.OrderedDict()
+        self.stats=assembler.Stats.cache("operand parse")
+
+    # Adds a parsed operand to the cache, discarding the least recently used
+    # operand when the cache is full.
+    # Method Arguments:
+    #   key        The operand's cache key
+    #   template   The OperandScope.template list of the operand's parse
+    def add(self,key,template):
+        entries=self.entries
+        entries[key]=template
+        if len(entries)>self.size:
+            entries.popitem(last=False)
+
+    # Returns a new asmbase.ASMOperand object for a previously parsed operand or
+    # None if the operand is not cached.
+    # Method Arguments:
+    #   key     The operand's cache key
+    #   stmt    The asmstmts.ASMStmt object whose operand is being parsed
+    #   lopnd   The asmline.LOperand object of the operand
+    def fetch(self,key,stmt,lopnd):
+        try:
+            template=self.entries[key]
+        except KeyError:
+            self.stats.misses+=1
+            return None
+        self.entries.move_to_end(key)
+        self.stats.hits+=1
+
+        lineno=stmt.lineno
+        opnd=asmbase.ASMOperand()
+        for n,toks in enumerate(template):
+            expr=[]
+            for tok,ndx in toks:
+                tok=OperandCache.copy(tok)
+                tok.update_loc(lineno,lopnd.ndx2loc(ndx))
+                if isinstance(tok,asmtokens.AOperToken) and tok.iscur:
+                    # The current location counter is that of the new statement
+                    tok.current(stmt)
+                expr.append(tok)
+            if n==0:
+                opnd.primary(asmbase.ASMExprArith(expr))
+            elif expr:
+                opnd.secondary(asmbase.ASMExprArith(expr))
+            else:
+                opnd.secondary(None)
+        return opnd
+
+
 if __name__ == "__main__":
     raise NotImplementedError("%s - intended for import use only" % this_module)
\ No newline at end of file
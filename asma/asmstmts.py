@@ -2545,11 +2545,12 @@ class DC(ASMStmt):
 
             # Note: both asmfsmcs.DCDS_Operand and asmdcds.Nominal support the
             # align() and length() methods so that they can both be the basis
-            # of binary object.
+            # of binary object.  A duplicated group of nominal values occupies
+            # more than its length.
             if isinstance(value,asmdcds.DCDS_Operand):
                 bin=assembler.Binary(value.align(),0)
             else:
-                bin=assembler.Binary(value.align(),value.length())
+                bin=assembler.Binary(value.align(),value.size())
             cur_sec.assign(bin)
 
             if __debug__:
@@ -2800,6 +2801,10 @@ class DS(DC):
                     % (assembler.eloc(self,"Pass2",module=this_module),\
                         self.lineno,self.content))
 
+        # Uninitialized storage replaces any previous content in the image
+        for bin in self.content.elements:
+            bin.clear()
+
         asm.cur_loc.establish(self.content.loc,debug=dtrace)
 
 
@@ -122,6 +122,11 @@ class PLitCTerm(pratt3.PLit):
     def __init__(self,src):
         super().__init__(src=src)
 
+    # Compiles the expressions used by the complex term.  See the
+    # asmbase.ASMExpr.compile() method.  By default there are none.
+    def compile(self,engine):
+        pass
+
     def value(self,external=None,debug=False,trace=False):
         raise NotImplementedError("%s subclass %s must supply value() method" \
             % (assembler.eloc(self,"value",module=this_module),\
@@ -575,12 +580,50 @@ class CharacterEval(object):
     def __init__(self):
         self.pend=pratt3.PEnd()
 
+    # Adds a pratt token's value to a character expression's result
+    # Returns:
+    #   the new result string
+    def concat(self,res,token,value):
+        if isinstance(value,str):
+            return res+value
+        elif isinstance(value,macsyms.Mac_Val):
+            return res+value.string()
+        elif isinstance(value,int):
+            return "%s%s" % (res,value)
+        raise ValueError("%s unexpected result from pratt token %s: %s"\
+            % (assembler.eloc(self,"concat",module=this_module),\
+                token,value))
+
+    # Compiles a character expression.  See the pratt3.PParser.compile() method.
+    # Returns:
+    #   a function of the external helper object returning the Python string of
+    #   the resulting character expression
+    def compile(self,expr):
+        expr._init(self)
+        toks=expr.toks
+        values=[(token,token.value) for token in toks]
+        concat=self.concat
+
+        def run(external):
+            res=""
+            for token,value in values:
+                try:
+                    res=concat(res,token,value(external=external))
+                except pratt3.PEvaluationError as ee:
+                    raise pratt3.PParserError(ptok=token,msg=ee.msg) from None
+            return res
+
+        return run
+
     # Evaluate a character expression:
     # Returns:
     #   a Python string of the resulting character expression
     # Exceptions:
     #   PParserError if a token evaluation fails.
     def run(self,expr,external=None,debug=False,trace=False,_test=False):
+        if expr.compiled is not None and not (debug or trace):
+            return expr.compiled(external)
+
         ctx=pratt3.PCtx(self,expr,external=external,emu=True,debug=debug)
         # Note: The PCtx object "primes" the token input stream with the first token
 
@@ -597,16 +640,7 @@ class CharacterEval(object):
                             % (assembler.eloc(self,"run",module=this_module),\
                                 token,value))
                 # Add the pratt token value to the result stream
-                if isinstance(value,str):
-                    res+=value
-                elif isinstance(value,macsyms.Mac_Val):
-                    res+=value.string()
-                elif isinstance(value,int):
-                    res="%s%s" % (res,value)
-                else:
-                    raise ValueError("%s unexpected result from pratt token %s: %s"\
-                        % (assembler.eloc(self,"run",module=this_module),\
-                            token,value))
+                res=self.concat(res,token,value)
                 # Proceed to the next token.
                 token=ctx.next()
         except pratt3.PEvaluationError as ee:
@@ -673,6 +707,10 @@ EOSType=lexer.EOSType
 # This is the base class for all lexical tokens created by the lexical analyzers
 # within ASMA.
 class LexicalToken(lexer.Token):
+    # Subclasses of frequently created tokens define their own __slots__.  Others
+    # have an instance dictionary for their attributes.
+    __slots__=("source","binary","unary")
+
     def __init__(self):
         super().__init__()
         self.source=None        # Assembler input source
@@ -903,6 +941,7 @@ class LogNotType(LogGenNotType):
 
 # &&     - Recognizes two sequential ampersands used in character expressions
 class AmpToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
 
@@ -921,6 +960,8 @@ class AOperToken(LexicalToken):
              "-":pratt3.PSub,
              "*":pratt3.PMul,
              "/":PAsmDiv}
+    __slots__=("iscur","stmt")
+
     def __init__(self):
         super().__init__()
 
@@ -962,6 +1003,7 @@ class AOperType(lexer.Type):
 
 # Not & or ( - characters requiring separate recognition during symbolic replacement
 class ChrsRepToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
 
@@ -975,6 +1017,7 @@ class ChrsRepType(lexer.Type):
 
 # Not ' or & - Fixed characters in character expression
 class ChrsToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
 
@@ -988,6 +1031,7 @@ class ChrsType(lexer.Type):
 
 # EQ, NE, LT, LE, GT, GE - Recognizes comparison infix operators
 class CompToken(LexicalToken):
+    __slots__=()
     ptokens={"EQ":pratt3.PEQ,
              "NE":pratt3.PNE,
              "LT":pratt3.PLT,
@@ -1020,6 +1064,7 @@ class CompType(lexer.Type):
 
 # ''     - Recognizes double quotes in character expressions
 class DblQuoteToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
 
@@ -1332,6 +1377,8 @@ class DCDS_Length_Type(lexer.Type):
 # DC,DS - D, F, FD, H - Fixed point signed or unsigned nominal value recognizer
 class DCDS_Number_Token(LexicalToken):
     signs={"U":1,"+":1,"-":-1,None:1}
+    __slots__=("sgn","sgn_nospace","digs")
+
     def __init__(self):
         super().__init__()
         self.sgn=None           # Nominal sign
@@ -1423,6 +1470,7 @@ class DCDS_Quote_Type(lexer.Type):
 
 # DC,DS - Constant type recognizer
 class DCDS_Type_Token(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
 
@@ -1437,6 +1485,7 @@ class DCDS_Types_Type(lexer.Type):
 
 # Recognizes the end of operands, namely, one or more spaces
 class EoOperToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
 
@@ -1447,6 +1496,7 @@ class EoOperType(lexer.Type):
 
 # =      - Recognizes the equal sign
 class EqualToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
 
@@ -1462,6 +1512,8 @@ class CommaType(lexer.Type):
 
 # LABEL  - Recgonizes an assembler label without an attribute
 class LabelToken(LexicalToken):
+    __slots__=("label",)
+
     def __init__(self):
         super().__init__()
 
@@ -1473,6 +1525,9 @@ class LabelToken(LexicalToken):
         super().init(tid,string,beg,end,line=line,linepos=linepos,eols=eols,\
                      ignore=ignore,mo=mo)
         self.label=self.string
+        # The match object is not used after this point.  Releasing it frees the
+        # match object and its reference to the statement's operand string.
+        self.mo=None
 
     def ptoken(self):
         return PLitLabel(self)
@@ -1523,6 +1578,8 @@ class LabelAttrToken(LexicalToken):
             "O":PLitLabelAttr_OChr,   #      char
             "S":PLitLabelAttr,        #      int
             "T":PLitLabelAttrChr}     #      char
+    __slots__=("label","attr")
+
     def __init__(self):
         super().__init__()
 
@@ -1550,6 +1607,7 @@ class LabelAttrToken(LexicalToken):
         if attr:
             self.attr=attr[0].upper()
         self.label=mogrps[1]  # The referenced label
+        self.mo=None          # The match object is no longer needed
 
     def atoken(self):
         if self.attr is None:
@@ -1594,6 +1652,7 @@ class LabelAttrType(lexer.Type):
 
 # (      - Recognizes a single left parenthesis
 class LParenToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
     # Returns a pratt3 PLit for character replacement contexts
@@ -1649,6 +1708,7 @@ class NotType(lexer.Type):
 
 # .      - Recognizes a single period ending a complex term
 class PeriodToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
 
@@ -1659,6 +1719,7 @@ class PeriodType(lexer.Type):
 
 # '      - Recognizes a single quote starting a character expression
 class QuoteToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
 
@@ -1669,6 +1730,7 @@ class QuoteType(lexer.Type):
 
 # )      - Recognizes a single right parenthesis
 class RParenToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
     # Returns a pratt3 PLit for character replacement contexts
@@ -1685,6 +1747,7 @@ class RParenType(lexer.Type):
 
 # B'xxx' - Recognized binary self defining terms
 class SDBinToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
     def convert(self):
@@ -1701,6 +1764,7 @@ class SDBinType(lexer.Type):
 
 # C'x', CA'x', CE'x' - Recognizes character self-defining terms
 class SDChrToken(LexicalToken):
+    __slots__=()
     ebcdic=["C","CE"]
     def __init__(self):
         super().__init__()
@@ -1748,6 +1812,7 @@ class SDChrType(lexer.Type):
 
 # 9..9   - Recognizes an unsigned decimal self-defining term
 class SDDecToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
     def convert(self):
@@ -1763,6 +1828,7 @@ class SDDecType(lexer.Type):
 
 # X'xx'  - Recognizes hexadecimal self-defining terms
 class SDHexToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
     def convert(self):
@@ -1779,6 +1845,7 @@ class SDHexType(lexer.Type):
 
 # .SEQSYM  - Recognizes a sequence symbol
 class SeqToken(LexicalToken):
+    __slots__=()
     def __init__(self):
         super().__init__()
 
@@ -119,12 +119,15 @@ def eloc(clso,method_name,module=None):
 #
 
 # Python imports early for statistics
+import json          # Access JSON encoding of the profile
 import time          # Access to local time, process timer and wall clock timer
 
 class AsmStats(object):
     def __init__(self):
         self.timers={}       # Active timers
         self.stmts=None      # Number of statements processes
+        self.profiler=None   # AsmProfiler object when profiling is enabled
+        self.caches={}       # AsmCacheStats objects of internal caches by name
 
         # These three timers may be updated with better times from an external source.
         # asma.py understands how to update these timers.  Use it as an example
@@ -186,11 +189,27 @@ class AsmStats(object):
             return False
         return True
 
+    # Returns the AsmCacheStats object of an internal cache, creating it when
+    # first requested.
+    def cache(self,name):
+        try:
+            return self.caches[name]
+        except KeyError:
+            pass
+        cstats=self.caches[name]=AsmCacheStats(name)
+        return cstats
+
     # Returns a timer's elapsed time.
     def elapsed(self,tname):
         timer=self.__fetch(tname,"running")
         return timer.elapsed()
 
+    # Enable collection of the assembly profile.  Returns the AsmProfiler object.
+    def profile(self):
+        if self.profiler is None:
+            self.profiler=AsmProfiler()
+        return self.profiler
+
     # Create a process timer
     def proc_timer(self,tname):
         try:
@@ -236,6 +255,10 @@ class AsmStats(object):
         string="%s\n      output  %s" % (string,self.__format(pt,timer="output_p"))
         string="%s\n      rate    %7.4f  (stmt/sec)" % (string,stmts/assembly)
 
+        if self.caches:
+            string="%s\n\n%s" % (string,AsmCacheStats.report(\
+                [(name,c.hits,c.misses) for name,c in sorted(self.caches.items())]))
+
         return string
 
     # Returns a timer's elapsed time.  If the timer has not been stopped it stops
@@ -293,6 +316,19 @@ class AsmStats(object):
         timer=self.__fetch(tname,"stopped")
         return timer.stopped()
 
+    # Returns a dictionary of the statistics of a completed assembly for combining
+    # with those of other assemblies by an AsmStatsTotal object.  Only timers that
+    # have been both started and stopped are included.
+    def summary(self):
+        timers={}
+        for tname,timer in self.timers.items():
+            if timer.started() and timer.stopped():
+                timers[tname]=timer.elapsed()
+        caches={}
+        for name,cstats in self.caches.items():
+            caches[name]=(cstats.hits,cstats.misses)
+        return {"stmts":self.stmts,"timers":timers,"caches":caches}
+
     # Update a timer with a better start time
     def update_start(self,tname,time,force=False):
         timer=self.__fetch(tname,"update_start")
@@ -313,6 +349,278 @@ class AsmStats(object):
             self.timers[tname]=AsmWallTimer(tname)
 
 
+# This class counts the hits and misses of an internal cache.  The cache's owner
+# increments the counts directly.
+#
+# Instance Argument:
+#   name    The name of the cache as reported by AsmStats
+class AsmCacheStats(object):
+    def __init__(self,name):
+        self.name=name
+        self.hits=0          # Number of requests satisfied by the cache
+        self.misses=0        # Number of requests not found in the cache
+
+    def __str__(self):
+        return "%s('%s',hits=%s,misses=%s)" \
+            % (self.__class__.__name__,self.name,self.hits,self.misses)
+
+    # Returns the cache statistics report
+    # Method Argument:
+    #   caches   A list of tuples: (name,hits,misses)
+    @staticmethod
+    def report(caches):
+        string="Caches                  hits     misses  hit rate"
+        for name,hits,misses in caches:
+            total=hits+misses
+            if total:
+                rate="%7.2f%%" % (hits*100.0/total)
+            else:
+                rate="%8s" % "-"
+            string="%s\n  %-16s %10d %10d  %s" % (string,name,hits,misses,rate)
+        return string
+
+
+# This class collects the profile of an assembly.  Profiling is enabled by the
+# AsmStats.profile() method, after which the Stats.profiler attribute is this
+# object.  Each profiled location calls the relevant method of this object to
+# perform and time an action when the attribute is not None.  When it is None, the
+# action is performed directly, so an assembly that is not being profiled has no
+# overhead beyond the test of the attribute.
+#
+# Three profiles are collected, each reporting calls and cumulative seconds:
+#   phases     Each processor phase by name, for example, 'pass0_1' or 'pass2'.
+#              The time of a phase includes that of any phases it causes to run,
+#              for example the 'MACLIB' phase of macro library definitions.
+#   stmts      Each asmbase.ASMStmt subclass by class name and by statement pass
+#              method: Pass0, Pass1 or Pass2.
+#   macros     Each macro by name: invocations, MacroEngine cycles, and the time
+#              spent in the engine generating model statements.
+#
+# The json() method returns the profile, with the assembler timers and statement
+# count, as a JSON document for tracking trends between assemblies.
+class AsmProfiler(object):
+    version=1       # Change when the JSON document structure changes
+
+    def __init__(self):
+        self.phases={}     # Phase name: [calls,seconds]
+        self.stmts={}      # Statement class name: {pass: [calls,seconds]}
+        self.macros={}     # Macro name: [invocations,cycles,seconds]
+
+    # Add a timed call to a dictionary entry
+    @staticmethod
+    def add(d,key,seconds):
+        try:
+            entry=d[key]
+        except KeyError:
+            d[key]=[1,seconds]
+            return
+        entry[0]+=1
+        entry[1]+=seconds
+
+    # Returns the dictionary of a [calls,seconds] entry for the JSON document
+    @staticmethod
+    def calls(entry):
+        return {"calls":entry[0],"seconds":entry[1]}
+
+    # Perform and time one cycle of a macro's MacroEngine.
+    # Returns:
+    #   the result of the engine's run() method
+    def engine(self,name,engine,state):
+        beg=time.perf_counter()
+        try:
+            return engine.run(state)
+        finally:
+            elapsed=time.perf_counter()-beg
+            try:
+                entry=self.macros[name]
+            except KeyError:
+                entry=self.macros[name]=[0,0,0.0]
+            entry[1]+=1
+            entry[2]+=elapsed
+
+    # Count the invocation of a macro
+    def invoke(self,name):
+        try:
+            self.macros[name][0]+=1
+        except KeyError:
+            self.macros[name]=[1,0,0.0]
+
+    # Returns the JSON document of the profile
+    # Method Argument:
+    #   stats   The AsmStats object whose timers and statement count are included
+    def json(self,stats):
+        stmts={}
+        for cls,passes in self.stmts.items():
+            calls=0
+            seconds=0.0
+            d={}
+            for pas,entry in passes.items():
+                d[pas]=AsmProfiler.calls(entry)
+                calls+=entry[0]
+                seconds+=entry[1]
+            d["total"]={"calls":calls,"seconds":seconds}
+            stmts[cls]=d
+
+        macros={}
+        for name,entry in self.macros.items():
+            macros[name]={"invocations":entry[0],"cycles":entry[1],\
+                "seconds":entry[2]}
+
+        phases={}
+        for name,entry in self.phases.items():
+            phases[name]=AsmProfiler.calls(entry)
+
+        doc={"version":AsmProfiler.version,
+             "statements":stats.stmts,
+             "timers":stats.summary()["timers"],
+             "phases":phases,
+             "stmts":stmts,
+             "macros":macros}
+        return json.dumps(doc,indent=1,sort_keys=True)
+
+    # Perform and time a processor phase.
+    # Returns:
+    #   the result of the phase method
+    def phase(self,name,method,*args,**kwds):
+        beg=time.perf_counter()
+        try:
+            return method(*args,**kwds)
+        finally:
+            AsmProfiler.add(self.phases,name,time.perf_counter()-beg)
+
+    # Perform and time a statement pass method.
+    # Method Arguments:
+    #   stmt    The asmbase.ASMStmt object
+    #   pas     The name of the pass, for example 'Pass2'
+    #   method  The statement's bound method of the pass
+    # Returns:
+    #   the result of the pass method
+    def stmt(self,stmt,pas,method,*args,**kwds):
+        beg=time.perf_counter()
+        try:
+            return method(*args,**kwds)
+        finally:
+            elapsed=time.perf_counter()-beg
+            try:
+                passes=self.stmts[stmt.__class__.__name__]
+            except KeyError:
+                passes=self.stmts[stmt.__class__.__name__]={}
+            AsmProfiler.add(passes,pas,elapsed)
+
+
+# This class accumulates the statistics of multiple assemblies, for example those
+# of a batch of assemblies run in parallel, and reports them.  Each assembly
+# supplies the dictionary returned by its AsmStats.summary() method.  The batch
+# wall-clock timer starts when the object is created.
+#
+# An assembly that ends with errors is counted as failed, but its statistics are
+# included in the totals because its statements were processed.  An assembly that
+# is skipped because its output is current is counted separately and contributes
+# nothing to the totals or rates.
+class AsmStatsTotal(object):
+    # Timers reported, in report sequence, and their report labels
+    timers=[("objects","objects"),("pass1","pass 1"),("pass2","pass 2"),\
+        ("output","output")]
+
+    def __init__(self):
+        self.assemblies=0    # Number of assemblies completed without errors
+        self.failed=0        # Number of failed assemblies or with errors
+        self.skipped=0       # Number of assemblies skipped, output current
+        self.stmts=0         # Total number of statements processed
+        self.totals={}       # Total elapsed time of each timer
+        self.caches={}       # Total [hits,misses] of each internal cache
+
+        # Batch elapsed wall-clock time
+        self.batch=AsmWallTimer("batch")
+        self.batch.start()
+
+    def __format(self,total,val):
+        if total:
+            pc=(val/total)*100
+        else:
+            pc=0.0
+        pc="%7.4f" % pc
+        pc=pc.rjust(8)
+        return "%s  %s" % (pc,val)
+
+    def __section(self,title,suffix,total):
+        assembly=self.totals.get("assemble_%s" % suffix,0.0)
+        string="\n%s    percent   seconds" % title
+        string="%s\n  assembly    %s" % (string,self.__format(total,assembly))
+        for tname,label in AsmStatsTotal.timers:
+            val=self.totals.get("%s_%s" % (tname,suffix),0.0)
+            string="%s\n    %-8s  %s" % (string,label,self.__format(total,val))
+        return (string,assembly)
+
+    # Add the statistics of one assembly
+    # Method Arguments:
+    #   summary   The AsmStats.summary() dictionary of the assembly or None if the
+    #             assembly failed to complete
+    #   errors    Specify True if the assembly completed with errors.  Defaults to
+    #             False.
+    def add(self,summary,errors=False):
+        if summary is None:
+            self.failed+=1
+            return
+        if errors:
+            self.failed+=1
+        else:
+            self.assemblies+=1
+        if summary["stmts"]:
+            self.stmts+=summary["stmts"]
+        for tname,val in summary["timers"].items():
+            self.totals[tname]=self.totals.get(tname,0.0)+val
+        self.add_caches(summary.get("caches",{}))
+
+    # Add the usage of internal caches
+    # Method Argument:
+    #   caches    A dictionary of (hits,misses) tuples by cache name, as provided
+    #             by the AsmStats.summary() dictionary
+    def add_caches(self,caches):
+        for name,counts in caches.items():
+            total=self.caches.setdefault(name,[0,0])
+            total[0]+=counts[0]
+            total[1]+=counts[1]
+
+    # Count an assembly skipped because its output is current
+    def skip(self):
+        self.skipped+=1
+
+    # Report the accumulated statistics.  Percentages are relative to the total
+    # assembly time of each section.  The batch wall-clock time is stopped by the
+    # first call.
+    def report(self):
+        if not self.batch.stopped():
+            self.batch.stop()
+        batch=self.batch.elapsed()
+
+        string="\nAssemblies: %s  failed: %s  skipped: %s" \
+            % (self.assemblies,self.failed,self.skipped)
+        string="%s\nTotal statements: %s\n" % (string,self.stmts)
+
+        section,assembly=self.__section("Wall Clock","w",\
+            self.totals.get("assemble_w",0.0))
+        string="%s%s" % (string,section)
+        string="%s\n  batch       %s" % (string,batch)
+        if batch:
+            string="%s\n    rate    %7.4f  (stmt/sec)" % (string,self.stmts/batch)
+            string="%s\n    speedup %7.4f  (assembly/batch)" \
+                % (string,assembly/batch)
+        string="%s\n" % string
+
+        section,assembly=self.__section("Process   ","p",\
+            self.totals.get("assemble_p",0.0))
+        string="%s%s" % (string,section)
+        if assembly:
+            string="%s\n    rate    %7.4f  (stmt/sec)" % (string,self.stmts/assembly)
+
+        if self.caches:
+            string="%s\n\n%s" % (string,AsmCacheStats.report(\
+                [(name,c[0],c[1]) for name,c in sorted(self.caches.items())]))
+
+        return string
+
+
 # This class implements a single usage timer.  Once created it may be started once
 # and stopped once.  After which it may be report the elapsed process time between
 # the time is was started and the time it was stopped.
@@ -440,6 +748,7 @@ Stats.start("import_p")
 Stats.start("import_w")
 
 # Python imports
+import bisect        # Access sorted base address searches
 import functools     # Allow sorting of instances
 import os.path       # Access to path management for AsmOut.
 import re            # Regular expression support
@@ -449,6 +758,7 @@ import sys           # Need hexversion attribute and exit function
 import satkutil      # Useful miscellaneous functionality
 import codepage      # Access ASCII/EBCDIC code pages
 import hexdump       # Useful ad hoc dumping of binary data
+import fp            # Access the floating point conversion result cache
 
 #
 #  +--------------------------------------------+
@@ -653,7 +963,7 @@ def isLabel(string):
 # output is not written to the file system (although it might be created internally).
 class AsmOut(object):
     def __init__(self,deck=None,image=None,ldipl=None,listing=None,mc=None,rc=None,\
-                 vmc=None):
+                 vmc=None,profile=None):
         self.deck=deck          # Object deck file name or None
         self.image=image        # Image file name or None
         self.ldipl=ldipl        # List directed IPL file and implied base dir. or None
@@ -661,6 +971,7 @@ class AsmOut(object):
         self.mc=mc              # Management console command file or None
         self.rc=rc              # Hercules RC script file commands or None
         self.vmc=vmc            # Virtual machine STORE commands file or None
+        self.profile=profile    # Assembly profile JSON file or None.
 
     def write_file(self,module,filename,mode,content,desc,silent=False):
         if filename is None:
@@ -675,7 +986,10 @@ class AsmOut(object):
         # Once the file is open, any problems writing the file or closing it
         # represent a major issue.  In this case we bail entirely with a message.
         try:
-            fo.write(content)
+            if isinstance(content,asmlist.AsmListing):
+                content.generate(fo=fo)
+            else:
+                fo.write(content)
         except OSError:
             print("%s - could not complete writing of %s file: %s" \
                 % (module,desc,filename))
@@ -714,12 +1028,17 @@ class AsmOut(object):
                 silent=silent)
         return
 
+    # The listing is either a string or, when streamed, the asmlist.AsmListing
+    # object that generates it.
     def write_listing(self,module,listing,silent=False):
         self.write_file(module,self.listing,"wt",listing,"listing",silent=silent)
 
     def write_mc(self,module,mcfile,silent=False):
         self.write_file(module,self.mc,"wt",mcfile,"STORE command",silent=silent)
 
+    def write_profile(self,module,profile,silent=False):
+        self.write_file(module,self.profile,"wt",profile,"profile",silent=silent)
+
     def write_rc(self,module,rcfile,silent=False):
         self.write_file(module,self.rc,"wt",rcfile,"RC script",silent=silent)
 
@@ -786,6 +1105,12 @@ class Assembler(object):
     #   msl         The requested MSL database file
     #   mslpath     Path Manager for  the Machine Specification Language database
     #   aout        AsmOut object describing output characteristics.
+    #   mslcache    Directory of the persistent expanded CPU cache.  None disables
+    #               the cache.  Defaults to None.
+    #   maccache    Directory of the persistent macro library definition cache.
+    #               None disables the cache.  Defaults to None.
+    #   fpcache     Directory of the persistent floating point conversion result
+    #               cache.  None disables the cache.  Defaults to None.
     #   addr        Size of addresses in this assembly.  Overrides MSL CPU statement
     #   case        Enables case sensitivity for labels, symbolic variables and
     #               sequence symbols.  Defaults to case insensitive.
@@ -826,7 +1151,8 @@ class Assembler(object):
     def __init__(self,machine,msl,mslpath,aout,addr=None,case=False,czam=False,\
                  debug=None,defines=[],dump=False,eprint=False,error=2,nest=20,\
                  ccw=None,psw=None,ptrace=[],otrace=[],cpfile=None,cptrans="94C",\
-                 mcall=False,seq=False,stats=False,asmpath=None,maclib=None):
+                 mcall=False,seq=False,stats=False,asmpath=None,maclib=None,\
+                 mslcache=None,maccache=None,fpcache=None):
 
         # Test passing of seq from the command-line to ASMA
         #print("Assembler.__init__() - seq: %s" % seq)
@@ -865,6 +1191,10 @@ class Assembler(object):
         # PathMgr objects
         self.asmpath=asmpath        # Assembler COPY directive search order path
         self.macpath=maclib         # Macro library search order path
+        self.maccache=maccache      # Macro library definition cache directory
+        self.fpcache=fpcache        # Floating point conversion cache directory
+        if fpcache:
+            fp.Cache.load(fpcache)
 
         # Error handling flag
         self.error=error
@@ -873,6 +1203,9 @@ class Assembler(object):
 
         # Statistics flag
         self.stats=stats
+        # Collect the assembly profile when its output file is requested
+        if aout.profile is not None:
+            Stats.profile()
 
       #
       #   Assembler initialization begins
@@ -892,7 +1225,7 @@ class Assembler(object):
         self.MP=MACLIBProcessor(self)
 
         # Operation Management Framework
-        self.OMF=asmoper.OperMgr(self,machine,msl,mslpath)
+        self.OMF=asmoper.OperMgr(self,machine,msl,mslpath,mslcache=mslcache)
         self.OMF.init_xmode(ccw,psw)      # Initialize XMODE settings
         self.addrsize=self.OMF.addrsize   # Maximum address size in bits
 
@@ -1802,6 +2135,11 @@ class BaseState(object):
         # example DSECT symbols).  See use_rbase() method
         self.rbases={}    # Active USING assignments to relative bases
 
+        # Index of the active bases by section, built when first needed by the
+        # BaseMgr.find() method.  Any change to the USING assignments of this
+        # object discards the index.  See the sections() method.
+        self.index=None
+
     # This method removes a previously registered base.  If it was not
     # previously registered it is silently ignored.  The effect of the DROP
     # statement is to make a register unavailable for use as a base.  It does
@@ -1828,6 +2166,7 @@ class BaseState(object):
              del based[reg]        # Remove the base assigned to the register
          except KeyError:
              pass
+         self.index=None
          try:
              self.bases[reg]=None  # This means the base is now dropped
          except KeyError:
@@ -1910,6 +2249,29 @@ class BaseState(object):
         # current USING state in the BaseMgr object to this returned BaseState
         # object.  See BaseMgr.pop() method
 
+    # Returns the index of the active bases.  The index is a dictionary mapping
+    # the section of relative bases, or None for absolute bases, to a tuple of two
+    # lists: the base addresses in ascending sequence and the Base objects with
+    # those addresses.  The index allows BaseMgr.find() to consider only the bases
+    # whose displacement from an address can fit in a displacement field.
+    def sections(self):
+        if self.index is not None:
+            return self.index
+
+        index={}
+        if self.abases:
+            index[None]=list(self.abases.values())
+        for base in self.rbases.values():
+            try:
+                index[base.section].append(base)
+            except KeyError:
+                index[base.section]=[base,]
+        for section,entry in index.items():
+            entry.sort(key=lambda base: base.address)
+            index[section]=([base.address for base in entry],entry)
+        self.index=index
+        return index
+
     # Establish a new register absolute USING.
     # Method Arguments:
     #   reg    The general register number for which the USING is being
@@ -1919,6 +2281,7 @@ class BaseState(object):
     def use_abase(self,reg,baseo):
         self.abases[reg]=baseo
         self.bases[reg]=self.abases
+        self.index=None
 
     # Establish a new register relative USING.
     # Method Arguments:
@@ -1929,6 +2292,7 @@ class BaseState(object):
     def use_rbase(self,reg,baseo):
         self.rbases[reg]=baseo
         self.bases[reg]=self.rbases
+        self.index=None
 
 
 # This class manages base registers, USING, DROP, base/disp resolution, USING
@@ -1972,29 +2336,6 @@ class BaseMgr(object):
         else:    # All other systems only support direct mode with register 0
             BaseMgr.direct=BaseMgr.direct1
 
-    # This internal method is used to test whether a potential base is indeed
-    # possible.
-    # Method Arguments:
-    #   possible   a list of possible bases
-    #   baseo      a Base object being tested for use with the address being
-    #              resolved
-    #   addr       The address object being resolved to a base/displacement pair
-    #   size       Size of the base displacement field in bits (12 or 20)
-    #   signed     Whether the displacement is signed or unsigned.
-    #   asm        The global assembler object.
-    # Returns:
-    #   the possible list.  May add to the list or not
-    def __isPossible(self,possible,baseo,addr,size,signed,asm):
-        disp=baseo.getDisp(addr)
-        try:
-            asm.builder.range_check(size,disp,signed=signed)
-        except insnbldr.RangeCheckError:
-             # will not fit, not a candidate.  Return list without addition
-             return possible
-        baseo.disp=disp
-        possible.append(baseo)
-        return possible
-
     # This method selects a base register from a list of possible candidates.
     # All of the bases supplied to this method ARE eligible for use in resolving
     # a symbol to a base/displacement combination.
@@ -2041,27 +2382,35 @@ class BaseMgr(object):
                 % (eloc(self,"find"),addr)
 
         signed = size == 20   # Whether the displacement is signed or not
+        if signed:
+            cmin,cmax=asm.builder.fld_srange[size]
+        else:
+            cmin,cmax=asm.builder.fld_range[size]
 
-        possible=[]
+        # Absolute addresses may only use absolute bases.  Relative addresses may
+        # only use relative bases of the same section.
         if addr.isAbsolute():
-            for base in self.cur.abases.values():
-                if (not signed) and (base.address > addr.address):
-                    continue
-                possible=self.__isPossible(possible,base,addr,size,signed,asm)
-
-            # This can raise an uncaught KeyError when resolution is not possible
-            return self.__select(addr,possible,trace=trace)
-
-        for base in self.cur.rbases.values():
-            base_addr=addr.base()
-            assert base_addr is not None,\
-                "%s Base address is None: %s" % (eloc(self,"find"),repr(addr))
-
-            if base.section != addr.section:
-                continue
-            if (not signed) and (base.address > addr.base()):
-                continue
-            possible=self.__isPossible(possible,base,addr,size,signed,asm)
+            section=None
+        else:
+            section=addr.section
+        address=addr.base()
+        assert address is not None,\
+            "%s Base address is None: %s" % (eloc(self,"find"),repr(addr))
+
+        # Only bases whose displacement from the address fits in the displacement
+        # field are possible.  Because the index is in base address sequence, these
+        # are found by searching for the range of base addresses:
+        #   address-cmax <= base address <= address-cmin
+        # Unsigned displacements exclude bases above the address, cmin being 0.
+        try:
+            addresses,bases=self.cur.sections()[section]
+        except KeyError:
+            addresses=bases=[]
+        low=bisect.bisect_left(addresses,address-cmax)
+        high=bisect.bisect_right(addresses,address-cmin)
+        possible=bases[low:high]
+        for base in possible:
+            base.disp=address-base.address
 
         # This can raise an uncaught KeyError when resolution is not possible
         return self.__select(addr,possible,trace=trace)
@@ -2315,6 +2664,13 @@ class Binary(object):
                     print("%s %s finalized %s bytes: %s - %s: %s" \
                         % (cls_str,cls,blen,beg_addr,end_addr,hexdata))
 
+    # Clears the content's window of a single buffer image.  Uninitialized storage
+    # has no content of its own, but in the image it replaces any content
+    # previously placed at the same location, for example, following an ORG.
+    def clear(self):
+        if isinstance(self.barray,memoryview):
+            self.barray[:]=bytes(len(self.barray))
+
     def make_absolute(self,debug=False):
         if debug:
             prev=self.loc.clone()
@@ -2339,11 +2695,16 @@ class Binary(object):
                 print("%s %s barray length: %s"
                     % (cls_str,desc,len(self.barray)))
 
+    # Establishes the content's window within its container's window of a single
+    # buffer image.
+    # Method Argument:
+    #   window   the container's memoryview window
+    #   start    the content's displacement within the container
+    def window(self,window,start):
+        self.barray=window[start:start+len(self)]
+
     def str2bytes(self,string):
-        b=bytearray(0)
-        for x in string:
-            b.append(ord(x))
-        return bytes(b)
+        return string.encode("latin-1")
 
     # Update the binary imaage content in self.barray.  The data argument must be
     # sliceable into the bytearray.
@@ -2357,8 +2718,12 @@ class Binary(object):
     #   full     If specified true the bytes list in the data argunent must be
     #            exactly match the length of the image content bytearray in length.
     #            When full=True is used, the at argument must be 0.
+    #
+    # When the image is laid out in a single buffer, self.barray is a memoryview
+    # window into the image and the data is written in place.  See the
+    # Img.make_barray_all() method.
     def update(self,data,at=0,full=False,finalize=False,trace=False):
-        assert isinstance(self.barray,bytearray),\
+        assert isinstance(self.barray,(bytearray,memoryview)),\
             "%s can not update %s, self.barray is not a bytearray: %r" \
                 % (eloc(self,"update"),self.__class__.__name__,self.barray)
         if isinstance(data,str):
@@ -2394,6 +2759,9 @@ class Binary(object):
         self.barray[at:end]=d
 
         if finalize:
+            if full:
+                # The data is the finalized content, no need to copy it
+                self.barray=d
             self.fini(trace=trace)
 
     # This method returns the value referenced by this binary or container's symbol
@@ -2774,6 +3142,16 @@ class Section(Content):
         for b in self.elements:
             b.make_barray(trace=trace)
 
+    # Establishes my window and the windows of my Binary instances within the
+    # single buffer of the image.
+    # Method Argument:
+    #   image   a memoryview of the entire image buffer
+    def make_window_all(self,image,trace=False):
+        self.window(image,self.img_loc)
+        my_loc=self.loc
+        for b in self.elements:
+            b.window(self.barray,b.loc-my_loc)
+
     def new_counter(self):
         ctr=LocationCounter(self)
         self.counters.append(ctr)
@@ -2905,9 +3283,27 @@ class Region(Content):
         for c in self.elements:
             c.make_barray_all(trace=trace)
 
+    # Establishes my window and the windows of my CSECT's within the single buffer
+    # of the image.
+    # Method Argument:
+    #   image   a memoryview of the entire image buffer
+    def make_window_all(self,image,trace=False):
+        self.window(image,self.img_loc)
+        for c in self.elements:
+            c.make_window_all(image,trace=trace)
+
 # This is the content container for Regions.  It is used to ultimately create
 # the binary image output provided by the Image object.
+#
+# By default the image is laid out in a single buffer.  Once the image length is
+# known, one bytearray is allocated for the entire image and each Region, CSECT
+# and Binary receives a memoryview window into it.  Binary content is then written
+# directly into the image and no insertion into the containers is required.  When
+# the class attribute single is set to False, each container has its own
+# bytearray and content is copied into its container by the insert() methods.
 class Img(Content):
+    single=True    # Whether the image is laid out in a single buffer
+
     def __init__(self):
         self.name="IMAGE"       # May be updated by END statement
         super().__init__(0,Region)
@@ -2938,8 +3334,17 @@ class Img(Content):
         self.dump()
 
     # Insert all of my Regions into my binary image byte array.  Convert it to a bytes
-    # list when done.
+    # list when done.  A single buffer image already contains all of its content.
     def insert(self,trace=False):
+        if Img.single:
+            # The image file has the same length as that of the copying layout
+            pad=self.trailer()
+            if pad:
+                self.barray=bytes(self.barray)+bytes(pad)
+            if trace:
+                self.dump_all()
+            return
+
         my_loc=0
         for r in self.elements:
             for c in r.elements:
@@ -2954,7 +3359,11 @@ class Img(Content):
             length=len(barray)
             start=r_loc-my_loc
             end=start+length
-            self.barray[start:len(barray)]=barray
+            # The slice ends at the region's length, not at its end.  A region
+            # following the first is therefore inserted into the image rather than
+            # overlaying it, appending trailing zero bytes to the image.  Image files
+            # retain this length.  See the trailer() method.
+            self.barray[start:length]=barray
 
             # A region could have no data. Just ignore it
             if length==0:
@@ -2989,8 +3398,26 @@ class Img(Content):
     def lval(self):
         return self.value().address
 
+    # Returns the number of trailing zero bytes the copying layout of the insert()
+    # method appends to the image.  A single buffer image is extended by the same
+    # number of bytes so that both layouts create identical image files.
+    def trailer(self):
+        length=cur=len(self.barray)
+        for r in self.elements:
+            size=len(r.barray)
+            start=r.img_loc
+            # Bytes replaced by the insert() slice [start:size] of the image
+            replaced=max(0,min(size,cur)-min(start,cur))
+            cur+=size-replaced
+        return cur-length
+
     def make_barray_all(self,trace=False):
         self.make_barray(trace=trace)
+        if Img.single:
+            image=memoryview(self.barray)
+            for r in self.elements:
+                r.make_window_all(image,trace=trace)
+            return
         for r in self.elements:
             r.make_barray_all(trace=trace)
 
@@ -3388,15 +3815,22 @@ class STMTProcessor(asmbase.ASMProcessor):
                 s.ignore=True  # Intercepted, so no need to do anything more
                 continue
 
-            # WARNING: DO NOT set either argument debug or trace here
-            s.Pass0(asm,macro=mb)
+            prof=Stats.profiler
+            if prof is None:
+                # WARNING: DO NOT set either argument debug or trace here
+                s.Pass0(asm,macro=mb)
+            else:
+                prof.stmt(s,"Pass0",s.Pass0,asm,macro=mb)
 
             if s.ignore:
                 # Errors in Pass0() method skipped here
                 continue
 
-            # WARNING: DO NOT set either argument debug or trace here
-            s.Pass1(asm)
+            if prof is None:
+                # WARNING: DO NOT set either argument debug or trace here
+                s.Pass1(asm)
+            else:
+                prof.stmt(s,"Pass1",s.Pass1,asm)
 
     def Pass0_1(self,asm,fail=False,debug=False):
         Stats.start("pass1_p")
@@ -3486,6 +3920,7 @@ class STMTProcessor(asmbase.ASMProcessor):
         asm.cur_loc.establish(lnkbase.AbsAddr(0))
 
     def Pass2(self,asm,fail=False,debug=False):
+        prof=Stats.profiler
         for s in asm.stmts:
             if s.ignore:
                 if __debug__:
@@ -3500,11 +3935,17 @@ class STMTProcessor(asmbase.ASMProcessor):
 
             if fail:
                 # WARNING: DO NOT set either argument debug or trace here
-                s.Pass2(asm)
+                if prof is None:
+                    s.Pass2(asm)
+                else:
+                    prof.stmt(s,"Pass2",s.Pass2,asm)
             else:
                 try:
                     # WARNING: DO NOT set either argument debug or trace here
-                    s.Pass2(asm)
+                    if prof is None:
+                        s.Pass2(asm)
+                    else:
+                        prof.stmt(s,"Pass2",s.Pass2,asm)
                 except AssemblerError as ae:
                     asm._ae_excp(ae,s,string=eloc(self,"Pass2"),debug=False)
 
@@ -3523,7 +3964,11 @@ class STMTProcessor(asmbase.ASMProcessor):
         Stats.start("output_p")
         Stats.start("output_w")
         asm._finish()    # Complete the Image before providing to listing generator
-        asm.LM.create()  # Generate listing and place it in the final Image object
+        # Generate listing and place it in the final Image object.  A listing being
+        # written to a file is streamed to it by the AsmOut.write_listing() method.
+        asm.LM.create(stream=asm.aout.listing is not None)
+        if asm.fpcache:
+            fp.Cache.save(asm.fpcache)
         Stats.stop("output_w")
         Stats.stop("output_p")
 
@@ -3605,6 +4050,12 @@ class MACLIBProcessor(asmbase.ASMProcessor):
         # Macro Builder
         self.MB=asmmacs.MacroBuilder(asm,"S")
 
+        # Persistent cache of macro library definitions
+        if asm.maccache:
+            self.cache=asmmacs.MacroCache(asm.maccache,asm)
+        else:
+            self.cache=None
+
         # Manage input:
         self.IM=asmline.LineMgr(asm,self.MB,depth=depth,env="MACLIB",\
             pathmgr=asm.macpath)
@@ -3613,6 +4064,9 @@ class MACLIBProcessor(asmbase.ASMProcessor):
         self.macro=None         # Macro name being defined from library
         self.infile=None        # Supplied by the run() method
 
+        # Macro file names not found in the MACLIB path
+        self.notfound=[]
+
     # The macro processor has a single "phase".  It reads the macro file looking
     # for a macro definition to define to the operation management framework.
     def init(self):
@@ -3774,6 +4228,7 @@ class MACLIBProcessor(asmbase.ASMProcessor):
         try:
             self.IM.newFile(self.infile)
         except AssemblerError as ae:
+            self.notfound.append(upper)
             if self.isWindows:
                 # No need to try the lower case name because the Windows file
                 # system is case insensitive.
@@ -3787,6 +4242,7 @@ class MACLIBProcessor(asmbase.ASMProcessor):
             try:
                 self.IM.newFile(self.infile)
             except AssemblerError as ae:
+                self.notfound.append(lower)
                 msg="macro definition for %s not found in MACLIB path as either "\
                     "%s or %s" % (macname,upper,lower)
                 raise AssemblerError(msg=msg) from None
@@ -3803,11 +4259,30 @@ class MACLIBProcessor(asmbase.ASMProcessor):
         # Open the macro definition from the MACLIB path
         self.open_same_case(macname)
 
+        if self.cache is None:
+            # Process the MACLIB file
+            return self.process()
+
+        # Use the macros previously defined by the MACLIB file when available
+        filepath=self.IM.LB.SourcePath()
+        macros=self.cache.load(filepath)
+        if macros is not None:
+            self.IM.LB.closeSource()  # without BufferEmpty being triggered
+            for mac in macros:
+                self.MB.addMacro(mac)
+            return None
+
         # Process the MACLIB file
+        self.MB.built=[]
         result=self.process()
         #print("assembler.MACLIBProcessor.run process result: class %s - %s" \
         #    % (result.__class__.__name__,result))
 
+        # Only a file whose macros are all successfully defined is saved
+        if result is None:
+            self.cache.save(filepath,self.MB.built)
+        self.MB.built=[]
+
         return result
 
 
@@ -765,6 +765,13 @@ class PChrExpr(PCTerm):
             return value.value()
         return value
 
+    # Compiles the character expression and the substring expressions
+    def compile(self,engine):
+        self.expr.compile(engine)
+        if self.start:
+            self.start.compile(engine)
+            self.length.compile(engine)
+
     # Performs symbolic replacement and substring extraction
     # Returns:
     #   C_Val object of the final string or Python string depending upon self.string
@@ -1210,6 +1217,11 @@ class PSymRef(PCTerm):
         self.attr=attr             # Symbol attribute
         self.symname=symbol        # Symbolic Variable/Parameter beign referenced
         self.indices=indices       # List of prepared arithmetic expressions
+        # SymbolID of an unsubscripted reference (see the SymID() method)
+        self.symid=None
+        # Local symbol frame slot of a subscripted reference (see compile() method)
+        self.slot=None
+        self.slots=None
 
     # Returns a symbol's macro symbol object (Mac_Sym or subclass)
     # Returns:
@@ -1294,6 +1306,9 @@ class PSymRef(PCTerm):
     #   A macsyms.SymbolID object
     # Exceptions:
     def SymID(self,external=None,debug=False,trace=False):
+        # An unsubscripted reference always identifies the same symbol
+        if self.symid:
+            return self.symid
         indexes=[]
         for n,ndx_expr in enumerate(self.indices):
             index=ndx_expr.evaluate(external=external,debug=debug,trace=trace)
@@ -1304,7 +1319,23 @@ class PSymRef(PCTerm):
             sname=self.symname.upper()
         else:
             sname=self.symname
-        return macsyms.SymbolID(sname,indices=indexes)
+        symid=macsyms.SymbolID(sname,indices=indexes,slot=self.slot,\
+            slots=self.slots)
+        if not indexes:
+            self.symid=symid
+        return symid
+
+    # Compiles the subscript expressions.  The macro assigns the symbol its local
+    # symbol frame slot, identified by the SymbolID objects of the reference.
+    def compile(self,engine):
+        for ndx_expr in self.indices:
+            ndx_expr.compile(engine)
+        symid=engine.symid(self.symname)
+        if self.indices:
+            self.slot=symid.slot
+            self.slots=symid.slots
+        else:
+            self.symid=symid
 
     # Provides the symbolic variable or parameter value or its attribute during
     # expression evaluation.
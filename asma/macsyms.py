@@ -902,8 +902,13 @@ class C_Array(Macro_Array):
 # Case sensitivity is managed via the 'variable' argument.  Case must be established
 # when the object is created.  While migrating to index access, indices take
 # precedence over use of subscript.
+#
+# A reference within a macro definition may also identify the variable's slot in
+# the macro's local symbol frame.  See asmmacs.MacroEngine.symid() method.  The slot
+# is only meaningful to the asmmacs.Mac_Symbols object using the same slots
+# dictionary.
 class SymbolID(object):
-    def __init__(self,variable,indices=[],subscript=0):
+    def __init__(self,variable,indices=[],subscript=0,slot=None,slots=None):
         assert isinstance(variable,str) and len(variable)>0,\
             "%s 'variable' argument must be a non-empty string: %s" \
                 % (assembler.eloc(self,"__init__",module=this_module),variable)
@@ -914,6 +919,8 @@ class SymbolID(object):
         self.var=variable        # The symbolic symbols's name (with '&')
         self.indices=indices     # Variable number of integer indices.
         self.sub=None            # Integer of array subscript
+        self.slot=slot           # Index of the symbol in a local symbol frame
+        self.slots=slots         # Slots dictionary that assigned the index
 
         if len(indices)==1:
             self.sub=indices[0]
@@ -145,6 +145,15 @@ class Model(object):
         raise ValueError("%s character expression result not C_Val or string: %s" \
             % (assembler.eloc(self,"__replace",module=this_module),v))
 
+    # Compiles the character expressions of the fields requiring symbolic
+    # replacement.  See the asmmacs.MacroEngine.define() method.
+    # Method Argument:
+    #   engine   the asmmacs.MacroEngine object of the macro being compiled
+    def compile(self,engine):
+        for fld in [self.label_fld,self.oper_fld]+self.operands:
+            if not isinstance(fld,(str,type(None))):
+                fld.compile(engine)
+
     # Generate one or more physical lines for macro source object
     # Returns:
     #   a list of strings, one per "physical line" from the macro source
@@ -115,10 +115,12 @@
 # PYthon imports:
 import argparse          # Access the command line parser
 import functools         # Allow sorting of objects
+import os                # Access the cache file paths
 import re                # Access regular expression support (see Format.source_proc)
 import sys               # Access to exit() method to terminate run
 
 # SATK imports:
+import satkutil          # Access the persistent cache files
 import sopl              # Access the Statement Oriented Parameter Language tool
 
 copyright="msldb.py Copyright (C) %s Harold Grovesteen" % "2014, 2015"
@@ -282,6 +284,13 @@ class MSLDBE(object):
         self.loc=els.source
         self.els=els
 
+    # The SOPL statement is only needed while the database is being built.  It is
+    # not preserved when an entry is serialized by the CPUXCache.
+    def __getstate__(self):
+        state=self.__dict__.copy()
+        state["els"]=None
+        return state
+
     # Validate this statement is consistent with rest of database
     def consistent(self,db):
         cls_str="msldb.py - %s.consistent() -" % self.__class__.__name__
@@ -544,6 +553,10 @@ class CPUX(object):
         self.ccw=cpu.ccw          # Expected CCW Format in use by CPU
         self.psw=cpu.psw          # Expected PSW Format in use by CPU
 
+        # Absolute paths of the MSL files from which the CPU was expanded.
+        # Supplied by MSL.expand() method.
+        self.files=[]
+
     def addInst(self,inst):
         try:
             entry=self.inst[inst.ID]
@@ -1597,6 +1610,7 @@ class MSL(sopl.SOPL):
             raise ValueError("%s MSL database entry %s can not be expanded: %s" \
                 % (cls_str,item,expitem.typ)) from None
         expanded=expitem.expand(self.db)
+        expanded.files=list(self.files)
         return expanded
 
     # Register my statements and parameters with the SOPL super class.
@@ -1676,5 +1690,136 @@ class xref(object):
     def check(self):
         return len(self.refs)>0 or self.top
 
+
+#
+#  +--------------------------------------+
+#  |                                      |
+#  |   Expanded CPU Persistent Cache      |
+#  |                                      |
+#  +--------------------------------------+
+#
+
+# This class manages an on-disk cache of expanded CPU definitions, CPUX objects.
+# Each cache file holds the expansion of one CPU from one primary MSL file.  The
+# file starts with a header identifying the primary MSL file, the CPU, the search
+# path and every included file with its size, modification time and SHA-1 digest.
+# The pickled CPUX object follows the header.  The CPUX object is only loaded
+# when every file in the include set is unchanged.  A file whose modification time
+# differs but whose content hashes the same is still considered unchanged.  The
+# satkutil.CacheFile object reads and writes the cache files, rejecting those
+# created by a different version of this module or of the sopl module.
+#
+# Instance Arguments:
+#   directory   The directory in which cache files reside.  It is created when
+#               the first cache file is written.
+#   pathmgr     The satkutil.PathMgr object used to locate MSL files.
+#   variable    The search path variable used to locate MSL files.  Defaults to
+#               'MSLPATH', the variable used by the MSL class.
+#   stats       An additional object whose 'hits' and 'misses' attributes are
+#               incremented, for example an ASMA AsmCacheStats object.  Defaults
+#               to None.
+class CPUXCache(object):
+    ext="mslc"      # Cache file extension
+    def __init__(self,directory,pathmgr,variable="MSLPATH",stats=None):
+        self.directory=directory
+        self.opath=pathmgr
+        self.variable=variable
+        self.stats=stats
+        # Cache file reader and writer of the code creating CPUX objects
+        self.files=satkutil.CacheFile([sys.modules[__name__],sopl])
+
+        # Statistics of cache usage
+        self.hits=0
+        self.misses=0
+
+    # Returns the cache file path for a primary MSL file and CPU
+    # Exception:
+    #   ValueError if the primary MSL file can not be located
+    def __cache_file(self,mslfile,cpu):
+        abspath,fo=self.opath.ropen(mslfile,variable=self.variable)
+        fo.close()
+        abspath=os.path.abspath(abspath)
+        digest=self.files.key(abspath,cpu,self.__search_path())
+        base=os.path.splitext(os.path.basename(abspath))[0]
+        name="%s-%s-%s.%s" % (base,cpu,digest,CPUXCache.ext)
+        return (abspath,os.path.join(self.directory,name))
+
+    # Returns the list of directories used to locate MSL files
+    def __search_path(self):
+        try:
+            return self.opath.paths[self.variable].dir_list
+        except (AttributeError,KeyError):
+            return []
+
+    # Build the expanded CPU from the MSL source, bypassing the cache.
+    # Returns:
+    #   a tuple of the MSL object and the expanded CPU, a CPUX object
+    def __build(self,mslfile,cpu,debug=False):
+        mslproc=MSL(default=None,pathmgr=self.opath,debug=debug)
+        mslproc.build(mslfile,fail=True)
+        return (mslproc,mslproc.expand(cpu))
+
+    # Returns the expanded CPU, a CPUX object, from the cache when valid or from
+    # the MSL source files when not.  A cache file is written when the source is
+    # used.
+    # Method Arguments:
+    #   mslfile   The primary MSL file name
+    #   cpu       The CPU ID being expanded
+    #   debug     Specify True to enable MSL processing debug output
+    def cpux(self,mslfile,cpu,debug=False):
+        try:
+            abspath,cachefile=self.__cache_file(mslfile,cpu)
+        except ValueError:
+            # Let the MSL processor report the missing file
+            return self.__build(mslfile,cpu,debug=debug)[1]
+
+        cpux=self.load(cachefile,abspath,cpu)
+        if cpux is not None:
+            self.hits+=1
+            if self.stats is not None:
+                self.stats.hits+=1
+            return cpux
+
+        self.misses+=1
+        if self.stats is not None:
+            self.stats.misses+=1
+        mslproc,cpux=self.__build(mslfile,cpu,debug=debug)
+        self.save(cachefile,abspath,cpu,cpux,mslproc.files)
+        return cpux
+
+    # Load a CPUX object from a cache file.
+    # Returns:
+    #   the CPUX object if the cache file is valid for the MSL file and CPU
+    #   None if the cache file is missing, stale or unreadable.
+    def load(self,cachefile,abspath,cpu):
+        expect={"msl":abspath,"cpu":cpu,"path":self.__search_path()}
+        cpux=self.files.load(cachefile,expect,valid=CPUXCache.unchanged)
+        if not isinstance(cpux,CPUX):
+            return None
+        return cpux
+
+    # Write a CPUX object to a cache file.  Failure to write the cache is not an
+    # error.
+    def save(self,cachefile,abspath,cpu,cpux,files):
+        try:
+            prints=[]
+            for filepath in files:
+                filepath=os.path.abspath(filepath)
+                prints.append((filepath,)+satkutil.CacheFile.source(filepath))
+        except OSError:
+            return
+        header={"msl":abspath,"cpu":cpu,"path":self.__search_path(),"files":prints}
+        self.files.save(cachefile,header,cpux)
+
+    # Returns whether every included file recorded in a cache file header is
+    # unchanged
+    @staticmethod
+    def unchanged(header):
+        for filepath,size,mtime,digest in header["files"]:
+            if not satkutil.CacheFile.unchanged(filepath,size,mtime,digest):
+                return False
+        return True
+
+
 if __name__ == "__main__":
     raise NotImplementedError("msldb.py - intended for import use only")
@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+# Copyright (C) 2026 The SATK contributors
+#
+# This file is part of SATK.
+#
+#     SATK is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     SATK is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with SATK.  If not, see <http://www.gnu.org/licenses/>.
+
+# This module tests the image files created by ASMA.  Each assembly of images.txt
+# is run and the bytes of its image file are compared with the expected length and
+# SHA-256 digest.  The expected values are those of the assembler preceding the
+# single buffer image layout of the assembler.Img class, so both image layouts
+# must create identical image files.
+#
+# By default the single buffer layout is tested.  The --copy argument tests the
+# copying layout, enabled by setting assembler.Img.single to False.
+#
+# The module exits with a return code of 1 if any image differs.
+
+this_module="imgtst.py"
+
+import argparse       # Access command-line parser module
+import hashlib        # Access the SHA-256 digest
+import os             # Access path and environment functions
+import subprocess     # Access the ASMA process
+import sys            # Access exit() function.
+import tempfile       # Access the temporary directory of the image files
+
+# The directory of this module and the SATK repository
+TESTDIR=os.path.dirname(os.path.abspath(__file__))
+REPO=os.path.dirname(os.path.dirname(os.path.dirname(TESTDIR)))
+
+# Runs ASMA with the copying image layout.  The first argument is the repository.
+COPY_LAYOUT="""\
+import runpy,sys
+repo=sys.argv[1]
+for d in ["tools","asma","tools/lang","tools/ipl"]:
+    sys.path.insert(0,"%s/%s" % (repo,d))
+import assembler
+assembler.Img.single=False
+sys.argv=["asma.py"]+sys.argv[2:]
+runpy.run_path("%s/tools/asma.py" % repo,run_name="__main__")
+"""
+
+# This class describes one expected image file of images.txt
+#
+# Instance Arguments:
+#   lineno   The line number of images.txt
+#   target   The assembly target, for example 's370'
+#   source   The assembly source file relative to the repository
+#   length   The expected image file length
+#   digest   The expected SHA-256 digest of the image file as hexadecimal
+class Image(object):
+    def __init__(self,lineno,target,source,length,digest):
+        self.lineno=lineno
+        self.target=target
+        self.source=source
+        self.length=length
+        self.digest=digest
+
+    def __str__(self):
+        return "%-6s %s" % (self.target,self.source)
+
+    # Assemble the source and compare its image file with the expected one.
+    # Method Arguments:
+    #   tmpdir   The directory of the image file
+    #   copy     Whether the copying image layout is used
+    # Returns:
+    #   None if the image file is the expected one
+    #   a string describing the difference otherwise
+    def check(self,tmpdir,copy=False):
+        source=os.path.join(REPO,self.source)
+        image=os.path.join(tmpdir,"%s.img" % self.lineno)
+        env=dict(os.environ)
+        env["MACLIB"]=os.pathsep.join([os.path.join(REPO,d) for d in \
+            ["maclib","lodrmac","mmmac","relomac","xcard"]])
+        env["ASMPATH"]=os.pathsep.join([os.path.dirname(source)]+\
+            [os.path.join(REPO,d) for d in ["srcasm","samples/asma","xcard"]])
+        args=["-t",self.target,"-i",image,source]
+        if copy:
+            cmd=[sys.executable,"-c",COPY_LAYOUT,REPO]+args
+        else:
+            cmd=[sys.executable,os.path.join(REPO,"tools","asma.py")]+args
+        subprocess.run(cmd,cwd=tmpdir,env=env,stdout=subprocess.DEVNULL,\
+            stderr=subprocess.DEVNULL)
+
+        try:
+            with open(image,"rb") as fo:
+                data=fo.read()
+        except OSError:
+            return "image file not created"
+        if len(data)!=self.length:
+            return "length %s, expected %s" % (len(data),self.length)
+        digest=hashlib.sha256(data).hexdigest()
+        if digest!=self.digest:
+            return "SHA-256 %s, expected %s" % (digest,self.digest)
+        return None
+
+
+# Returns the list of Image objects of an expected images file
+def read_images(filename):
+    images=[]
+    with open(filename,"rt") as fo:
+        for lineno,line in enumerate(fo,start=1):
+            line=line.strip()
+            if len(line)==0 or line[0]=="#":
+                continue
+            target,source,length,digest=line.split()
+            images.append(Image(lineno,target,source,int(length),digest))
+    return images
+
+def parse_args():
+    parser=argparse.ArgumentParser(prog=this_module,
+        description="compares ASMA image files with their expected bytes")
+
+    parser.add_argument("-c","--copy",action="store_true",default=False,\
+        help="test the copying image layout rather than the single buffer layout")
+
+    parser.add_argument("-f","--file",default=os.path.join(TESTDIR,"images.txt"),\
+        metavar="FILE",help="expected images file.  Defaults to images.txt of "
+            "the test directory")
+
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args=parse_args()
+    failed=0
+    images=read_images(args.file)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for img in images:
+            error=img.check(tmpdir,copy=args.copy)
+            if error is None:
+                print("passed %s" % img)
+            else:
+                print("FAILED %s: %s" % (img,error))
+                failed+=1
+    print("%s of %s images passed" % (len(images)-failed,len(images)))
+    if failed:
+        sys.exit(1)
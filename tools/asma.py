@@ -45,6 +45,7 @@ satkutil.pythonpath("tools/ipl")
 
 # ASMA imports
 import asmconfig    # Usage by ASMA of the configuration system
+import asmdeps      # Access incremental assembly dependency manifest
 import assembler    # The actual assembler
 
 
@@ -63,12 +64,19 @@ class ASMA(object):
            "64":   ("all-insn.msl",   "64")}
     target_choices=\
         ["s360","s370","s380","370xa","e370","e390","s390","s390x","24","31","64"]
-    def __init__(self,args,dm):
+    # Instance Arguments:
+    #   args     The config.Config object of the assembly's options
+    #   dm       The global Debug Manager
+    #   collect  Specify True to collect statistics without reporting them unless
+    #            requested by the --stats option.  Used by the batch driver,
+    #            asmabatch.py.  Defaults to False.
+    def __init__(self,args,dm,collect=False):
         
         self.dm=dm                # Global Debug Manager instance
         self.args=args            # Tool Config object
         self.args.display()       # If CINFO requested, display it
-        self.clstats=args["stats"]   # Command-line statistics flag
+        self.report=args["stats"]    # Command-line statistics flag
+        self.clstats=self.report or collect  # Whether statistics are collected
 
         # Enable any command line debug flags
         for flag in args["debug"]:
@@ -81,28 +89,43 @@ class ASMA(object):
             listing=args["listing"],\
             mc=args["store"],\
             rc=args["rc"],\
-            vmc=args["vmc"])
+            vmc=args["vmc"],\
+            profile=args["profile"])
+
+        # Determine whether the previous assembly's output is current
+        self.deps=None              # asmdeps.AsmDeps object if --deps used
+        self.current=False          # Whether the assembly is skipped
+        self.errors=0               # Number of errors found by the assembly
+        if args["deps"] is not None:
+            self.deps=asmdeps.AsmDeps(args["deps"],args,self.aout)
+            self.current=self.deps.current()
 
         msl,cpu=self.target()
         mslpath=args["mslpath"]     # MSL PathMgr object
         cptrans,cpfile=self.code_page("94C")
         defn=self.defines()
 
-        self.assembler=assembler.Assembler(cpu,msl,mslpath,self.aout,\
-            addr=args["addr"],\
-            case=args["case"],\
-            debug=dm,\
-            defines=defn,\
-            dump=args["dump"],\
-            error=args["error"],\
-            nest=args["nest"],\
-            otrace=args["oper"],\
-            cpfile=cpfile,\
-            cptrans=cptrans,\
-            seq=args["seq"],\
-            mcall=args["mcall"],\
-            asmpath=args["asmpath"],\
-            maclib=args["maclib"])
+        if self.current:
+            self.assembler=None
+        else:
+            self.assembler=assembler.Assembler(cpu,msl,mslpath,self.aout,\
+                addr=args["addr"],\
+                case=args["case"],\
+                debug=dm,\
+                defines=defn,\
+                dump=args["dump"],\
+                error=args["error"],\
+                nest=args["nest"],\
+                otrace=args["oper"],\
+                cpfile=cpfile,\
+                cptrans=cptrans,\
+                seq=args["seq"],\
+                mcall=args["mcall"],\
+                asmpath=args["asmpath"],\
+                maclib=args["maclib"],\
+                mslcache=args["mslcache"],\
+                maccache=args["maccache"],\
+                fpcache=args["fpcache"])
 
         self.source=args["input"]       # Source input file
 
@@ -140,7 +163,15 @@ class ASMA(object):
         return lst
 
     # Execute the assembler
+    # Returns:
+    #   True if the assembly completed and its output was written
+    #   False if the assembly could not be run
     def run(self):
+        if self.current:
+            print("%s - assembly skipped, inputs unchanged: %s" \
+                % (this_module,self.source))
+            return True
+
         if self.clstats:
             stats=assembler.Stats
             stats.start("assemble_p")
@@ -155,7 +186,7 @@ class ASMA(object):
             raise
             
         if result!=True:
-            return  # return without outputting stats or any other output
+            return False  # return without outputting stats or any other output
             # Note: This is used when the initial input file can not be opened.
             # Any error message has already been printed but an exception is not
             # raised.
@@ -176,6 +207,9 @@ class ASMA(object):
         self.aout.write_vmc(this_module,img.vmc)
         self.aout.write_mc(this_module,img.mc)
         self.aout.write_ldipl(this_module,img.ldipl)
+        if self.aout.profile is not None:
+            stats=assembler.Stats
+            self.aout.write_profile(this_module,stats.profiler.json(stats))
 
         # Provide the error report to the command-line if error-level is 2.
         # For error levels 0 or 1, error(s) have already been displayed.
@@ -183,6 +217,18 @@ class ASMA(object):
         if self.args["error"]==2:
             img.errors()
 
+        # Errors exclude informational and warning messages
+        errors=[ae for ae in img.aes if not (ae.info or ae.warning)]
+        self.errors=len(errors)
+
+        # Record the assembly's dependencies for the next assembly.  An assembly
+        # with errors is never skipped, so its manifest is removed.
+        if self.deps is not None:
+            if errors:
+                self.deps.remove()
+            else:
+                self.deps.record(self.assembler)
+
         self.out_end_w=time.time()
         self.out_end=time.process_time()
 
@@ -191,6 +237,8 @@ class ASMA(object):
             # Manually change to False to output stats from the assembler
             self.stats(update=True)
 
+        return True
+
     # This method separates a name[=value] or name=value string into a tuple of one 
     # or two strings: (name,value) or (name,None)
     # Method Arguments:
@@ -203,10 +251,11 @@ class ASMA(object):
     # or (name,value) Two strings, one for the name and for for the value
     #
     # Used for --cp, --cpu and -D command-line arguments
-    def sep(self,string,argument,optional=None):
+    @staticmethod
+    def sep(string,argument,optional=None):
         assert isinstance(string,str) and len(string)!=0,\
             "%s 'string' argument must be a non-empty string: %s" \
-                % (assembler.eloc(self,"set",module=this_module),string)
+                % ("%s - ASMA.sep() -" % this_module,string)
 
         seps=string.count("=")
         if optional and seps==0:
@@ -243,13 +292,21 @@ class ASMA(object):
             stats.update_stop( "output_p",self.out_end)
             stats.update_stop( "output_w",self.out_end_w)
 
-        print(stats.report())
+        if self.report:
+            print(stats.report())
 
     # Determine target cpu and MSL database file from --target or --cpu
     def target(self):
+        return ASMA.select_target(self.args)
+
+    # Determine target cpu and MSL database file from the --target or --cpu
+    # option of a config.Config object.
+    # Returns:
+    #   a tuple of the MSL database file name and the cpu
+    @staticmethod
+    def select_target(args):
         msl=None
         cpu=None
-        args=self.args
 
         # Try the --target argument
         try:
@@ -260,7 +317,7 @@ class ASMA(object):
         # If present try --cpu argument
         arg_cpu=args["cpu"]
         if arg_cpu is not None:
-            msl,cpu=self.sep(arg_cpu,"--cpu",optional=None)
+            msl,cpu=ASMA.sep(arg_cpu,"--cpu",optional=None)
 
         if msl is None or cpu is None:
             print("argument error: could not identify target instruction set by "
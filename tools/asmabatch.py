@@ -0,0 +1,281 @@
+#!/usr/bin/python3
+# Copyright (C) 2026 The SATK contributors
+#
+# This file is part of SATK.
+#
+#     SATK is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     SATK is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with SATK.  If not, see <http://www.gnu.org/licenses/>.
+
+# This module provides a command line interface for running many ASMA assemblies
+# in parallel.
+#
+# Each line of a manifest file contains the asma.py command-line arguments of one
+# assembly, exactly as they would be entered following 'asma.py'.  Empty lines and
+# lines starting with a '#' are ignored.  Lines are split using shell quoting
+# rules.  Additional assemblies may be supplied by using the --asm argument.
+#
+# This process imports ASMA, configures each assembly and expands each targeted
+# MSL CPU definition once.  Each assembly is then run in a process forked from this
+# process, inheriting all of this preparation.  The outputs of an assembly are
+# the same as those created when asma.py is run with the same arguments.  Each
+# assembly still builds its own statement parsers, which are bound to its
+# Assembler object and take about a millisecond to create.  The console output of
+# each assembly is displayed after the assembly ends, in manifest sequence.
+#
+# The --stats argument reports the combined statistics of all assemblies.  An
+# assembly ending with errors is counted as failed.  An assembly skipped by the
+# asma.py --deps argument, because its output is current, is reported separately
+# and is left out of the totals and rates.
+
+this_module="asmabatch.py"
+copyright="%s Copyright (C) %s The SATK contributors" % (this_module,"2026")
+
+# Python imports:
+import sys               # Access the exit method
+if sys.hexversion<0x03030000:
+    raise NotImplementedError("%s requires Python version 3.3 or higher, "
+        "found: %s.%s" % (this_module,sys.version_info[0],sys.version_info[1]))
+import argparse          # Access the command line parser
+import io                # Access in-memory text streams
+import multiprocessing   # Access the process pool
+import os                # Access the CPU count
+import shlex             # Access shell-like argument splitting
+import time              # Access the timers
+import traceback         # Access exception reporting
+
+# Setup PYTHONPATH
+import satkutil          # Access utility functions
+satkutil.pythonpath("asma")
+satkutil.pythonpath("tools/lang")
+satkutil.pythonpath("tools/ipl")
+
+# ASMA imports
+import asma              # Access the ASMA command line interface
+import asmconfig         # Usage by ASMA of the configuration system
+import asmoper           # Access the shared expanded CPU definitions
+import assembler         # Access the assembler statistics
+
+
+# This class describes one assembly of the batch
+#
+# Instance Arguments:
+#   source   The source of the assembly's arguments, for example 'file:line'
+#   argv     The list of asma.py command-line arguments
+class BatchEntry(object):
+    def __init__(self,source,argv):
+        self.source=source
+        self.argv=argv
+        self.config=None      # The config.Config object of the assembly
+        self.msl=None         # The MSL file targeted by the assembly
+        self.cpu=None         # The CPU targeted by the assembly
+        self.error=None       # Configuration error text
+
+    def __str__(self):
+        return "%s: asma.py %s" % (self.source," ".join(self.argv))
+
+    # Configure the assembly exactly as asma.py does from its command line.
+    # Configuration errors are saved in the entry rather than ending this process.
+    def configure(self):
+        out=io.StringIO()
+        argv=sys.argv
+        stdout=sys.stdout
+        stderr=sys.stderr
+        sys.argv=["asma.py"]+self.argv
+        sys.stdout=sys.stderr=out
+        try:
+            self.config=asmconfig.asma().configure()
+            self.msl,self.cpu=asma.ASMA.select_target(self.config)
+        except SystemExit:
+            self.error=out.getvalue()
+        finally:
+            sys.argv=argv
+            sys.stdout=stdout
+            sys.stderr=stderr
+
+
+# This class manages the batch of assemblies
+#
+# Instance Argument:
+#   args     The argparse Namespace object of the command line
+class AsmaBatch(object):
+    def __init__(self,args):
+        self.args=args
+        self.entries=[]       # List of BatchEntry objects
+        self.jobs=args.jobs   # Number of concurrent assemblies
+        if self.jobs is None:
+            self.jobs=os.cpu_count() or 1
+
+    # Add the assemblies of a manifest file
+    def manifest(self,filename):
+        try:
+            fo=open(filename,"rt")
+        except OSError as oe:
+            print("%s could not open manifest file: %s" % (this_module,oe))
+            sys.exit(1)
+        with fo:
+            for lineno,line in enumerate(fo,start=1):
+                line=line.strip()
+                if len(line)==0 or line[0]=="#":
+                    continue
+                try:
+                    argv=shlex.split(line)
+                except ValueError as ve:
+                    print("%s %s:%s manifest line ignored: %s" \
+                        % (this_module,filename,lineno,ve))
+                    continue
+                self.entries.append(BatchEntry("%s:%s" % (filename,lineno),argv))
+
+    # Configure each assembly and expand each targeted CPU once
+    def prepare(self):
+        for entry in self.entries:
+            entry.configure()
+            if entry.error is not None:
+                continue
+            args=entry.config
+            try:
+                asmoper.OperMgr.share_machine(entry.cpu,entry.msl,\
+                    args["mslpath"],mslcache=args["mslcache"])
+            except Exception:
+                # The assembly itself reports the MSL processing failure
+                pass
+
+    # Run the batch of assemblies
+    # Returns:
+    #   the number of failed assemblies, including those ending with errors
+    def run(self):
+        total=assembler.AsmStatsTotal()
+        global batch
+        batch=self
+
+        runnable=[]
+        for n,entry in enumerate(self.entries):
+            if entry.error is None:
+                runnable.append(n)
+            else:
+                print("\n%s\n%s" % (entry,entry.error.rstrip()))
+                total.add(None)
+
+        # Each assembly gets a new process forked from this process.  This
+        # process's state is unchanged by an assembly, so each assembly starts in
+        # the same prepared state.
+        ctx=multiprocessing.get_context("fork")
+        with ctx.Pool(processes=self.jobs,maxtasksperchild=1) as pool:
+            for n,output,result,summary in pool.imap(assemble,runnable):
+                entry=self.entries[n]
+                print("\n%s" % entry)
+                if output:
+                    print(output,end="")
+                if result=="skipped":
+                    total.skip()
+                else:
+                    total.add(summary,errors=result=="errors")
+
+        # Caches used by this process while preparing the assemblies, for example
+        # the expanded CPU cache
+        total.add_caches(assembler.Stats.summary()["caches"])
+
+        if self.args.stats:
+            print(total.report())
+        return total.failed
+
+
+# The AsmaBatch object being run.  Forked processes find their entries here.
+batch=None
+
+# Run one assembly in a forked process
+# Returns:
+#   a tuple of the entry index, the console output of the assembly, its result and
+#   its statistics summary or None if it failed.  The result is one of:
+#     'completed'  the assembly completed without errors
+#     'errors'     the assembly completed with errors
+#     'skipped'    the assembly was skipped by --deps, its output is current
+#     'failed'     the assembly did not complete
+def assemble(n):
+    entry=batch.entries[n]
+    out=io.StringIO()
+    stdout=sys.stdout
+    stderr=sys.stderr
+    sys.stdout=sys.stderr=out
+    result="failed"
+    summary=None
+    try:
+        # The assembly's statistics start with this process
+        assembler.Stats=stats=assembler.AsmStats()
+        for tname in ["import_p","import_w"]:
+            stats.start(tname)
+            stats.stop(tname)
+        asma.process_start=asma.import_start=asma.objects_start=\
+            time.process_time()
+        asma.wall_start=asma.import_start_w=asma.objects_start_w=time.time()
+
+        tool=asma.ASMA(entry.config,assembler.Assembler.DM(),collect=True)
+        if tool.current:
+            tool.run()
+            result="skipped"
+        elif tool.run():
+            summary=stats.summary()
+            if tool.errors:
+                result="errors"
+            else:
+                result="completed"
+    except Exception:
+        traceback.print_exc(file=out)
+    finally:
+        sys.stdout=stdout
+        sys.stderr=stderr
+    return (n,out.getvalue(),result,summary)
+
+
+# Parse the command line arguments
+def parse_args():
+    parser=argparse.ArgumentParser(prog=this_module,
+        epilog=copyright,
+        description="run many ASMA assemblies in parallel")
+
+    parser.add_argument("manifest",nargs="*",metavar="MANIFEST",default=[],\
+        help="file of assemblies, one line of asma.py command-line arguments per "
+             "assembly.  Multiple may be specified.")
+
+    parser.add_argument("-a","--asm",action="append",default=[],metavar="ARGS",\
+        help="asma.py command-line arguments of an assembly as a single quoted "
+             "string.  May be used multiple times.")
+
+    parser.add_argument("-j","--jobs",type=int,metavar="N",\
+        help="number of concurrent assemblies.  Defaults to the number of CPUs")
+
+    parser.add_argument("--stats",action="store_true",default=False,\
+        help="report the combined statistics of all assemblies")
+
+    args=parser.parse_args()
+    if len(args.manifest)==0 and len(args.asm)==0:
+        parser.error("at least one MANIFEST or --asm argument is required")
+    if args.jobs is not None and args.jobs<1:
+        parser.error("--jobs must be at least 1: %s" % args.jobs)
+    return args
+
+if __name__ == "__main__":
+    args=parse_args()
+    print(copyright)
+    if "fork" not in multiprocessing.get_all_start_methods():
+        print("%s requires the fork process start method, not available on this "
+            "platform" % this_module)
+        sys.exit(1)
+    b=AsmaBatch(args)
+    for filename in args.manifest:
+        b.manifest(filename)
+    for n,line in enumerate(args.asm,start=1):
+        b.entries.append(BatchEntry("--asm %s" % n,shlex.split(line)))
+    b.prepare()
+    failed=b.run()
+    if failed:
+        sys.exit(1)
@@ -692,6 +692,14 @@ class BFP_Formatter(fp.FPAttr):
         self.quiet_msk=self.spmasks[1]               # Special value quite mask
         self.payload_msk=self.spmasks[2]             # Special value payload mask
 
+        # Exact decimal literal conversion.  Coefficients include the implied
+        # leading bit.
+        prec=self.attr.prec
+        self.implied=1 << (prec-1)                   # Implied leading bit
+        self.qmin=1-self.bias-(prec-1)               # Minimum coefficient exponent
+        self.qmax=self.bias-(prec-1)                 # Maximum coefficient exponent
+        self.scaler=fp.FP_Scaler(self.attr,self.qmin,self.qmax,subnormal=True)
+
     def __str__(self):
         return "BFP_Formatter: length:%s bias: %s" % (self.length,self.bias)
 
@@ -823,6 +831,23 @@ class BFP_Formatter(fp.FPAttr):
         # Convert to bytes
         return val.to_bytes(self.length,byteorder=byteorder,signed=False)
 
+    # Encode the result of an exact conversion into bytes
+    # Method Arguments:
+    #   val        the fp.FP_Scaled object being encoded
+    #   byteorder  The byte order of the bytes sequence.  Defaults to 'big'.
+    def encode_scaled(self,val,byteorder="big"):
+        if val.infinity:
+            return self._encode_special(val.sign,True,0,byteorder=byteorder)
+
+        if val.coef<self.implied:
+            # Zero or subnormal
+            bexp=0
+        else:
+            bexp=val.q+self.attr.prec-1+self.bias
+        bits=val.sign << self.sign_shift | bexp << self.exp_shift \
+            | val.coef & self.frac_mask
+        return bits.to_bytes(self.length,byteorder=byteorder,signed=False)
+
     # Decodes a bytes sequence as a number
     # Method Arguments:
     #   byts       the bytes sequence being decoded
@@ -1205,6 +1230,19 @@ class BFP(fp.FP):
             exp=fpo.iexp,rounding=self.rmodeo,format=self.formatter,debug=self.debug)
 
 
+# This class converts decimal literals exactly into a BFP interchange format using
+# scaled integers.  Special values are supported as by the BFP class.
+class BFP_Exact(fp.FP_Exact):
+    Special=BFP_Special()      # Special object for BFP special values
+
+    format={4:BFP_Formatter(4),
+            8:BFP_Formatter(8),
+            16:BFP_Formatter(16)}
+
+    def default(self):
+        return (fp.BFP_DEFAULT,None)
+
+
 if __name__ == "__main__":
     #raise NotImplementedError("%s - intended for import use only" % this_module)
     
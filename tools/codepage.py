@@ -30,6 +30,7 @@ if sys.hexversion<0x03030000:
     raise NotImplementedError("%s requires Python version 3.3 or higher, "
         "found: %s.%s" % (this_module,sys.version_info[0],sys.version_info[1]))
 import argparse       # Access Python command line parser
+import os             # Access code page file modification times
 
 # SATK imports:
 if __name__ == "__main__":
@@ -817,6 +818,15 @@ class Translation(object):
         return Translator(a2e,e2a,dumpa,dumpe)
 
 
+# Translator objects are shared.  A Translator built by CODEPAGE.build() is
+# reused for the same translation and code page file.  The functions codec() and
+# tables() return the shared Translator of a Python codec or of a pair of
+# translation tables.
+#
+# Each translation is a TransTable object whose precompiled 256-byte table is
+# applied with bytes.translate().  The methods accepting bytes also accept
+# bytearray and memoryview objects and translate the entire sequence in one
+# call.  Strings are translated as Latin-1 code points.
 class Translator(object):
     def __init__(self,a2e,e2a,dumpa,dumpe):
         self._a2e=a2e     # TransTable object for ASCII-to-EBCDIC
@@ -827,34 +837,57 @@ class Translator(object):
     # Translate ASCII string to EBCDIC string
     def a2e(self,string):
         return self._a2e.translate(string)
-    # Translate ASCII bytes list to EBCDIC bytes list
+    # Translate an ASCII string or bytes sequence to EBCDIC bytes
     def a2eb(self,b):
-        return self._a2e.translateb(b)
-    # Translate ASCII bytesarray to EBCDIC bytesarray
+        return self._a2e.translate_b(b)
+    # Translate an ASCII string or bytes sequence to an EBCDIC bytearray
     def a2eba(self,ba):
-        return self._a2e.translateba(ba)
+        return self._a2e.translate_ba(ba)
+    # Translate in place an ASCII bytearray or writable memoryview to EBCDIC
+    def a2e_into(self,buf):
+        self._a2e.translate_into(buf)
     # Translate EBCDIC string to ASCII string
     def e2a(self,string):
         return self._e2a.translate(string)
-    # Translate EBCDIC bytes list to ASCII bytes list
+    # Translate an EBCDIC string or bytes sequence to ASCII bytes
     def e2ab(self,b):
-        return self._e2a.translateb(b)
-    # Translate EBCDIC bytesarray, bytes list or integer list to an ASCII bytesarray
+        return self._e2a.translate_b(b)
+    # Translate an EBCDIC string or bytes sequence to an ASCII bytearray
     def e2aba(self,ba):
-        return self._e2a.translateba(ba)
+        return self._e2a.translate_ba(ba)
+    # Translate in place an EBCDIC bytearray or writable memoryview to ASCII
+    def e2a_into(self,buf):
+        self._e2a.translate_into(buf)
+    # Translate an EBCDIC bytes sequence to an ASCII string
+    def e2as(self,b):
+        return self._e2a.translate_s(b)
     # Do binary interpretation of a string, bytes list, integer list  or bytesarray 
     # into an ASCII string
     def dumpa(self,string):
         return self._dumpa.translate_s(string)
     # Do binary interpretation of a string, bytes list, integer list  or bytesarray 
     # into an EBCDIC string 
+    def dumpe(self,string):
         return self._dumpe.translate_s(string)
 
 # Helper class for translation tables
+#
+# Instance Argument:
+#   table   An optional sequence of 256 code points, as a string, bytes or
+#           bytearray, defining the complete translation.  The table is completed
+#           immediately.  Omit to define the table with mapping() and table().
 class TransTable(object):
-    def __init__(self):
+    def __init__(self,table=None):
         self._bytes=bytearray(range(256))
         self._table=None
+        if table is not None:
+            if isinstance(table,str):
+                table=table.encode("latin-1")
+            assert len(table)==256,\
+                "%s - %s 'table' argument must be 256 code points: %s" \
+                    % (this_module,self.__class__.__name__,len(table))
+            self._bytes[:]=table
+            self.table()
 
     # Defines a mapping from a source code point value to another
     def mapping(self,frm,to):
@@ -862,42 +895,80 @@ class TransTable(object):
 
     # Completes the table from the defined mappings.
     def table(self):
-        c=[]
-        for v in self._bytes:
-            c.append(chr(v))
-        self._table="".join(c)
+        self._table=self._bytes.decode("latin-1")
         self._bytes=bytes(self._bytes)
 
     # Translate a string into another string
     def translate(self,string):
         return string.translate(self._table)
 
-    # Translate a bytes list or integer list to a bytes list
-    def translate_b(self,b,string=False):
-        to=[]
-        tbl=self._bytes
-        for v in b:
-            to.append(tbl[v])  
-        return bytes(to)
+    # Translate a string, bytes, bytearray, memoryview or integer list to bytes
+    def translate_b(self,b):
+        if isinstance(b,str):
+            return b.encode("latin-1").translate(self._bytes)
+        if not isinstance(b,bytes):
+            b=bytes(b)
+        return b.translate(self._bytes)
 
-    # Translate a bytes list or bytesarray or integer list to a bytesarray
+    # Translate a string, bytes, bytearray, memoryview or integer list to a
+    # bytearray
     def translate_ba(self,b):
-        to=[]
-        tbl=self._bytes
-        for v in b:
-            to.append(tbl[v])
-        return bytesarray(to)
+        if isinstance(b,bytearray):
+            return b.translate(self._bytes)
+        return bytearray(self.translate_b(b))
+
+    # Translate in place a bytearray or writable memoryview
+    def translate_into(self,buf):
+        buf[:]=self.translate_b(buf)
 
     # Translate a string or integer based sequence into a string
     def translate_s(self,string):
         if isinstance(string,str):
             return string.translate(self._table)
-        # This is a different seqeence.
-        to=[]
-        tbl=self._table
-        for v in string:
-            to.append(tbl[v])
-        return "".join(to)
+        # This is a different sequence.
+        return self.translate_b(string).decode("latin-1")
+
+
+# Shared Translator objects of Python codecs and translation table pairs
+shared={}
+
+# Returns the shared Translator of a Python single byte EBCDIC codec.  The dump
+# translations replace ASCII control characters with a period.
+# Function Argument:
+#   name    the Python codec name, for example "cp037"
+# Exception:
+#   LookupError if the codec is not known by Python
+def codec(name):
+    try:
+        return shared[name]
+    except KeyError:
+        pass
+    ebcdic=bytes(range(256))
+    ascii=ebcdic.decode(name)
+    e2a=ascii.encode("latin-1",errors="replace")
+    a2e="".join(map(chr,range(256))).encode(name,errors="replace")
+    return tables(name,a2e,e2a)
+
+# Returns the shared Translator of a pair of translation tables.  The dump
+# translations replace ASCII control characters with a period.
+# Function Arguments:
+#   name    the name under which the Translator is shared
+#   a2e     the 256 code point ASCII-to-EBCDIC table
+#   e2a     the 256 code point EBCDIC-to-ASCII table
+def tables(name,a2e,e2a):
+    try:
+        return shared[name]
+    except KeyError:
+        pass
+    a2e=TransTable(table=a2e)
+    e2a=TransTable(table=e2a)
+    printable=bytearray(b".")*256
+    printable[0x20:0x7F]=bytes(range(0x20,0x7F))
+    printable=bytes(printable)
+    dumpa=TransTable(table=e2a._bytes.translate(printable))
+    dumpe=TransTable(table=e2a._bytes.translate(printable).translate(a2e._bytes))
+    trans=shared[name]=Translator(a2e,e2a,dumpa,dumpe)
+    return trans
 
 
 #
@@ -910,6 +981,9 @@ class TransTable(object):
 
 # This is the primary interface to the tool kit.  
 class CODEPAGE(sopl.SOPL):
+    # Built Translator objects by translation, code page file and its time stamp
+    translators={}
+
     def __init__(self,pathmgr=None):
         self.clists={}
         self.codepages={}
@@ -944,6 +1018,21 @@ class CODEPAGE(sopl.SOPL):
         return t.translator()
 
     def build(self,trans="94C",filename=None,fail=False):
+        key=(trans,filename)
+        if filename is not None:
+            try:
+                key=(trans,filename,os.stat(filename).st_mtime_ns)
+            except OSError:
+                pass
+        try:
+            return CODEPAGE.translators[key]
+        except KeyError:
+            pass
+        translator=self.__build(trans=trans,filename=filename,fail=fail)
+        CODEPAGE.translators[key]=translator
+        return translator
+
+    def __build(self,trans="94C",filename=None,fail=False):
         if filename is None:
             self.multiline(default,fail=fail)
         else:
@@ -956,10 +1045,7 @@ class CODEPAGE(sopl.SOPL):
                 % trans) from None
 
     def bytes2str(self,blist):
-        c=[]
-        for b in blist:
-            c.append(chr(b))
-        return bytes(c)
+        return bytes(blist).decode("latin-1")
 
     def register(self):
         self.regStmt("characters",parms=["a","e"])
@@ -967,10 +1053,7 @@ class CODEPAGE(sopl.SOPL):
         self.regStmt("translation",parms=["ebcdic","ascii","dumpa","dumpe"])
 
     def str2bytes(self,string):
-        b=[]
-        for n in range(len(string)):
-            b.append(ord(string[n]))
-        return bytes(b)
+        return string.encode("latin-1")
 
     def translation(self,name):
         return self.translations[name]
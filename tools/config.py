@@ -505,7 +505,8 @@ class Option(object):
     def cl(self,pargs):
         if self.use_cl:
             if self.full:
-                self._cl=pargs[self.full]
+                # argparse converts hyphens in long option names to underscores
+                self._cl=pargs[self.full.replace("-","_")]
             elif self.short:
                 self._cl=pargs[self.short]
             else:
@@ -2053,6 +2054,10 @@ class Config(object):
     def arg(self,arg):
         self._values[arg.name]=(arg.typ,arg.value)
 
+    # Returns a sorted list of the configured option names
+    def names(self):
+        return sorted(self._values.keys())
+
     # Displays CINFO data
     def display(self):
         if self._cinfo is None:
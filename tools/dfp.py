@@ -1945,6 +1945,34 @@ class declet(object):
 declet.cls_init()
 
 
+# Table driven densely-packed decimal codec.
+#
+# The declet objects above document the encoding.  Encoding or decoding a complete
+# trailing significand one declet object at a time is however costly.  These two
+# flat tables are built once from the declet objects when the module is imported
+# and are used by the tsig class:
+#
+#   DPD_ENCODE  1000 entries indexed by the three digit value 0-999 (the first digit
+#               being the hundreds).  Each entry is the canonical declet.
+#   DPD_DECODE  1024 entries indexed by any declet, canonical or not.  Each entry is
+#               the three digit value 0-999 of the declet.
+#
+# Because both tables are produced by the declet objects, the table codec is
+# bit-for-bit identical to them.  The dpd_check() function verifies this.  It is
+# run by the fp.py --check command-line argument.
+def dpd_tables():
+    encode=[]
+    for value in range(1000):
+        dlet=declet([value//100,value//10%10,value%10])
+        encode.append(dlet.declet)
+    decode=[]
+    for dec in range(1024):
+        decode.append(declet(dec).to_int())
+    return (encode,decode)
+
+DPD_ENCODE,DPD_DECODE=dpd_tables()
+
+
 # These classes support encoding and decoding of the trailing significand field.
 # Digit encoding requires exactly the number of digits supported by the interhange
 # format.
@@ -1997,6 +2025,29 @@ class tsig(object):
     def decode(self,bits):
         assert isinstance(bits,int),\
             "%s 'bits' argument must be an integer: %s" % (eloc(self,"decode"),bits)
+        self.bits=bits
+        self.do=[]
+
+        # Declets are extracted from left to right so the coefficient accumulates
+        # in the same order in which the digits were encoded.
+        table=DPD_DECODE
+        coef=0
+        for shift in range((self.declets-1)*10,-10,-10):
+            coef = coef * 1000 + table[(bits >> shift) & 0b1111111111]
+
+        digits=[int(d) for d in "%0*d" % (self.digits,coef)]
+        self.decimals=digits
+        return digits
+
+    # Decode the Densely-Packed Decimal encoding using a declet object for each
+    # declet.  This is the reference implementation for the table driven decode()
+    # method.  The declet objects are retained for the info() method.
+    # Returns:
+    #   a list of integer digits.
+    def decode_declets(self,bits):
+        assert isinstance(bits,int),\
+            "%s 'bits' argument must be an integer: %s" \
+                % (eloc(self,"decode_declets"),bits)
         self.bits=declets=bits
 
         # This loop extracts declets from the right to the left within the
@@ -2036,6 +2087,26 @@ class tsig(object):
         if __debug__ or debug:
             self._ck_digits(digits)
 
+        self.decimals=digits
+        self.do=[]
+        table=DPD_ENCODE
+        bits=0
+
+        # Encode declets from left to right.
+        for n in range(0,self.digits,3):
+            bits = bits << 10 | table[digits[n]*100 + digits[n+1]*10 + digits[n+2]]
+
+        self.bits=bits
+        return bits
+
+    # Encode the list or tuple of digits using a declet object for each declet.
+    # This is the reference implementation for the table driven encode() method.
+    # Returns:
+    #   an integer representing the encoding.
+    def encode_declets(self,digits,debug=False):
+        if __debug__ or debug:
+            self._ck_digits(digits)
+
         self.decimals=digits  
         bits=0
         do=[]
@@ -2054,7 +2125,11 @@ class tsig(object):
         self.do=do
         return bits
 
+    # Display the declets of the trailing significand.  Declet objects are created
+    # when the table driven encode() or decode() methods were used.
     def info(self,string=False):
+        if not self.do and self.bits is not None:
+            self.decode_declets(self.bits)
         s=""
         for n,d in enumerate(self.do):
             s="%s[%02d] %s\n" % (s,n,d)
@@ -3576,6 +3651,51 @@ class DFP_Test(fp.Test):
         return DFP.from_bytes(byts,byteorder="big",debug=self.debug)
 
 
+# This function verifies the table driven trailing significand codec against the
+# declet objects, bit-for-bit.
+#
+# Function Arguments:
+#   count  The number of random coefficients checked for each interchange format.
+#          Defaults to 10000.
+#   seed   The random number generator seed.  Defaults to 0.
+# Returns:
+#   the number of mismatches found.  Each mismatch is printed.
+def dpd_check(count=10000,seed=0):
+    import random
+    rand=random.Random(seed)
+    errors=0
+
+    # Every declet and every three digit value
+    for dec in range(1024):
+        if DPD_DECODE[dec]!=declet(dec).to_int():
+            print("declet %s decodes to %s" % (bin(dec),DPD_DECODE[dec]))
+            errors+=1
+    for value in range(1000):
+        digits=[value//100,value//10%10,value%10]
+        if DPD_ENCODE[value]!=declet(digits).declet:
+            print("digits %s encode to %s" % (digits,bin(DPD_ENCODE[value])))
+            errors+=1
+
+    # Complete trailing significands of 6, 15 and 33 digits.  The leading digit of
+    # the 7, 16 and 34 digit coefficients is encoded in the combination field.
+    for cls in [tsig32,tsig64,tsig128]:
+        fast=cls()
+        ref=cls()
+        for n in range(count):
+            coef=rand.randrange(10**fast.digits)
+            digits=[int(d) for d in "%0*d" % (fast.digits,coef)]
+            bits=ref.encode_declets(digits)
+            if fast.encode(digits)!=bits:
+                print("%s encode mismatch: %s" % (cls.__name__,digits))
+                errors+=1
+            # Include non-canonical declets when decoding
+            bits=rand.getrandbits(fast.declets*10)
+            if fast.decode(bits)!=ref.decode_declets(bits):
+                print("%s decode mismatch: %s" % (cls.__name__,hex(bits)))
+                errors+=1
+    return errors
+
+
 # This function outputs various information about decimal floating point values
 # and class related information about this module.
 #
@@ -103,13 +103,19 @@
 #   binary floating point -      partially implemented by bfp.py, bfp_float.py and
 #                                bfp_gmpy2.py
 #   decimal floating point -     implemented by dfp.py
-#   hexadecimal floating point - not implemented
+#   hexadecimal floating point - implemented by hfp.py for decimal literals
+#
+# Decimal literals of binary and hexadecimal floating point constants are converted
+# exactly with scaled integers by the FP_Exact class.  See the Exact Scaled Integer
+# Conversion section below.
 
 
 this_module="fp.py"
 copyright="%s Copyright (C) %s Harold Grovesteen" % (this_module,"2016")
 
 # Python imports:
+import collections  # Access OrderedDict for the conversion result cache
+import os       # Access the cache file path
 import re       # Access regular expressions
 import sys      # Access system information
 
@@ -249,12 +255,16 @@ def String_Pattern(spaces=False,eos=True):
 #   debug     Specify True to enable debugging messages.  Defaults to False.
 
 def BFP(string,length=8,rmode=None,mo=None,debug=False):
+    if FP.literal(string):
+        # Decimal literals are converted exactly using scaled integers
+        return bfp.BFP_Exact(string,length=length,rmode=rmode,debug=debug)
+
     if bfp_gmpy2.use_gmpy2:
         # Using gmpy2 instead of float
-        return bfp_gmpy2.BFP(string,length=length,rmode=rmode,mo=mo,debug=debug)
+        return bfp_gmpy2.BFP(string,length=length,rmode=rmode,debug=debug)
 
     # Using default Python float object
-    return bfp_float.BFP(string,length=length,rmode=rmode,mo=mo,debug=debug)
+    return bfp_float.BFP(string,length=length,rmode=rmode,debug=debug)
 
 
 
@@ -293,7 +303,7 @@ def DFP(string,length=8,rmode=None,mo=None,special=None,debug=False):
 #   debug     Specify True to enable debugging messages.  Defaults to False.
 
 def HFP(string,length=8,rmode=None,mo=None,debug=False):
-    raise NotImplementedError("hexadecimal floating point not yes supported")
+    return hfp.HFP(string,length=length,rmode=rmode,debug=debug)
 
 
 # Convert a sequence of bytes into a Python object.  The object returned
@@ -331,7 +341,229 @@ def from_bytes(typ,byts,byteorder="little",debug=False):
     else:
         raise ValueError("%s - from_bytes() - argument 'typ' must be 'b', 'd' or "\
             "'h': %s" % (this_module,typ))
-      
+
+
+#
+# +-------------------------------+
+# |                               |
+# |    Conversion Result Cache    |
+# |                               |
+# +-------------------------------+
+#
+
+# The same floating point constant is frequently converted many times, for example
+# by macro generated statements or a literal referenced by many statements.  Each
+# conversion builds the internal representation and its formatter objects only to
+# produce the same few bytes.  The FP_Cache object remembers the result of each
+# conversion by the constant's type, length, rounding mode and nominal value.
+#
+# A single process-wide FP_Cache object is provided by the module attribute
+# fp.Cache.  It is bounded, discarding the least recently used result when full.
+# Conversions raising an FPError are not cached.
+#
+# The cached results may be saved in a directory and loaded by a later process.
+# Loading merges the saved results with those already cached.  The cache file is
+# read and written by a satkutil.CacheFile object, which rejects a file saved by
+# different conversion code.
+
+
+# The result of a cached conversion.  It provides the same methods used by the
+# ASMA assembler from a FP object.
+# Instance Arguments:
+#   data       The interchange format as a sequence of bytes in big-endian order
+#   overflow   Whether the conversion overflowed
+#   underflow  Whether the conversion underflowed
+class FP_Result(object):
+    __slots__=["data","overflow","underflow"]
+    def __init__(self,data,overflow,underflow):
+        self.data=data
+        self.overflow=overflow
+        self.underflow=underflow
+
+    def __str__(self):
+        return "%s(data=%s,overflow=%s,underflow=%s)" % (self.__class__.__name__,\
+            self.data.hex().upper(),self.overflow,self.underflow)
+
+    def has_overflow(self):
+        return self.overflow
+
+    def has_underflow(self):
+        return self.underflow
+
+    def to_bytes(self,byteorder="big"):
+        if byteorder=="big":
+            return self.data
+        return self.data[::-1]
+
+
+# Process-wide cache of conversion results
+# Instance Argument:
+#   size   The maximum number of cached results.  Defaults to FP_Cache.size.
+class FP_Cache(object):
+    size=8192           # Default maximum number of cached results
+    ext="fpc"           # Cache file extension
+    name="fpconv"       # Cache file name within the cache directory
+
+    # Conversion functions by constant type
+    convert_type={"b":lambda string,length,rmode,special,debug:\
+                      BFP(string,length=length,rmode=rmode,debug=debug),
+                  "d":lambda string,length,rmode,special,debug:\
+                      DFP(string,length=length,rmode=rmode,special=special,\
+                          debug=debug),
+                  "h":lambda string,length,rmode,special,debug:\
+                      HFP(string,length=length,rmode=rmode,debug=debug)}
+
+    # Returns the cache key of a conversion
+    # Method Arguments:
+    #   typ      The constant type: 'b', 'd' or 'h'.  See the from_bytes() function.
+    #   string   The constant's nominal string or ASMA parsed dictionary
+    #   length   The length of the constant in bytes
+    #   rmode    The rounding mode when not embedded in the string
+    #   special  The special value string or None
+    @staticmethod
+    def key(typ,string,length,rmode,special):
+        if special is not None:
+            return (typ,length,rmode,special)
+        if isinstance(string,dict):
+            string=string["string"]
+        return (typ,length,rmode,string)
+
+    def __init__(self,size=None):
+        if size is None:
+            self.size=FP_Cache.size
+        else:
+            self.size=size
+        # Cached FP_Result objects in least to most recently used sequence
+        self.entries=collections.OrderedDict()
+        self.loaded=set()     # Directories whose results have been loaded
+        self.added=0          # Results added since the cache was loaded or saved
+        self.files=None       # satkutil.CacheFile object.  See cache_files() method
+
+        # Statistics of cache usage
+        self.hits=0
+        self.misses=0
+
+    def __len__(self):
+        return len(self.entries)
+
+    # Adds a conversion result to the cache, discarding the least recently used
+    # result when the cache is full.
+    def add(self,key,result):
+        entries=self.entries
+        entries[key]=result
+        if len(entries)>self.size:
+            entries.popitem(last=False)
+        self.added+=1
+
+    # Removes all cached results and resets the statistics
+    def clear(self):
+        self.entries.clear()
+        self.loaded=set()
+        self.added=0
+        self.hits=self.misses=0
+
+    # Converts a floating point constant, returning a cached result when the same
+    # constant has already been converted.
+    # Method Arguments:
+    #   typ      The constant type: 'b', 'd' or 'h'.  See the from_bytes() function.
+    #   string   The constant's nominal string or ASMA parsed dictionary.  Specify
+    #            None for a special value.
+    #   length   The length of the constant in bytes.  Defaults to 8.
+    #   rmode    The rounding mode when not embedded in the string.  Defaults to
+    #            None.
+    #   special  The decimal floating point special value or None.  Defaults to
+    #            None.
+    #   stats    An additional object whose 'hits' and 'misses' attributes are
+    #            incremented, for example an ASMA AsmCacheStats object.  Defaults
+    #            to None.
+    #   debug    Specify True to enable debugging messages.  Defaults to False.
+    # Returns:
+    #   a FP_Result object
+    # Exception:
+    #   FPError if the conversion fails
+    def convert(self,typ,string,length=8,rmode=None,special=None,stats=None,\
+                debug=False):
+        key=FP_Cache.key(typ,string,length,rmode,special)
+        try:
+            result=self.entries[key]
+        except KeyError:
+            result=None
+
+        if result is not None and not debug:
+            self.entries.move_to_end(key)
+            self.hits+=1
+            if stats is not None:
+                stats.hits+=1
+            return result
+
+        self.misses+=1
+        if stats is not None:
+            stats.misses+=1
+        try:
+            cvt=FP_Cache.convert_type[typ]
+        except KeyError:
+            raise ValueError("%s argument 'typ' must be 'b', 'd' or 'h': %s" \
+                % (eloc(self,"convert"),typ)) from None
+        fpo=cvt(string,length,rmode,special,debug)
+        result=FP_Result(fpo.to_bytes(),fpo.has_overflow(),fpo.has_underflow())
+        self.add(key,result)
+        return result
+
+    # Returns the path of the cache file in a directory
+    def cache_file(self,directory):
+        return os.path.join(directory,"%s.%s" % (FP_Cache.name,FP_Cache.ext))
+
+    # Returns the satkutil.CacheFile object reading and writing the cache file.  It
+    # is created when first needed, after the conversion modules are imported.  The
+    # cache file header holds a fingerprint of this module and of each module
+    # performing the conversions, so a change to any of them discards the saved
+    # results.
+    def cache_files(self):
+        if self.files is None:
+            self.files=satkutil.CacheFile([sys.modules[__name__],\
+                bfp_float,bfp_gmpy2,bfp,dfp,hfp])
+        return self.files
+
+    # Loads the results saved in a directory.  Each directory is loaded once per
+    # process.  A missing, stale or unreadable cache file is ignored.
+    # Returns:
+    #   the number of results loaded
+    def load(self,directory):
+        if directory in self.loaded:
+            return 0
+        self.loaded.add(directory)
+        saved=self.cache_files().load(self.cache_file(directory),{})
+        if saved is None:
+            # Any problem with the cache file simply leaves the cache unchanged
+            return 0
+
+        # Saved results are less recently used than those already cached
+        entries=self.entries
+        merged=collections.OrderedDict()
+        for key,(data,overflow,underflow) in saved:
+            if key not in entries:
+                merged[key]=FP_Result(data,overflow,underflow)
+        merged.update(entries)
+        while len(merged)>self.size:
+            merged.popitem(last=False)
+        self.entries=merged
+        return len(saved)
+
+    # Saves the cached results in a directory when new results have been added.
+    # Failure to write the cache is not an error.
+    def save(self,directory):
+        if not self.added:
+            return
+        saved=[(key,(r.data,r.overflow,r.underflow)) \
+            for key,r in self.entries.items()]
+        if not self.cache_files().save(self.cache_file(directory),{},saved):
+            return
+        self.loaded.add(directory)
+        self.added=0
+
+# The process-wide conversion result cache
+Cache=FP_Cache()
+
 
 
 #
@@ -675,11 +907,11 @@ class FP_Number(object):
             a=addend[n]
             r=d+a+carry
             incarry=carry
-            if r<10:
+            if r<self.base:
                 result[n]=r
                 carry=0
             else:
-                r=r-10
+                r=r-self.base
                 carry=1
                 result[n]=r
             if __debug__:
@@ -1150,6 +1382,348 @@ class FP_Number(object):
 # Initialize the rounding mode dictionaries
 FP_Number.init()
 
+
+#
+# +-----------------------------------------+
+# |                                         |
+# |    Exact Scaled Integer Conversion      |
+# |                                         |
+# +-----------------------------------------+
+#
+
+# A decimal literal is an integer, N, scaled by a power of ten: N * 10**E.  A binary
+# or hexadecimal floating point number is an integer coefficient, C, of the format's
+# precision in the format's base, B, scaled by a power of the base: C * B**Q.  The
+# coefficient of a normal number is B**(prec-1) <= C < B**prec.
+#
+# Python's integers are unbounded, so the literal may be converted exactly.  Both
+# scaled integers are brought to a common scale and one integer division produces
+# the coefficient and the remainder.  Comparing twice the remainder to the divisor
+# tells whether the discarded portion is less than, equal to or greater than half a
+# unit of the coefficient, which is all any rounding mode needs.
+#
+# The digit list rounding of the FP_Number class remains the reference for this
+# conversion.  The FP_Scaler.reference() method generates the coefficient digits
+# one at a time and rounds them with the FP_Number rounding mode methods.  The
+# exact_check() function verifies both produce identical results.
+
+# The result of an exact conversion
+# Instance Arguments:
+#   sign   The sign of the value.  0 for positive.  1 for negative.
+#   coef   The rounded integer coefficient
+#   q      The signed exponent of the coefficient's units digit
+class FP_Scaled(object):
+    def __init__(self,sign,coef,q):
+        self.sign=sign           # The sign of the value
+        self.coef=coef           # The integer coefficient
+        self.q=q                 # The exponent of the coefficient's units digit
+        self.inexact=False       # Whether rounding discarded a non-zero remainder
+        self.infinity=False      # Whether overflow produced an infinity
+
+        # Conditions.  All are mutually exclusive
+        self.overflow=False      # The rounded value exceeds the format
+        self.subnormal=False     # The value is below the normal range
+        self.underflow=False     # The non-zero value rounded to zero
+
+    def __str__(self):
+        return "FP_Scaled sign:%s coef:0x%X q:%s inexact:%s infinity:%s "\
+            "overflow:%s subnormal:%s underflow:%s" \
+                % (self.sign,self.coef,self.q,self.inexact,self.infinity,\
+                    self.overflow,self.subnormal,self.underflow)
+
+    # Returns a tuple of the result suitable for comparisons
+    def key(self):
+        return (self.sign,self.coef,self.q,self.inexact,self.infinity,\
+            self.overflow,self.subnormal,self.underflow)
+
+
+# The digit list reference conversion uses the FP_Number rounding methods directly.
+class FP_Digits(FP_Number):
+    def __init__(self,sign,exp,coef,attr,rounding=None,debug=False):
+        super().__init__(sign,exp,coef,attr.base,attr,rounding=rounding,debug=debug)
+
+
+# This class converts decimal literals into the coefficient and exponent of one
+# binary or hexadecimal interchange format.
+#
+# Instance Arguments:
+#   attr       The FPAttr object of the format.  It supplies the base and precision.
+#   qmin       The minimum exponent of a coefficient's units digit
+#   qmax       The maximum exponent of a coefficient's units digit
+#   subnormal  Specify True if values below the normal range are subnormalized.
+#              Specify False if the value underflows to zero.  Defaults to True.
+class FP_Scaler(object):
+    log2_10=3.321928094887362   # Bits per decimal digit
+
+    def __init__(self,attr,qmin,qmax,subnormal=True):
+        self.attr=attr
+        self.base=attr.base                  # The format's base: 2 or 16
+        self.prec=attr.prec                  # The format's precision in base digits
+        self.shift=attr.base.bit_length()-1  # Bits per base digit
+        self.qmin=qmin
+        self.qmax=qmax
+        self.subnormal=subnormal
+
+        self.low=self.base**(self.prec-1)    # Smallest normal coefficient
+        self.high=self.base**self.prec       # Coefficient overflow
+
+        # Bounds, in bits, of values that certainly overflow or are certainly too
+        # small to affect the result except through the rounding mode.  Values
+        # between the bounds are converted exactly.
+        self.huge=(qmax+self.prec)*self.shift+1
+        if subnormal:
+            self.tiny=qmin*self.shift-3
+        else:
+            self.tiny=(qmin+self.prec-1)*self.shift-3
+
+        # Rounding decisions by rounding mode number.  Binary and hexadecimal
+        # floating point use the same numbers.
+        self.modes={1:self._inc_half_up,
+                    4:self._inc_half_even,
+                    5:self._inc_down,
+                    6:self._inc_ceiling,
+                    7:self._inc_floor}
+
+    def __str__(self):
+        return "FP_Scaler base:%s prec:%s qmin:%s qmax:%s subnormal:%s" \
+            % (self.base,self.prec,self.qmin,self.qmax,self.subnormal)
+
+  #
+  # Rounding decisions
+  #
+  # Method Arguments:
+  #   sign     The sign of the value
+  #   coef     The truncated coefficient
+  #   half     The discarded portion compared to half a unit: -1, 0, or 1
+  #   inexact  Whether the discarded portion is not zero
+  # Returns:
+  #   True if the truncated coefficient is incremented, False otherwise.
+
+    def _inc_ceiling(self,sign,coef,half,inexact):
+        return inexact and sign == 0
+
+    def _inc_down(self,sign,coef,half,inexact):
+        return False
+
+    def _inc_floor(self,sign,coef,half,inexact):
+        return inexact and sign == 1
+
+    def _inc_half_even(self,sign,coef,half,inexact):
+        return half>0 or ( half==0 and coef & 1 == 1 )
+
+    def _inc_half_up(self,sign,coef,half,inexact):
+        return half>=0
+
+  #
+  # Conversion steps shared by the exact and reference conversions
+  #
+
+    # Returns the rounding decision method of a rounding mode number
+    # Exception:
+    #   FPError if the rounding mode is not supported
+    def _decision(self,rmode):
+        try:
+            return self.modes[rmode]
+        except KeyError:
+            raise FPError(msg="base %s rounding mode not supported: %s" \
+                % (self.base,rmode)) from None
+
+    # Classify the rounded coefficient and exponent for the format's range.
+    # Returns:
+    #   the completed FP_Scaled object
+    def _finish(self,result,inc):
+        if result.q>self.qmax:
+            return self._overflow(result.sign,inc)
+        if result.coef == 0:
+            # A non-zero value rounded to zero
+            result.q=0
+            result.underflow=True
+        elif result.q<self.qmin:
+            # Only occurs without subnormalization
+            result.coef=0
+            result.q=0
+            result.underflow=True
+        elif result.coef<self.low:
+            result.subnormal=True
+        return result
+
+    # Returns the decimal magnitude of a literal relative to the format:
+    #    1  the value certainly overflows
+    #   -1  the value is certainly below half the smallest unit of the format
+    #    0  the value must be converted
+    def _magnitude(self,n,e10):
+        # lower <= log2(value) < lower+1
+        lower=n.bit_length()-1+e10*FP_Scaler.log2_10
+        if lower >= self.huge:
+            return 1
+        if lower+1 <= self.tiny:
+            return -1
+        return 0
+
+    # Returns the result of an overflow.  It is an infinity when the rounding mode
+    # would increment the largest coefficient, otherwise the largest finite value.
+    def _overflow(self,sign,inc):
+        result=FP_Scaled(sign,self.high-1,self.qmax)
+        result.inexact=True
+        result.overflow=True
+        result.infinity=inc(sign,result.coef,1,True)
+        return result
+
+  #
+  # Conversions
+  #
+
+    # Convert a decimal literal exactly using scaled integers.
+    # Method Arguments:
+    #   sign    The sign of the literal.  0 for positive.  1 for negative.
+    #   n       The literal's digits as an unsigned integer
+    #   e10     The decimal exponent of the integer's units digit
+    #   rmode   The rounding mode number
+    # Returns:
+    #   a FP_Scaled object
+    # Exception:
+    #   FPError if the rounding mode is not supported
+    def convert(self,sign,n,e10,rmode):
+        inc=self._decision(rmode)
+        if n == 0:
+            return FP_Scaled(sign,0,0)
+
+        mag=self._magnitude(n,e10)
+        if mag>0:
+            return self._overflow(sign,inc)
+        if mag<0:
+            # The value is below half of the smallest unit of the format
+            coef,q,half,inexact=0,self.qmin,-1,True
+            if not self.subnormal:
+                q-=1
+        else:
+            if e10>=0:
+                num=n*10**e10
+                den=1
+            else:
+                num=n
+                den=10**-e10
+
+            # Estimate the exponent from the bit lengths, then correct it.
+            shift=self.shift
+            q=(num.bit_length()-den.bit_length())//shift-self.prec+1
+            while True:
+                if q<self.qmin and self.subnormal:
+                    # Values below the normal range keep the minimum exponent
+                    q=self.qmin
+                if q>=0:
+                    divisor=den << q*shift
+                    coef,rem=divmod(num,divisor)
+                else:
+                    divisor=den
+                    coef,rem=divmod(num << -q*shift,divisor)
+                if coef>=self.high:
+                    q+=1
+                elif coef<self.low and (q>self.qmin or not self.subnormal):
+                    q-=1
+                else:
+                    break
+
+            inexact=rem != 0
+            rem2=rem << 1
+            if rem2<divisor:
+                half=-1
+            elif rem2 == divisor:
+                half=0
+            else:
+                half=1
+
+        if inexact and inc(sign,coef,half,inexact):
+            coef+=1
+            if coef == self.high:
+                coef=self.low
+                q+=1
+
+        result=FP_Scaled(sign,coef,q)
+        result.inexact=inexact
+        return self._finish(result,inc)
+
+    # Convert a decimal literal using coefficient digit lists rounded by the
+    # FP_Number rounding methods.  This is the reference for the convert() method
+    # and accepts the same arguments.
+    def reference(self,sign,n,e10,rmode,debug=False):
+        inc=self._decision(rmode)
+        if n == 0:
+            return FP_Scaled(sign,0,0)
+
+        prec=self.prec
+        emin=self.qmin+prec-1       # Minimum exponent of the leading digit
+        mag=self._magnitude(n,e10)
+        if mag>0:
+            return self._overflow(sign,inc)
+        if mag<0:
+            # Non-zero digits well beyond the rounding digit
+            digits=[0,]*(prec+1)
+            digits.append(1)
+            exp=emin-1
+        else:
+            if e10>=0:
+                digits,exp=self._expand(n*10**e10,1)
+            else:
+                digits,exp=self._expand(n,10**-e10)
+
+        if exp<emin and self.subnormal:
+            # Subnormalize the digits by shifting them right
+            zeros=emin-exp
+            if zeros>prec:
+                digits=[0,]*(prec+1)
+                digits.append(1)
+            else:
+                digits=[0,]*zeros+digits
+            exp=emin
+
+        inexact=not FP_Number.all_zeros(digits[prec:])
+        number=FP_Digits(sign,exp,digits,self.attr,rounding=rmode,debug=debug)
+        number.round(prec,luv=True)
+
+        coef=int(number._list2str(number.coef),self.base)
+        result=FP_Scaled(sign,coef,number.exp-prec+1)
+        result.inexact=inexact
+        return self._finish(result,inc)
+
+    # Expand the quotient of two integers into base digits.
+    # Returns:
+    #   a tuple: tuple[0] a list of the leading non-zero digit, the following
+    #                     precision digits and a final digit of 1 if any further
+    #                     digits are not zero, otherwise 0.
+    #            tuple[1] the exponent of the leading digit
+    def _expand(self,num,den):
+        base=self.base
+        count=self.prec+1
+        ipart,rem=divmod(num,den)
+
+        # Integer digits
+        digits=[]
+        while ipart:
+            ipart,digit=divmod(ipart,base)
+            digits.append(digit)
+        digits.reverse()
+        exp=len(digits)-1
+
+        # Skip leading zero fraction digits
+        if not digits:
+            while True:
+                digit,rem=divmod(rem*base,den)
+                if digit:
+                    digits.append(digit)
+                    break
+                exp-=1
+
+        # Fraction digits
+        while len(digits)<count:
+            digit,rem=divmod(rem*base,den)
+            digits.append(digit)
+
+        sticky=rem != 0 or not FP_Number.all_zeros(digits[count:])
+        digits=digits[:count]
+        digits.append(int(sticky))
+        return (digits,exp)
+
 #
 # +-------------------------------------+
 # |                                     |
@@ -1305,6 +1879,25 @@ class FP(object):
             b.append(byt)
         return bytes(b)
 
+    # Returns whether a floating point constant is a decimal literal, that is,
+    # it contains integer or fraction digits and is not a special value.
+    # Method Argument:
+    #   string   A constant string or the dictionary of an already parsed constant
+    #            as accepted when instantiating the FP object.
+    @staticmethod
+    def literal(string):
+        if isinstance(string,str):
+            mo=FP.parse.match(string)
+            if mo is None:
+                return False
+            mod=mo.groupdict()
+        elif isinstance(string,dict):
+            mod=string
+        else:
+            return False
+        frac=mod["frac"]
+        return mod["int"] is not None or (frac is not None and len(frac)>1)
+
     # Convert a sequence of bytes into a Python object.  The object returned
     # depends upon the subclass supplying this method.
     # Method Arguments:
@@ -1590,6 +2183,75 @@ class FP(object):
             % self.__class__.__name__)
 
 
+# This class is the base class for floating point objects whose decimal literals
+# are converted exactly by a FP_Scaler object.  The subclass supplies the 'format'
+# class attribute, a dictionary by length of formatter objects.  Each formatter
+# provides a 'scaler' attribute, the FP_Scaler object of its format, and an
+# encode_scaled() method creating the interchange format from a FP_Scaled object.
+#
+# Instance Arguments:
+#   string     See the FP class
+#   length     See the FP class
+#   rmode      The rounding mode number used when not embedded in the constant
+#              string.  Specify None for the default rounding mode.  Defaults to
+#              None.
+#   reference  Specify True to use the digit list reference conversion.  Specify
+#              False to use the scaled integer conversion.  Defaults to False.
+#   debug      See the FP class
+class FP_Exact(FP):
+    format=None    # Dictionary of formatter objects supplied by the subclass
+
+    def __init__(self,string,length=8,rmode=None,reference=False,debug=False):
+        try:
+            self.formatter=self.__class__.format[length]
+        except KeyError:
+            raise FPError(msg="floating point length must be 4, 8, or 16: %s" \
+                % length) from None
+        self.attr=self.formatter.attr
+        self.scaler=self.formatter.scaler
+        self.reference=reference
+        super().__init__(string,length=length,rmode=rmode,debug=debug)
+
+  #
+  # These methods are required by super class.
+  #
+
+    # Convert the parsed decimal literal into a FP_Scaled object
+    def create(self):
+        digits="%s%s" % (self.int_str,self.frac_str)
+        digits=digits.replace(" ","")
+        e10=-len(self.frac_str.replace(" ",""))
+        if self.exponent is not None:
+            e10+=self.exponent
+        if self.reference:
+            fpo=self.scaler.reference(self.sign,int(digits,10),e10,self.rmodeo,\
+                debug=self.debug)
+        else:
+            fpo=self.scaler.convert(self.sign,int(digits,10),e10,self.rmodeo)
+        if __debug__:
+            if self.debug:
+                print("%s %s" % (eloc(self,"create"),fpo))
+        return fpo
+
+    def has_overflow(self):
+        return self.fpo.overflow
+
+    def has_underflow(self):
+        return self.fpo.underflow
+
+    def i_fmt(self,byteorder="big"):
+        return self.formatter.encode_scaled(self.number,byteorder=byteorder)
+
+    def is_subnormal(self):
+        return self.fpo.subnormal
+
+    def rounding(self,rnum):
+        return rnum
+
+    def to_number(self,fpo):
+        return fpo
+
+
 #
 # +--------------------------------------+
 # |                                      |
@@ -1778,6 +2440,131 @@ class Test(object):
                 % (eloc(self,"convert_bytes_to_object"),self.__class__.__name__))
 
 
+#
+# +------------------------------------------+
+# |                                          |
+# |    Exact Conversion Cross-Check          |
+# |                                          |
+# +------------------------------------------+
+#
+
+# Returns a dictionary of the DC constant types converted exactly.  Each entry is a
+# tuple of the FP_Exact subclass and the constant's length.
+def exact_types():
+    return {"EB":(bfp.BFP_Exact,4),
+            "DB":(bfp.BFP_Exact,8),
+            "LB":(bfp.BFP_Exact,16),
+            "E": (hfp.HFP,4),
+            "D": (hfp.HFP,8),
+            "L": (hfp.HFP,16)}
+
+# Returns a decimal literal exactly equal to coef * 2**exp2
+def exact_literal(sign,coef,exp2):
+    if sign:
+        sign="-"
+    else:
+        sign=""
+    if exp2>=0:
+        return "%s%d" % (sign,coef << exp2)
+    return "%s%dE%d" % (sign,coef*5**-exp2,exp2)
+
+# Returns a list of tuples of a DC constant type and a decimal literal.  For each
+# type the list contains:
+#   - the boundaries of the format: one, the largest, the smallest normal and
+#     the smallest subnormal values and the values just beyond them,
+#   - the exact midpoints between these values and their neighbors, and the
+#     literals just above and below each midpoint,
+#   - random midpoints between adjacent values of the format, and
+#   - random decimal literals throughout the format's range.
+# Function Arguments:
+#   count   The number of random literals of each kind for each type
+#   seed    The random number generator seed
+def exact_corpus(count=200,seed=0):
+    import random
+    # Exact literals of the extended formats may have thousands of digits
+    if hasattr(sys,"set_int_max_str_digits"):
+        sys.set_int_max_str_digits(0)
+    rand=random.Random(seed)
+    corpus=[]
+    for typ,(cls,length) in sorted(exact_types().items()):
+        scaler=cls.format[length].scaler
+        shift=scaler.shift
+        prec=scaler.prec
+        qmin=scaler.qmin
+        qmax=scaler.qmax
+
+        # Boundary values as coefficient and exponent
+        points=[(scaler.low,1-prec),          # One
+                (scaler.high-1,qmax),         # Largest value
+                (scaler.high,qmax),           # Beyond the largest value
+                (scaler.low,qmin),            # Smallest normal value
+                (scaler.low-1,qmin),          # Below the smallest normal value
+                (1,qmin),                     # Smallest subnormal value
+                (1,qmin-1)]                   # Below the smallest subnormal value
+        for n in range(count):
+            points.append((rand.randrange(scaler.low,scaler.high),\
+                rand.randint(qmin,qmax)))
+
+        for coef,q in points:
+            exp2=q*shift
+            corpus.append((typ,exact_literal(0,coef,exp2)))
+            for mid in [coef*2-1,coef*2+1]:
+                sign=rand.randint(0,1)
+                literal=exact_literal(sign,mid,exp2-1)
+                corpus.append((typ,literal))
+                # Just above and below the midpoint
+                mant,e,exp10=literal.partition("E")
+                if not exp10:
+                    exp10="0"
+                for adj in [1,-1]:
+                    corpus.append((typ,"%s%dE%d" \
+                        % (mant[:-len(mant.lstrip("-"))],\
+                            int(mant.lstrip("-"))*10+adj,int(exp10)-1)))
+
+        # Random decimal literals
+        low10=int(qmin*shift*0.30103)-3
+        high10=int((qmax+prec)*shift*0.30103)+2
+        for n in range(count):
+            digits=rand.randint(1,40)
+            literal="%s%s%sE%d" % (rand.choice(["","-","+"]),\
+                rand.randrange(10**(digits-1),10**digits),\
+                    rand.choice(["",".5",".25","."]),\
+                        rand.randint(low10,high10)-digits)
+            corpus.append((typ,literal))
+    return corpus
+
+# This function verifies the exact scaled integer conversion against the digit
+# list reference conversion for every constant in the corpus and every rounding
+# mode.  The interchange format, the conditions and any error must be identical.
+#
+# Function Arguments:
+#   count   The number of random literals of each kind for each type.  Defaults
+#           to 50.
+#   seed    The random number generator seed.  Defaults to 0.
+# Returns:
+#   a tuple: tuple[0] the number of conversions checked
+#            tuple[1] the number of mismatches found.  Each is printed.
+def exact_check(count=50,seed=0):
+    types=exact_types()
+    checked=errors=0
+    for typ,literal in exact_corpus(count=count,seed=seed):
+        cls,length=types[typ]
+        for rmode in [1,4,5,6,7]:
+            results=[]
+            for reference in [False,True]:
+                try:
+                    fpo=cls(literal,length=length,rmode=rmode,reference=reference)
+                    results.append((fpo.to_bytes().hex(),fpo.number.key()))
+                except FPError as fe:
+                    results.append(str(fe))
+            checked+=1
+            if results[0]!=results[1]:
+                errors+=1
+                print("%s'%s' R%s exact: %s" % (typ,literal,rmode,results[0]))
+                print("%s'%s' R%s digits: %s" % (typ,literal,rmode,results[1]))
+    return (checked,errors)
+
+
 # Now that all objects used by the various floating point modules are defined
 # they can be imported
 #
@@ -1785,9 +2572,9 @@ class Test(object):
 # SATK imports
 import bfp_float  # Access binary floating point conversions using float objects
 import bfp_gmpy2  # Access binary floating point conversions using gmpy2.mpfr objects
-#import bfp       # bfp.py is not directly accessed by this module 
+import bfp        # Access exact binary floating point conversions
 import dfp        # Access decimal floating point conversions
-#import hfp       # hfp.py is not yet implemented
+import hfp        # Access hexadecimal floating point conversions
 
 
 # The remainder of the module provides a command-line tool for testing floating point
@@ -1994,6 +2781,12 @@ if __name__ == "__main__":
             help="enable input prompt mode")
         parser.add_argument("--debug",default=False,action="store_true",\
             help="enable debugging of value conversions")
+        parser.add_argument("--check",default=None,type=int,metavar="N",\
+            help="cross-check the exact binary and hexadecimal floating point "\
+                "conversion against the digit list reference using N random "\
+                "literals of each kind for each constant type, and the decimal "\
+                "floating point trailing significand encoding against the "\
+                "declet reference using N random coefficients of each length")
         return parser.parse_args()
 
     # Perform conversion tests
@@ -2001,5 +2794,16 @@ if __name__ == "__main__":
     if not args.quiet:
         print(copyright)
 
+    if args.check is not None:
+        # Use this module as imported by bfp.py and hfp.py so their exceptions are
+        # recognized.
+        import fp
+        checked,errors=fp.exact_check(count=args.check)
+        print("%s conversions checked, %s mismatches" % (checked,errors))
+        dpd_errors=fp.dfp.dpd_check(count=args.check)
+        print("DPD trailing significand encoding checked, %s mismatches" \
+            % dpd_errors)
+        sys.exit(errors+dpd_errors != 0)
+
     # Perform the test
     TestRun(args).run()
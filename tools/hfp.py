@@ -0,0 +1,161 @@
+#!/usr/bin/python3
+# Copyright (C) 2026 The SATK contributors
+#
+# This file is part of SATK.
+#
+#     SATK is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     SATK is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with SATK.  If not, see <http://www.gnu.org/licenses/>.
+
+# This module provides hexadecimal floating point (HFP) support.  Decimal literals
+# are converted exactly using the scaled integers of the fp.FP_Exact class.
+#
+# HFP formats consist of three fields:
+#   - a sign,
+#   - a 7-bit characteristic, the base 16 exponent in excess-64 notation, and
+#   - a fraction of hexadecimal digits.
+#
+# The value is 0.fraction * 16**(characteristic-64).  A normalized value has a
+# non-zero leading fraction digit.
+#
+# The 32-bit (short) format is:
+#
+#      1    7              24
+#     +-+-------+------------------------+
+#     |S| CHAR  |       FRACTION         |
+#     +-+-------+------------------------+
+#
+# The 64-bit (long) format is:
+#
+#      1    7                            56
+#     +-+-------+--------------------------------------------------------+
+#     |S| CHAR  |                      FRACTION                          |
+#     +-+-------+--------------------------------------------------------+
+#
+# The 128-bit (extended) format consists of two long formats.  The high-order
+# doubleword contains the sign, the characteristic and the 14 leading fraction
+# digits.  The low-order doubleword contains the same sign, a characteristic 14 less
+# than that of the high-order doubleword (modulo 128) and the 14 trailing fraction
+# digits.
+#
+# Each format has a precision of 6, 14 or 28 hexadecimal digits respectively.
+# There are no infinities, NaNs or subnormal values.  A value too large for the
+# format is an error.  A non-zero value too small for the format becomes a true
+# zero.
+
+this_module="hfp.py"
+
+# SATK imports:
+import fp        # Access the generic floating point framework support
+
+
+# HFP special values
+class HFP_Special(fp.FP_Special):
+    def __init__(self):
+        super().__init__()  # Create the empty dictionaries
+
+    # Returns the hexadecimal digits of a special value with the sign bit set.  The
+    # extended format has a sign bit in each doubleword.
+    @staticmethod
+    def negative(hexdata):
+        digits=len(hexdata)
+        sign=1 << (digits*4-1)
+        if digits == 32:
+            sign=sign | 1 << 63
+        return "%0*X" % (digits,int(hexdata,16) | sign)
+
+    # Supplied method for defining the special values
+    def build(self):
+        for max,min,dmin in [("7FFFFFFF","00100000","00000001"),
+                             ("7FFFFFFFFFFFFFFF","0010000000000000",\
+                              "0000000000000001"),
+                             ("7FFFFFFFFFFFFFFF71FFFFFFFFFFFFFF",\
+                              "00100000000000007200000000000000",\
+                              "00000000000000007200000000000001")]:
+            self.define("(max)",  max)
+            self.define("(min)",  min)
+            self.define("(dmin)", dmin)
+            self.define("+(max)", max)
+            self.define("+(min)", min)
+            self.define("+(dmin)",dmin)
+            self.define("-(max)", HFP_Special.negative(max))
+            self.define("-(min)", HFP_Special.negative(min))
+            self.define("-(dmin)",HFP_Special.negative(dmin))
+
+
+# This class encodes the result of an exact conversion into the HFP format of a
+# specific length.
+#
+# Instance Argument:
+#   length   required bytes sequence length
+class HFP_Formatter(object):
+    #    len           len base  prec    min    max  bias sci fp.Special
+    attr={4: fp.FPAttr(4,   16,     6,   -65,    62,   64,True,HFP_Special),\
+          8: fp.FPAttr(8,   16,    14,   -65,    62,   64,True,HFP_Special),\
+          16:fp.FPAttr(16,  16,    28,   -65,    62,   64,True,HFP_Special)}
+
+    def __init__(self,length):
+        self.attr=HFP_Formatter.attr[length]   # fp.FPAttr object of the format
+        self.length=length                     # Length of the format
+        self.prec=prec=self.attr.prec          # Precision in hexadecimal digits
+        self.bias=self.attr.bias               # Characteristic bias
+
+        # Exact decimal literal conversion.  The coefficient is the fraction.
+        self.qmin=-self.bias-prec              # Characteristic of 0
+        self.qmax=127-self.bias-prec           # Characteristic of 127
+        self.scaler=fp.FP_Scaler(self.attr,self.qmin,self.qmax,subnormal=False)
+
+    def __str__(self):
+        return "HFP_Formatter: length:%s bias: %s" % (self.length,self.bias)
+
+    # Encode the result of an exact conversion into bytes
+    # Method Arguments:
+    #   val        the fp.FP_Scaled object being encoded
+    #   byteorder  The byte order of the bytes sequence.  Defaults to 'big'.
+    def encode_scaled(self,val,byteorder="big"):
+        sign=val.sign << 7
+        if val.coef == 0:
+            # True zero
+            bits=sign << (self.length*8-8)
+        else:
+            char=val.q+self.prec+self.bias
+            if self.length<16:
+                bits=(sign | char) << self.prec*4 | val.coef
+            else:
+                high=(sign | char) << 56 | val.coef >> 56
+                low=(sign | (char-14) & 0x7F) << 56 | val.coef & 0xFFFFFFFFFFFFFF
+                bits=high << 64 | low
+        return bits.to_bytes(self.length,byteorder=byteorder,signed=False)
+
+
+# This class converts decimal literals exactly into a HFP format using scaled
+# integers.
+class HFP(fp.FP_Exact):
+    Special=HFP_Special()      # Special object for HFP special values
+
+    format={4:HFP_Formatter(4),
+            8:HFP_Formatter(8),
+            16:HFP_Formatter(16)}
+
+    def default(self):
+        return (fp.HFP_DEFAULT,None)
+
+    # Overflow is an error for HFP
+    def to_number(self,fpo):
+        if fpo.overflow:
+            raise fp.FPError(msg="hexadecimal floating point constant too large: %s"\
+                % self.con_str)
+        return fpo
+
+
+if __name__ == "__main__":
+    raise NotImplementedError("%s - intended for import use only" % this_module)
@@ -35,6 +35,7 @@
 
 import functools   # Access compare to key function for sorting
 import hexdump     # Access dump utility
+import mmap        # Access memory mapped image files
 import os          # Access OS functions
 import stat        # Access to file stat data
 import struct      # Make binary structure module available
@@ -49,6 +50,9 @@ class ckd(object):
     #    New CKD image files are always opened as read/write
     # To open an existings CKD image: ckd.attach(filename,ro=True|False)
     #    Existing CKD images are opened read-only by default
+    # To map an existing CKD image: ckd.attach(filename,ro=True|False,mapped=True)
+    #    A ckdmap instance accesses the image through a memory map.  See the
+    #    ckdmap class.
     # Either attach or new are required to open a CKD image file
     #
     # ckd Static Methods:
@@ -95,7 +99,7 @@ class ckd(object):
         except IOError:
             raise IOError("writing CKD device header")
         init_cyls=0
-        for x in xrange(cyls):
+        for x in range(cyls):
             for y in range(dev.eheads):
                 #print "track (%s,%s)" % (x,y)
                 t=track(dev,x,y,r0=True)
@@ -118,10 +122,13 @@ class ckd(object):
     #
     # ckd Static Methods
     @staticmethod
-    def attach(filename,ro=True,debug=False):
+    def attach(filename,ro=True,debug=False,mapped=False):
         # Access an existing CKD emulating media file for reading or writing.
+        # When mapped is True, a ckdmap instance is returned.
         if ro:
             mode="rb"
+        elif mapped:
+            mode="r+b"
         else:
             mode="a+b"
         try:
@@ -136,7 +143,7 @@ class ckd(object):
         tracks,excess=divmod(filesize-512,trksize)
         if excess!=0:
             print("WARNING: malformed CKD image file, incomplete track: %s" \
-                % self.fo.name)
+                % filename)
         cyls,excess=divmod(tracks,heads)
         if excess!=0:
             raise ValueError(\
@@ -153,7 +160,9 @@ class ckd(object):
             raise ValueError(\
                 "CKD header track size incompatible with device "
                 "type %s size %s: %s" \
-                % (dev.edtype,dev.etrksize,etrksize))
+                % (dev.edtype,dev.etrksize,trksize))
+        if mapped:
+            return ckdmap(fo,dev,cyls,ro)
         return ckd(fo,dev,cyls,ro)
     @staticmethod
     def dump(enable=False):
@@ -269,7 +278,7 @@ class ckd(object):
                         "reading track" \
                         % (cc,hh))
                 self.cache=self.dev.read(self.fo,cc,hh,debug=debug,dump=dodump)
-    def update(self,recno,data=""):
+    def update(self,recno,data=b""):
         # Trys to update a cached track image record's data.  
         # Raises an exception if it fails
         self.__check_ro()
@@ -279,7 +288,7 @@ class ckd(object):
              raise IndexError(\
                  "Failed to update track (%s,%s) record: %s" \
                  % (self.cache.cyl,self.cache.head,recno))
-    def write(self,cc,hh,r,key="",data="",debug=False):
+    def write(self,cc,hh,r,key=b"",data=b"",debug=False):
         # Trys to write a new record to a cached track image
         # Raises an exception if it fails
         self.__check_ro()
@@ -498,6 +507,10 @@ class ckdev(object):
                 % (ckdev.hdrsize,len(header)))
         ID,heads,etrksize,devtyp,seq,highcyl\
             =struct.unpack(ckdev.devfmt,header)
+        if isinstance(ID,bytes):
+            ID=ID.decode("ascii","replace")
+            devtyp=devtyp.decode("latin-1")
+            seq=seq.decode("latin-1")
         if debug:
             string="CKD.ID: %s" % ID
             string="%s\nCKD.heads: %s" % (string,heads)
@@ -622,6 +635,9 @@ class ckdev(object):
             raise ValueError("head beyond tracks in a cylinder %s: %s" \
                 % (self.eheads,head))
         return (cyl*self.eheads)+head
+    def track_pos(self,cyl,head):
+        # Returns the file position of a track from its cylinder and head
+        return self.__file_pos(self.__rel_track(cyl,head))
     def capacity(self,used,keylen,datalen):
         # returns (newused,fit,track_balance)
         #b1,b2,nrecs=self.method(keylen,datalen)
@@ -651,13 +667,13 @@ class ckdev(object):
         # tracksize is rounded up to the next full 512 bytes
         #
         hdr=struct.pack(ckdev.devfmt,\
-                        ckdev.hdrID,\
+                        ckdev.hdrID.encode("ascii"),\
                         self.eheads,\
                         self.etrksize,\
-                        self.devtyp,\
-                        "\x00",
+                        self.devtyp.encode("latin-1"),\
+                        b"\x00",
                         0)
-        return "%s%s" % (hdr,492*"\x00")
+        return hdr+492*b"\x00"
     def lfs(self):
         # This method determines if Large File System is required for this
         # device.  It uses the same rules as Hercules dasdutil.c create_ckd().
@@ -894,7 +910,7 @@ class home(object):
             print("ckdutil.py: debug: home.parse: " \
                 "HOME BIN=0x%02X CYL=%s HEAD=%s" \
                 % (ord(bin),cyl,head))
-        if bin!="\x00":
+        if bin!=b"\x00":
             raise ValueError("invalid home address for track: (%s,%s)" \
                 % (cyl,head))
         ha=home(cyl,head)
@@ -912,7 +928,7 @@ class home(object):
         #  1,2  =  cyl (big-endian)
         #  3,4  =  head (big-endian)
         # 
-        return struct.pack(ckdev.trkfmt,"\x00",self.cyl,self.head)
+        return struct.pack(ckdev.trkfmt,b"\x00",self.cyl,self.head)
     def vsize(self):
         return home.hdrsize
 
@@ -928,8 +944,8 @@ class record(object):
             print("ckdutil.py: debug: record.parse: " \
                 "Record CYL=%s HEAD=%s REC=%s key=%s data=%s" \
                 % (cyl,head,rec,klen,dlen))
-        key=""
-        data=""
+        key=b""
+        data=b""
         if klen!=0:
             key,trk=track.sever(trk,klen)
         if dlen!=0:
@@ -937,7 +953,7 @@ class record(object):
         r=record(cyl,head,rec,key=key,data=data)
         return (r,trk)
     parse=staticmethod(parse)
-    def __init__(self,cyl,head,rec,key="",data=""):
+    def __init__(self,cyl,head,rec,key=b"",data=b""):
         self.cyl=cyl
         self.head=head
         self.rec=rec
@@ -957,22 +973,22 @@ class record(object):
         #   5   =  key length
         #  6,7  =  data length
         #
-        return struct.pack(ckdev.recfmt,self.cyl,self.head,chr(self.rec),\
-             chr(len(self.key)),len(self.data))
-    def update(self,data=""):
+        return struct.pack(ckdev.recfmt,self.cyl,self.head,bytes([self.rec]),\
+             bytes([len(self.key)]),len(self.data))
+    def update(self,data=b""):
         newdata=data
         pad=len(self.data)-len(data)
         if pad>0:
-            pad=pad*"\x00"
-            newdata="%s%s" % (newdata,pad)
+            pad=pad*b"\x00"
+            newdata=newdata+pad
         self.data=newdata[:len(self.data)]
     def vsize(self):
         return record.hdrsize+len(self.key)+len(self.data)
         
 class track(object):
     # This class abstracts a CKD track image
-    eightFF=8*"\xFF"
-    r0data=8*"\x00"
+    eightFF=8*b"\xFF"
+    r0data=8*b"\x00"
     @staticmethod
     def end_of_track(trkimg):
         if len(trkimg)<8:
@@ -1065,24 +1081,24 @@ class track(object):
                 "creating track image for (%s,%s): records=%s" \
                 % (self.cyl,self.head,len(self.recs)))
         size=self.dev.etrksize
-        image=""
+        image=b""
         for x in self.recs:
             if debug:
                 print("ckdutil.py: debug: track.pack: %s" % x)
-            image="%s%s" % (image,x.pack())
-        image="%s%s" % (image,track.eightFF)
+            image+=x.pack()
+        image+=track.eightFF
         if len(image)>size:
             raise ValueError("packed track larger than track image %s: %s" \
                 % (size,len(image)))
         pad=size-len(image)
-        image+=pad*"\x00"
+        image+=pad*b"\x00"
         return image
     def read(self,recno):
         for x in self.recs:
             if isinstance(x,record) and x.rec==recno:
                 return x
         return None  # Not found
-    def update(self,recno,data=""):
+    def update(self,recno,data=b""):
         # updates the data of a record.  Returns True/False
         for x in range(len(self.recs)):
             r=self.recs[x]
@@ -1117,6 +1133,262 @@ class track(object):
             self.updated=True
         return succeeded
 
+class ckdmap(object):
+    # This class provides access to an existing CKD image file through a memory
+    # map of the file, as an alternative to the ckd class.  Created by
+    # ckd.attach(filename,ro=True|False,mapped=True).
+    #
+    # Nothing is read from the image when a track is accessed.  A track is
+    # located within the map by its cylinder and head using the ckdev geometry.
+    # A track's records are located by walking their count fields on first
+    # access.  Record keys and data are only extracted when requested.  Record
+    # data updates are made directly in the map and reach the file when the map
+    # is flushed.  A track and its records are accessed through memoryview
+    # objects over the map, so searching records does not copy track images.
+    #
+    # ckdmap Instance Methods:
+    #
+    #   detach   Flushes the map to the image file and closes the image file
+    #   flush    Writes updated map content to the image file
+    #   read     Reads a (key,data) tuple from the current track
+    #   search   Sequentially searches tracks for a record with a key
+    #   seek     Makes a track the current track
+    #   track    Returns a trackmap instance for a track
+    #   update   Updates a record's data on the current track in place.  Data is
+    #            padded or truncated as required to maintain the data's length.
+    #   write    Not supported.  Use the ckd class to format tracks.
+    def __init__(self,fo,dev,cyls,ro=True):
+        self.fo=fo          # Open file object from attach
+        self.dev=dev        # ckdev instance for this volume
+        self.cyls=cyls      # Number of cylinders in the emulated CKD device
+        self.ro=ro          # Set read-only (True) or read-write (False)
+        if ro:
+            access=mmap.ACCESS_READ
+        else:
+            access=mmap.ACCESS_WRITE
+        try:
+            self.mm=mmap.mmap(fo.fileno(),0,access=access)
+        except (OSError,ValueError) as err:
+            raise IOError("could not map CKD image %s: %s" % (fo.name,err))
+        self.view=memoryview(self.mm)   # Zero-copy access to the image
+        # Current trackmap instance established by seek
+        self.cache=None
+    def __str__(self):
+        return "CKD %s cyl=%s mapped" % (self.dev.edtype,self.cyls)
+    def __check_cache(self):
+        if not isinstance(self.cache,trackmap):
+            raise NotImplementedError("operation must be preceded by seek")
+    def __check_cyl(self,cyl):
+        if (cyl>self.cyls-1) or (cyl<0):
+            raise IndexError("invalid cylinder (max=%s): %s" \
+                % (self.cyls-1,cyl))
+    def __check_head(self,head):
+        if (head>self.dev.eheads-1) or (head<0):
+            raise IndexError("invalid head (max=%s): %s" \
+                % (self.dev.eheads-1,head))
+    def __check_rec(self,rec):
+        if (rec>255) or (rec<0):
+            raise IndexError("invalid record (max=255): %s" % rec)
+    def __check_ro(self):
+        if self.ro:
+            raise NotImplementedError(\
+                "operation not allowed for read-only volume")
+    def detach(self,debug=False):
+        if debug:
+            print("ckdutil.py: debug: ckdmap.detach: self.cache=%s" \
+                % self.cache)
+        self.flush()
+        self.cache=None
+        self.view.release()
+        try:
+            self.mm.close()
+        except BufferError:
+            raise BufferError("CKD image %s record views still in use" \
+                % self.fo.name)
+        try:
+            self.fo.close()
+        except IOError:
+            raise IOError("IOError detaching %s CKD image %s" \
+                % (self.dev.edtype,self.fo.name))
+    def flush(self):
+        if not self.ro:
+            self.mm.flush()
+    def read(self,recno):
+        # Trys to find a record on the current track.
+        # On success, returns a tuple (key,data)
+        # If it fails, it raises an exception
+        self.__check_cache()
+        self.__check_rec(recno)
+        rec=self.cache.read(recno)
+        if rec is None:
+            raise IndexError("Could not find on track (%s,%s) record: %s" \
+                % (self.cache.cyl,self.cache.head,recno))
+        return (rec.key,rec.data)
+    def search(self,key,cc=0,hh=0,debug=False):
+        # Sequentially searches the tracks starting with track (cc,hh) for the
+        # first record whose key equals key.  The search continues to the end
+        # of the volume.
+        # Returns:
+        #   the recordmap instance of the found record, or
+        #   None if the key is not found.
+        self.__check_cyl(cc)
+        self.__check_head(hh)
+        key=bytes(key)
+        heads=self.dev.eheads
+        for cyl in range(cc,self.cyls):
+            for head in range(hh,heads):
+                rec=self.track(cyl,head).search(key)
+                if rec is not None:
+                    if debug:
+                        print("ckdutil.py: debug: ckdmap.search: found %s" \
+                            % rec)
+                    return rec
+            hh=0
+        return None
+    def seek(self,cc,hh,debug=False,dump=False):
+        dodump=dump or ckd.autodump
+        self.cache=self.track(cc,hh)
+        if debug:
+            string="ckdutil.py: debug: ckdmap.seek(%s,%s) - at file pos 0x%x" \
+                % (cc,hh,self.cache.pos)
+            if dodump:
+                string="%s\n%s" % (string,\
+                    hexdump.dump(self.cache.image(),start=0,indent="    "))
+            print(string)
+    def track(self,cc,hh):
+        # Returns the trackmap instance of a track
+        self.__check_cyl(cc)
+        self.__check_head(hh)
+        return trackmap(self.dev,self.view,cc,hh,self.dev.track_pos(cc,hh))
+    def update(self,recno,data=b""):
+        # Trys to update a record's data on the current track in place.
+        # Raises an exception if it fails
+        self.__check_ro()
+        self.__check_rec(recno)
+        self.__check_cache()
+        if not self.cache.update(recno,data):
+             raise IndexError(\
+                 "Failed to update track (%s,%s) record: %s" \
+                 % (self.cache.cyl,self.cache.head,recno))
+    def write(self,cc,hh,r,key=b"",data=b"",debug=False):
+        raise NotImplementedError(\
+            "format write not supported for a mapped CKD image, use ckd class")
+
+class recordmap(object):
+    # This class abstracts a CKD record within a mapped track image.  The count
+    # field is decoded when the instance is created.  The key and data are
+    # extracted from the map when accessed.
+    def __init__(self,view,pos):
+        self.view=view      # memoryview of the image file
+        self.pos=pos        # Position of the record's count field in the view
+        self.cyl,self.head,self.rec,self.klen,self.dlen=\
+            struct.unpack_from(ckdev.recfmt,view,pos)
+        self.rec=ord(self.rec)
+        self.klen=ord(self.klen)
+    def __str__(self):
+        return "ckdutil.recordmap(cyl=%s,head=%s,rec=%s,key_len=%s,data_len=%s)"\
+            % (self.cyl,self.head,self.rec,self.klen,self.dlen)
+    @property
+    def data(self):
+        # Returns the record's data as a bytes sequence
+        return self.dataview.tobytes()
+    @property
+    def dataview(self):
+        # Returns a memoryview of the record's data within the map
+        beg=self.pos+record.hdrsize+self.klen
+        return self.view[beg:beg+self.dlen]
+    @property
+    def key(self):
+        # Returns the record's key as a bytes sequence
+        return self.keyview.tobytes()
+    @property
+    def keyview(self):
+        # Returns a memoryview of the record's key within the map
+        beg=self.pos+record.hdrsize
+        return self.view[beg:beg+self.klen]
+    def update(self,data=b""):
+        # Replaces the record's data in the map.  Data is padded or truncated
+        # to the record's data length.
+        pad=self.dlen-len(data)
+        if pad>0:
+            data=bytes(data)+bytes(pad)
+        beg=self.pos+record.hdrsize+self.klen
+        self.view[beg:beg+self.dlen]=data[:self.dlen]
+    def vsize(self):
+        return record.hdrsize+self.klen+self.dlen
+
+class trackmap(object):
+    # This class abstracts a CKD track image within a memory mapped image file.
+    # The track's records are located on first access by walking their count
+    # fields.
+    eightFF=8*b"\xFF"
+    def __init__(self,dev,view,cyl,head,pos):
+        self.dev=dev        # ckdev instance for this volume
+        self.view=view      # memoryview of the image file
+        self.cyl=cyl
+        self.head=head
+        self.pos=pos        # Position of the track in the image file
+        self.recs=None      # List of recordmap instances, built when needed
+        bin,hacyl,hahead=struct.unpack_from(ckdev.trkfmt,view,pos)
+        if bin!=b"\x00" or hacyl!=cyl or hahead!=head:
+            raise ValueError("invalid home address for track: (%s,%s)" \
+                % (cyl,head))
+    def __str__(self):
+        if self.recs is None:
+            recs="?"
+        else:
+            recs=len(self.recs)
+        return "trackmap cyl=%s,head=%s: records=%s" % (self.cyl,self.head,recs)
+    def __scan(self):
+        # Locates the track's records from their count fields
+        view=self.view
+        pos=self.pos+home.hdrsize
+        end=self.pos+self.dev.etrksize
+        eightFF=trackmap.eightFF
+        recs=[]
+        while True:
+            if pos+8>end:
+                raise IndexError("track (%s,%s) image truncated" \
+                    % (self.cyl,self.head))
+            if view[pos:pos+8]==eightFF:
+                break
+            rec=recordmap(view,pos)
+            pos+=rec.vsize()
+            recs.append(rec)
+        self.recs=recs
+    def image(self):
+        # Returns the track image as a bytes sequence
+        return self.view[self.pos:self.pos+self.dev.etrksize].tobytes()
+    def read(self,recno):
+        for x in self.records():
+            if x.rec==recno:
+                return x
+        return None  # Not found
+    def records(self):
+        # Returns the list of recordmap instances of the track
+        if self.recs is None:
+            self.__scan()
+        return self.recs
+    def search(self,key):
+        # Returns the first user record whose key equals key or None.  Keys
+        # are compared within the map.
+        klen=len(key)
+        view=self.view
+        for x in self.records():
+            if x.klen!=klen or x.rec==0:
+                continue
+            beg=x.pos+record.hdrsize
+            if view[beg:beg+klen]==key:
+                return x
+        return None
+    def update(self,recno,data=b""):
+        # updates the data of a record in place.  Returns True/False
+        rec=self.read(recno)
+        if rec is None:
+            return False
+        rec.update(data)
+        return True
+
 # Now that helper classes are built, check the struct module formats
 ckdev.ckfmt(ckdev.devfmt,"devfmt",ckdev.hdrsize)
 ckdev.ckfmt(ckdev.recfmt,"recfmt",record.hdrsize)
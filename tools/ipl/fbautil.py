@@ -32,12 +32,27 @@
 #    ckdutil.py    Handles writing and reading of CKD image files.
 #
 # See media.py for usage of FBA image files.
+#
+# New FBA image files are sparse.  The image is sized by truncating the file
+# rather than writing every sector, so unwritten sectors occupy no host storage.
+# Writes of binary zero sectors that are still unwritten in a new image are
+# skipped, leaving holes.  Where the host supports it, all sector I/O is
+# positioned vectored I/O on the image file's descriptor so that a multi-sector
+# operation is a single os.preadv() or os.pwritev() call.
+#
+# An FBA image may be stored in a block-compressed container (see
+# fba.compress()).  The container holds an index of zlib compressed groups of
+# 120 sectors, the Hercules compressed FBA block group size.  fba.expand()
+# exports the container as a normal FBA image file usable by Hercules and its
+# utilities.
 
 this_module="fbautil.py"
 
 # Python imports:
 import os                    # Access to the OS functions
 import stat                  # Access to file stat data
+import struct                # Access to the compressed container structures
+import zlib                  # Access to compressed container group compression
 
 # SATK imports:
 import hexdump               # Get the dump function for hex display
@@ -212,6 +227,15 @@ class fba(object):
     record=["fba"]    # recsutil class name of fba records
     pad=512*b"\x00"   # Sector pad
 
+    # Whether positioned vectored I/O is available on this host
+    vectored=hasattr(os,"preadv") and hasattr(os,"pwritev")
+
+    # Block-compressed container controls
+    cmagic=b"SATKCFBA"                 # Container file identifier
+    cgroup=120                         # Sectors in a compressed group
+    cheader=struct.Struct(">8sII")     # magic, sectors, sectors per group
+    centry=struct.Struct(">QI")        # group file position and length
+
     # Dump bytes/bytearray object content as hexadecimal digits with byte positions
     # Method Arguments:
     #   byts    the bytes/bytearray sequence being dumped
@@ -303,14 +327,18 @@ class fba(object):
     #          FBA image size as an integer.
     #   comp   Whether the image file is intended for compression by a Hercules
     #          utility.  Defaults to False.
+    #   sparse Whether the image file is sized by truncation (True) or by writing
+    #          every sector (False).  Defaults to True.
+    # Returns:
+    #   the number of sectors in the initialized image
     @classmethod
-    def init(cls,fo,dtype,size=None,comp=False):
+    def init(cls,fo,dtype,size=None,comp=False,sparse=True):
         if isinstance(fo,fba):
-            if fba.ro:
+            if fo.ro:
                 raise ValueError(\
                     "%s - %s.init() - can not initialize a read-only FBA image" \
                         % (this_module,cls.__name__))
-            f=fba.fo
+            f=fo.fo
         else:
             f=fo
 
@@ -341,16 +369,44 @@ class fba(object):
             if excess!=0:
                 sectors=(grps+1)*blkgrp
 
+        f.seek(0)
         f.truncate()
-        for x in range(sectors):
+        if sparse:
             try:
-                f.write(fba.pad)
+                f.truncate(sectors*512)
             except IOError:
                 raise IOError(\
-                    "%s - %s.init() - error initializing FBA image sector %s: %s" \
-                        % (this_module,cls.__name__,x,f.name))
+                    "%s - %s.init() - error sizing FBA image: %s" \
+                        % (this_module,cls.__name__,f.name))
+        else:
+            for x in range(sectors):
+                try:
+                    f.write(fba.pad)
+                except IOError:
+                    raise IOError(\
+                        "%s - %s.init() - error initializing FBA image sector %s: %s" \
+                            % (this_module,cls.__name__,x,f.name))
         f.flush()
 
+        if isinstance(fo,fba):
+            # Re-initialized image: every sector is now binary zeros
+            fo.filesize=sectors*512
+            fo.last=sectors-1
+            fo.holes=fba.hole_map(sectors,sparse)
+            fo.seek(0)
+        return sectors
+
+    # Returns the map of sectors known to be unwritten holes in a sparse image or
+    # None if not tracked.
+    # Method Arguments:
+    #   sectors   the number of sectors in the image
+    #   sparse    Whether the image was sized by truncation
+    @staticmethod
+    def hole_map(sectors,sparse):
+        if not sparse:
+            return None
+        return bytearray(b"\x01")*sectors
+
     # Create a new FBA image file and initialize all sector to binary zeros.
     # Method Arguments:
     #   filename  The file path of the FBA image file being created.  An existing
@@ -359,11 +415,12 @@ class fba(object):
     #             FBA image size as an integer.
     #   comp      Whether the image file is intended for compression by a Hercules
     #             utility.  Defaults to False.
+    #   sparse    Whether the image file is created sparse.  Defaults to True.
     # Returns:
     #   the fba object providing access to the emulated FBA image
     # Note: size is retained for media.py compatibility.
     @classmethod
-    def new(cls,filename,dtype,size=None,comp=False):
+    def new(cls,filename,dtype,size=None,comp=False,sparse=True):
         try:
             fo=open(filename,"w+b")
         except IOError:
@@ -371,8 +428,109 @@ class fba(object):
                 "%s - %s.new() - could not open new FBA image: %s" \
                     % (this_module,cls.__name__,filename)) from None
 
-        fba.init(fo,dtype,size=size,comp=comp)
-        return fba(fo,ro=False,pending=True)
+        sectors=fba.init(fo,dtype,size=size,comp=comp,sparse=sparse)
+        fbao=fba(fo,ro=False,pending=True)
+        fbao.holes=fba.hole_map(sectors,sparse)
+        return fbao
+
+    # Store an FBA image file in a block-compressed container.  The image is
+    # divided into groups of 120 sectors.  Each group is compressed with zlib and
+    # located by the container's index.  Groups of binary zeros are not stored.
+    # Method Arguments:
+    #   filename   The path of the FBA image file being compressed
+    #   container  The path of the container file being created
+    #   level      The zlib compression level.  Defaults to 6.
+    # Returns:
+    #   the number of sectors in the container
+    # Exception:
+    #   IOError if either file can not be accessed
+    @classmethod
+    def compress(cls,filename,container,level=6):
+        group=fba.cgroup*512
+        try:
+            with open(filename,"rb") as fi, open(container,"wb") as fc:
+                sectors=fba.volume_size(fba.filesize(fi),filename=filename)
+                groups=(sectors+fba.cgroup-1)//fba.cgroup
+                fc.write(fba.cheader.pack(fba.cmagic,sectors,fba.cgroup))
+                # Reserve the index, written once the groups are placed
+                index=bytearray(groups*fba.centry.size)
+                fc.write(index)
+                pos=fc.tell()
+                buf=bytearray(group)
+                view=memoryview(buf)
+                for n in range(groups):
+                    length=fi.readinto(buf)
+                    data=view[:length]
+                    if buf.count(0,0,length)==length:
+                        # All zeros, nothing stored
+                        continue
+                    comp=zlib.compress(data,level)
+                    fc.write(comp)
+                    fba.centry.pack_into(index,n*fba.centry.size,pos,len(comp))
+                    pos+=len(comp)
+                fc.seek(fba.cheader.size)
+                fc.write(index)
+        except IOError:
+            raise IOError(\
+                "%s - %s.compress() - could not compress FBA image %s to: %s" \
+                    % (this_module,cls.__name__,filename,container)) from None
+        return sectors
+
+    # Export a block-compressed container as a sparse FBA image file.
+    # Method Arguments:
+    #   container  The path of the container file created by compress()
+    #   filename   The path of the FBA image file being created.  An existing
+    #              file will be overwritten.
+    # Returns:
+    #   the number of sectors in the exported image
+    # Exceptions:
+    #   ValueError if the container is not valid
+    #   IOError if either file can not be accessed
+    @classmethod
+    def expand(cls,container,filename):
+        try:
+            with open(container,"rb") as fc, open(filename,"w+b") as fo:
+                hdr=fc.read(fba.cheader.size)
+                if len(hdr)!=fba.cheader.size:
+                    raise ValueError(\
+                        "%s - %s.expand() - truncated container header: %s" \
+                            % (this_module,cls.__name__,container))
+                magic,sectors,cgroup=fba.cheader.unpack(hdr)
+                if magic!=fba.cmagic or cgroup<1:
+                    raise ValueError(\
+                        "%s - %s.expand() - not a compressed FBA container: %s" \
+                            % (this_module,cls.__name__,container))
+                groups=(sectors+cgroup-1)//cgroup
+                index=fc.read(groups*fba.centry.size)
+                if len(index)!=groups*fba.centry.size:
+                    raise ValueError(\
+                        "%s - %s.expand() - truncated container index: %s" \
+                            % (this_module,cls.__name__,container))
+                fo.truncate(sectors*512)
+                group=cgroup*512
+                for n,(pos,length) in enumerate(fba.centry.iter_unpack(index)):
+                    if length==0:
+                        continue
+                    fc.seek(pos)
+                    try:
+                        data=zlib.decompress(fc.read(length))
+                    except zlib.error as ze:
+                        raise ValueError(\
+                            "%s - %s.expand() - group %s not valid in %s: %s" \
+                                % (this_module,cls.__name__,n,container,ze)) \
+                                    from None
+                    if len(data)!=min(group,sectors*512-n*group):
+                        raise ValueError(\
+                            "%s - %s.expand() - group %s length not valid in "
+                                "%s: %s" % (this_module,cls.__name__,n,container,\
+                                    len(data)))
+                    fo.seek(n*group)
+                    fo.write(data)
+        except IOError:
+            raise IOError(\
+                "%s - %s.expand() - could not expand FBA container %s to: %s" \
+                    % (this_module,cls.__name__,container,filename)) from None
+        return sectors
 
     # See the description above for 
     def __init__(self,fo,ro=True,pending=False):
@@ -385,7 +543,12 @@ class fba(object):
         # emulcates.
         sectors=fba.volume_size(self.filesize,filename=self.filename)
         self.fo=fo               # Open file object from new() or attach()
+        self.fd=fo.fileno()      # File descriptor for positioned I/O
         self.pending=pending     # Whether file object writes may be pending
+        # Map of unwritten sectors of a sparse image, one byte per sector.  A
+        # sector is a hole while its byte is not zero.  None when not known, for
+        # example for attached images.
+        self.holes=None
 
         # Emulation controls and status
         self.ro=ro              # Set read-only (True) or read-write (False)
@@ -442,11 +605,13 @@ class fba(object):
         self.pending=False
 
     # Performs a low level read.
-    # Method Argument:
+    # Method Arguments:
     #   size   the number of bytes to read from the image file current position
+    #   array  Whether a bytearray (True) or bytes (False) sequence is returned.
+    #          Defaults to False.
     # Returns:
     #   the bytes read
-    def _read(self,size):
+    def _read(self,size,array=False):
         # Force writing any pending writes before attempting to read the file
         # otherwise, the image file may have stale sector data.
         if self.pending:
@@ -455,7 +620,16 @@ class fba(object):
 
         # Read the requested bytes
         try:
-             byts=self.fo.read(size)
+            if not fba.vectored:
+                byts=self.fo.read(size)
+                if array:
+                    byts=bytearray(byts)
+            elif array:
+                byts=bytearray(size)
+                read=os.preadv(self.fd,[byts],self.sector*512)
+                del byts[read:]
+            else:
+                byts=os.pread(self.fd,size,self.sector*512)
         except IOError:
             raise IOError("%s IOError while reading FBA physical sector: %s" \
                 % (eloc(self,"_read",module=this_module),self.sector))
@@ -495,31 +669,58 @@ class fba(object):
 
         return (self.lower+sector,self.lower+l_last,l_last)
 
-    # Performs the low level write.
+    # Performs the low level write of whole sectors at the current position.
+    # Sectors of binary zeros that are still holes in a sparse image are not
+    # written.  The remaining runs of sectors are each written by a single
+    # vectored write when available.
     # Method Argument:
-    #   data   a bytes sequence being written.  Must be bytes not bytearray
+    #   data   a bytes/bytearray sequence being written.
     def _write(self,data):
-        # Ensure bytes sequence is being written not bytearray.  Python requires
-        # a bytes sequence.  Sequence can not be bytearray.  This give the using
-        # software the freedom to use either sequence.
-        if isinstance(data,bytearray):
-            byts=bytes(data)
-        else:
-            byts=data
-        assert isinstance(byts,bytes),\
+        assert isinstance(data,(bytes,bytearray)),\
             "%s 'data' argument must be a bytes/bytearray sequence for sector %s: %s" \
-                % (eloc(self,"_write",module=this_module),byts,self.sector)
+                % (eloc(self,"_write",module=this_module),data,self.sector)
+
+        # Locate the runs of sectors that must be written
+        holes=self.holes
+        if holes is None:
+            runs=[(0,len(data))]
+        else:
+            runs=[]
+            sector=self.sector
+            beg=None
+            for pos in range(0,len(data),512):
+                if holes[sector] and data.count(0,pos,pos+512)==512:
+                    # Zeros over a hole, skip the sector
+                    if beg is not None:
+                        runs.append((beg,pos))
+                        beg=None
+                else:
+                    holes[sector]=0
+                    if beg is None:
+                        beg=pos
+                sector+=1
+            if beg is not None:
+                runs.append((beg,len(data)))
 
         # Write the bytes
         try:
-            self.fo.write(byts)
+            if fba.vectored:
+                view=memoryview(data)
+                base=self.sector*512
+                for beg,end in runs:
+                    os.pwritev(self.fd,[view[beg:end]],base+beg)
+            else:
+                base=self.fo.tell()
+                for beg,end in runs:
+                    self.fo.seek(base+beg)
+                    self.fo.write(data[beg:end])
+                self.fo.seek(base+len(data))
+                self.pending=True    # Indicate the write might be pending
         except IOError:
             raise IOError(\
                 "%s IOError while writing FBA physical sector: %s" \
                     % (eloc(self,"write",module=this_module),self.sector))
 
-        self.pending=True        # Indicate the write might be pending
-
     # Detach and close the image file
     def detach(self):
         if __debug__:
@@ -598,7 +799,7 @@ class fba(object):
                 fpos=self.fo.tell()
 
         # Read the physical sector using the low-level routine
-        data=self._read(512)
+        data=self._read(512,array=array)
         self.sector+=1
 
         # Trace the read if physical tracing is enabled
@@ -609,9 +810,7 @@ class fba(object):
                 if self._tdump:
                     dump(data,indent="    ")
 
-        # Return the information is the requested sequence type
-        if array:
-            return bytearray(data)
+        # Return the information in the requested sequence type
         return data
 
     # Position the image file to a specific physical sector.
@@ -899,7 +1098,7 @@ class fba(object):
                 print(s)
 
         # Read the sector' or sectors' content
-        byts=self._read(sectors*512)
+        byts=self._read(sectors*512,array=array)
         self.sector+=sectors
         self.ds_sector+=sectors
         
@@ -910,8 +1109,6 @@ class fba(object):
 
         # Return the content read from the sector or sectors as bytes or bytearray
         # as requested.
-        if array:
-            return bytearray(byts)
         return byts
 
     # Returns the next logical sector for access in the extent
@@ -388,7 +388,7 @@ bstructx=bstruct.init()
 
 def dump(barray,start=0,mode=24,indent=""):
     #isstring=isinstance(barray,type(""))
-    isstring=not isinstance(barray,(bytes,bytearray))
+    isstring=not isinstance(barray,(bytes,bytearray,memoryview))
     if mode==31:
         format="%s%s%08X %s\n"
     else:
@@ -373,7 +373,7 @@ class ckd_handler(handler):
         newlist=[]
         for x in reclst:
             newlist.append(x)
-        newlist.sort()
+        newlist=sorted(newlist,key=functools.cmp_to_key(recsutil.ckd.compare))
         return newlist
     def size(self,devcls,dtype,last=None,comp=False):
         # Return the device size in media specific units
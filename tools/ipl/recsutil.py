@@ -306,6 +306,10 @@ class ckd(rec):
     #   RO  eof    Returns True is the record is an end-of-file record
     strict=True   # Global switch for enabling padding and truncating
 
+    @staticmethod
+    def compare(a,b):
+        return a.__cmp__(b)
+
     @staticmethod
     def detuple(rectuple):
         # Convert a ckd record-tuple into a ckd instance
@@ -67,3 +67,9 @@ PRA+="\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e"
 PRA+="\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e"
 PRA+="\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e"
 PRA+="\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e\x2e"
+
+# Precompiled 256-byte tables for bytes.translate() of whole bytes, bytearray or
+# memoryview sequences.  codepage.tables() shares them as a codepage.Translator.
+A2EB=A2E.encode("latin-1")
+E2AB=E2A.encode("latin-1")
+PRAB=PRA.encode("latin-1")
@@ -26,7 +26,16 @@
 #   CKD - 2305-x, 2311, 2314, 3330-x, 3340-x, 3350, 3375, 3380-x, 3390, 3390-x, 
 #         9345-x
 #   FBA - 0671, 3310, 3370, 9313, 9332, 9335, 9336
+#
+# Pipeline mode, requested by the --jobs command-line option or the DASDDEFN jobs
+# argument, packs the content of the hosted files concurrently in a pool of
+# threads.  For FBA volumes the packed blocks are written directly through a
+# preallocated, memory-mapped image file at the sectors computed for each block,
+# bypassing the creation of medium records for the files' content.  CKD volumes
+# use the concurrently packed blocks with the normal medium record processing.
 
+import concurrent.futures
+import mmap
 import os
 import os.path
 import re
@@ -55,7 +64,7 @@ def chunk(data,size,pad=False):
     if pad:
         last=chunks[-1]
         if len(last)!=size:
-            last+=size*"\x00"
+            last+=bytes(size)
             chunks[-1]=last[:size]
     return chunks
 
@@ -97,10 +106,10 @@ class BLOCKS(object):
         self.block_factor=self.block_factors[BLOCKS.index[self.blksize]]
         if self.block_factor==0:
             print("volume.py - ERROR - Device type %s does not support a block "
-                "size of %s") % (self.dtype,self.blksize)
+                "size of %s" % (self.dtype,self.blksize))
             raise ValueError
         self.reserve=self.minrsrv()  # Determine the minimum to reserve
-        self.nullblk=self.blksize*"\x00"  # An empty block
+        self.nullblk=bytes(self.blksize)  # An empty block
     def __str__(self):
         return "BLOCKS: %s" % self.device
 
@@ -310,7 +319,7 @@ class FBA_BLOCKS(BLOCKS):
         return block*self.sectors_per_block
     def capacity(self):
         # Returns the total capacity in blocks for the volume
-        return self.sectors_per_volume/self.sectors_per_block
+        return self.sectors_per_volume//self.sectors_per_block
     def minrsrv(self):
         # Return the number of blocks to reserve sectors 0 and 1.
         return self.sectors(2)
@@ -455,7 +464,41 @@ class FBA_DASD(DASD):
     def vdb_update(self,size,debug=False):
         # Return arecord instance containing an update FBA VDBR
         return self.vdbr.update_fba(size)
-        
+
+    # Creates the FBA image file in pipeline mode.  The image is preallocated at
+    # its final size and memory-mapped.  The VDBR and VCF records are placed at
+    # their sectors and each file's content is packed by a pool of threads
+    # directly into the sectors of its allocated blocks.
+    # Method Arguments:
+    #   path      The path of the FBA image file being created
+    #   minimize  Whether the image is limited to the volume's content
+    #   comp      Whether the image file is intended for compression
+    #   debug     Whether debug messages are generated
+    def image(self,path,minimize=False,comp=False,debug=False):
+        hwm=None
+        if minimize:
+            hwm=self.recs[-1].recid
+        sectors=fbautil.fba.size(self.device.dtype,hwm=hwm,comp=comp)
+        length=sectors*512
+        if debug:
+            print("volume.py - FBA_DASD.image - image sectors: %s" % sectors)
+        with open(path,"w+b") as fo:
+            fo.truncate(length)
+            image=mmap.mmap(fo.fileno(),length)
+            try:
+                for rec in self.recs:
+                    pos=rec.recid*512
+                    image[pos:pos+512]=rec.content
+                with concurrent.futures.ThreadPoolExecutor(\
+                    max_workers=self.vdbr.jobs) as pool:
+                    for x in pool.map(\
+                        lambda fds: fds.pack(self.vdbr.blocks,image,debug=debug),\
+                        self.vdbr.vcf):
+                        pass
+                image.flush()
+            finally:
+                image.close()
+
 
 # This class defines the volume's content.  When used by another utility,
 # the class instantiation arguments that override the specification file are
@@ -466,6 +509,8 @@ class FBA_DASD(DASD):
 # Errors in the specification file will result in a ValueError exception
 # being thrown during instantiation of the DASDDEFN class instance.
 #
+# When jobs is not None, create() uses pipeline mode with that many threads.
+#
 # A user of the DASDDEFN class will utilize one of two instance methods:
 #   contruct() - Establishes the DASD Standard structures as class instances and
 #                returns a set of recsutil record instances that can be used to
@@ -477,7 +522,7 @@ class FBA_DASD(DASD):
 #                its own handler and create the DASD image.
 class DASDDEFN(object):
     def __init__(self,specfile,filename=None,reserve=None,cyl=None,trk=None,\
-       sec=None,minimize=None,compress=None,device=None,debug=False):
+       sec=None,minimize=None,compress=None,device=None,jobs=None,debug=False):
         self.specpath=specfile  # Specification file path
         self.filename=filename  # Emulated device file name overrides specfile
         self.reserve=reserve    # External override of volume reserved blocks
@@ -486,6 +531,7 @@ class DASDDEFN(object):
         self.cyl=cyl            # External override of reserved CKD cylinders
         self.trk=trk            # External override of reserved CKD tracks
         self.sec=sec            # External override of reserved FBA sectors
+        self.jobs=jobs          # Pipeline mode threads, None for serial creation
         self.debug=debug        # Generate debug output if True
         
         self.device=device      # Externally supplied media.device instance
@@ -596,7 +642,14 @@ class DASDDEFN(object):
         if not self.program is  None:
             for x in self.program.values.keys():
                 self.volume.values[x]=self.program.values[x]
-        vdbr=VDBR(self.volume.values,self.blocks,vcf)
+        # Pipeline mode only applies to volumes created by this module.  External
+        # users require all of the medium records.
+        if external:
+            jobs=None
+        else:
+            jobs=self.jobs
+        direct=jobs is not None and self.blocks.fba
+        vdbr=VDBR(self.volume.values,self.blocks,vcf,jobs=jobs,direct=direct)
         if debug:
             print("\nvolume.py - DASDDEFN.construct - VBDR:\n%s" % vdbr)
             
@@ -634,6 +687,24 @@ class DASDDEFN(object):
             print("\nvolume.py - DASDDEFN.create - physical volume creation: "
                 "started")
 
+        path=self.volume.values["file"]
+        minimize=self.volume.values["minimize"]
+        compress=self.volume.values["compress"]
+
+        if self.dasd.vdbr.direct:
+            if path is None:
+                print("volume.py - ERROR - device emulation file path missing")
+                return
+            if debug:
+                print("volume.py - DASDDEFN.create - pipeline image creation "
+                    "with %s jobs: started" % self.jobs)
+            self.dasd.image(path,minimize=minimize,comp=compress,debug=debug)
+            if debug:
+                print("volume.py - DASDDEFN.create - pipeline image creation: "
+                    "completed\n")
+            print("volume.py - DASD Volume successfully created: %s" % path)
+            return
+
         # Pass the final content to media.py device
         if debug:
              print("volume.py - DASDDEFN.create - medium record "
@@ -643,10 +714,6 @@ class DASDDEFN(object):
             print("volume.py - DASDDEFN.create - medium record "
                 "processing: completed")
 
-        path=self.volume.values["file"]
-        minimize=self.volume.values["minimize"]
-        compress=self.volume.values["compress"]
-        
         if path is None:
             print("volume.py - ERROR - device emulation file path missing")
             return
@@ -698,7 +765,7 @@ class DASDDEFN(object):
 # DASD Standard File Description Structure (FDS).  It also provides the interface
 # to the host system containing the DASD Volume file content source.
 class FDS(object):
-    name_pad=36*"\x00"
+    name_pad=bytes(36)
     def __init__(self,vdict,blksize):
         # Externally supplied parameters from FILE statement
         #print("volume.py - FDS.__init__ - vdict: %s" % vdict)
@@ -837,10 +904,10 @@ class FDS(object):
             flag|=0x08
         if self.truncated:
             flag|=0x01
-        string=self.name+FDS.name_pad
+        string=self.name.encode("latin-1")+FDS.name_pad
         string=string[:36]                   # [0:36]  DASD Volume file name
-        string+="\x00"                       # [36:37] reserved
-        string+=chr(flag)                    # [37:38] flag byte
+        string+=b"\x00"                      # [36:37] reserved
+        string+=bytes([flag])                # [37:38] flag byte
         string+=halfwordb(self.last_used)    # [38:40] Bytes used in last block
         string+=halfwordb(recsz)             # [30:42] Blocked file record size
         string+=halfwordb(0)                 # [42:44] reserved
@@ -867,6 +934,25 @@ class FDS(object):
         print("%s%s" % (pad,string))
         
         
+    def pack(self,blko,image,debug=False):
+        # Packs the file's content into its allocated blocks of a memory-mapped
+        # FBA image.  Used in pipeline mode in place of the records method.  As
+        # with records, content beyond the allocation is truncated.  Allocated
+        # blocks without content remain binary zeros.
+        self.content(debug=debug)
+        block=self.first_block
+        for data in self.volblks[:self.allocate]:
+            pos=blko.blk2phys(block)*512
+            end=pos+len(data)
+            if end>len(image):
+                raise ValueError("volume.py - ERROR - file %s block %s beyond "
+                    "end of volume" % (repr(self.name),block))
+            image[pos:end]=data
+            block+=1
+        if debug:
+            print("volume.py - FDS.pack - File: %s - packed volume blocks: %s" \
+                % (repr(self.name),block-self.first_block))
+
     def records(self,blko,debug=False):
         # Returns the physical media records corresponding to the file content.
         # This is a fairly complex process that spans many elements of the module.
@@ -915,9 +1001,7 @@ class VCF(FDS):
         super(VCF,self).__init__(vdict,blksize)
     # These methods override the corresponding super class FDS methods
     def content(self,blksize,debug=False):
-        string=""
-        for x in self.vcf:
-            string+=x.binary()
+        string=b"".join([x.binary() for x in self.vcf])
         self.volblks=chunk(string,blksize,pad=True)
     def content_size(self,debug=False):
         size=64*len(self.vcf)   # Total size of FDS entries in the VCF
@@ -931,8 +1015,10 @@ class VCF(FDS):
 # DASD Standard Volume Definition Block Record
 # This class manages the DASD Volume Standard content of the VDBR and VCF
 class VDBR(object):
-    def __init__(self,vdict,blocks,vcflist):
+    def __init__(self,vdict,blocks,vcflist,jobs=None,direct=False):
         self.blocks=blocks              # BLOCKS subclass instance
+        self.jobs=jobs                  # Pipeline threads or None
+        self.direct=direct              # Pack files directly into the image
         # Externally supplied parameters from VOLUME statement
         self.dtype=vdict["type"]
         self.name=vdict["name"]         # VCF FDS name value
@@ -953,7 +1039,7 @@ class VDBR(object):
         # Values destined for binary VDBR content:
         #
         
-        self.vdbr_lit="\xE5\xC4\xC2\xF1"  # 'VDB1' in EBCDIC
+        self.vdbr_lit=b"\xE5\xC4\xC2\xF1" # 'VDB1' in EBCDIC
         # Bit-level flags:
         self.flags1=0x00
         self.volblks=self.blocks.capacity()  # Total storabelDASD volulme blocks
@@ -999,8 +1085,8 @@ class VDBR(object):
     def binary(self,debug=False):
         self.flags1|=0x10
         string=self.vdbr_lit                    # [0:4]     VDB1 in EBCDIC
-        string+=chr(self.flags1)                # [4:4]     flags
-        string+="\x00\x00\x00"                  # [5:8]     reserved
+        string+=bytes([self.flags1])            # [4:4]     flags
+        string+=bytes(3)                        # [5:8]     reserved
         string+=fullwordb(self.ckd_cyls)        # [8:12]    Number of cylinders
         string+=halfwordb(self.ckd_tracks)      # [12:14]   Tracks/cylinder
         string+=halfwordb(self.ckd_blocks)      # [14:16]   Blocks/track
@@ -1010,7 +1096,7 @@ class VDBR(object):
         string+=fullwordb(self.reserved)        # [24:28]   Reserved blocks
         string+=fullwordb(self.volblks)         # [28:32]   Blocks on the volume
         string+=self.vcffds.binary()            # [32:96]   VCF FDS
-        string+=160*"\x00"                      # [96:256]  padding
+        string+=bytes(160)                      # [96:256]  padding
         string+=self.program_data(debug=debug)  # [256:512] program data
         if len(string)!=512:
             raise ValueError("volume.py - VDBR record not 512 bytes: %s" \
@@ -1023,7 +1109,7 @@ class VDBR(object):
         
     def blocks_fba(self):
         # Calculate the number of blocks storable on the FBA volume
-        return self.fba_sectors/self.fba_secs
+        return self.fba_sectors//self.fba_secs
 
     def display(self,pad=""):
         # Provide console description of VDBR
@@ -1053,20 +1139,28 @@ class VDBR(object):
     def content(self,debug=False):
         # Read each of the file's content and convert the content to full DASD
         # Volume blocks
-        for x in self.vcf:
-            x.content(debug)
+        if self.direct:
+            # Content is packed into the image by the DASD image method
+            return
+        if self.jobs is None:
+            for x in self.vcf:
+                x.content(debug)
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            for x in pool.map(lambda fds: fds.content(debug),self.vcf):
+                pass
 
     def program_data(self,debug=False):
         # This method returns a 256 byte string constituting program data
         # The data is supplied via the PROGRAM statement
-        pad=256*"\x00"
+        pad=bytes(256)
         if self.vdb_data is None:
             return pad
         if self.vdb_struct is None:
+            data=self.vdb_data.encode("latin-1")
             if self.vdb_ebcdic:
-                data=self.vdb_data.translate(A2E)+pad
-            else:
-                data=self.vdb_data+pad
+                data=data.translate(A2EB)
+            data+=pad
         else:
             pack="struct.pack('%s',%s)" % (self.vdb_struct,self.vdb_data)
             try:
@@ -1089,9 +1183,14 @@ class VDBR(object):
         # Create the DASD record for myself.  It will always be the first record
         recs=self.blocks.vdb_record(self,debug=debug)
         
-        # Create the DASD records for the files
+        # Create the DASD records for the files, unless packed directly into the
+        # image
         lst=[]
-        for x in self.vcf:
+        if self.direct:
+            vcf=[]
+        else:
+            vcf=self.vcf
+        for x in vcf:
             lst=x.records(self.blocks,debug=debug)
             if debug:
                 print("volume.py - VDBR.records - len of lst=%s" % len(lst))
@@ -1179,7 +1278,7 @@ class hostfile(object):
         # Reads a file from the host file system turning it into a list of DASD
         # Volume blocks.  The last block will be padded.  An IOError is thrown
         # if there is a problem reading the file.
-        pad=blksize*"\x00"
+        pad=bytes(blksize)
         if debug:
             print("volume.py - hostfile.create_blocks - record size: %s" \
                 % self.recsize)
@@ -1193,7 +1292,6 @@ class hostfile(object):
             print("volume.py - hostfile.create_blocks - content read size: %s" \
                 % read_size)
         blocks=[]
-        fo=open(self.hostname,"rb")
         self.open_file()
         while True:
             block=self.read_file(read_size)
@@ -1244,7 +1342,10 @@ class cardfile(hostfile):
             fo.close()
         except IOError:
             raise ValueError
-        self.cards="".join(images)
+        # The card images are translated as a whole
+        self.cards="".join(images).encode("latin-1")
+        if self.ebcdic:
+            self.cards=self.cards.translate(A2EB)
         self.next=None
         
     # Overridden methods
@@ -1256,11 +1357,8 @@ class cardfile(hostfile):
         
     def read_file(self,length):
         if self.next>=len(self.cards):
-            return ""
-        true_length=min(self.content_length()-self.next,length)
+            return b""
         data=self.cards[self.next:self.next+length]
-        if self.ebcdic:
-            data=data.translate(A2E)
         self.next+=length
         return data
         
@@ -1383,15 +1481,38 @@ def copyright():
     print("volume.py Copyright, Harold Grovesteen, 2012, 2013")
 
 def usage(n):
-    print("Usage: ./volume.py spec_file [device_file] [debug]")
-    #     sys.argv   [0]        [1]          [2]        [3]
+    print("Usage: ./volume.py [--jobs n] spec_file [device_file] [debug]")
+    #     sys.argv   [0]                   [1]          [2]        [3]
     sys.exit(n)
 
+# Removes the --jobs option from the command line returning its value or None
+def jobs_arg():
+    jobs=None
+    for n,arg in enumerate(sys.argv):
+        if arg=="--jobs":
+            value=sys.argv[n+1:n+2]
+            del sys.argv[n:n+2]
+        elif arg.startswith("--jobs="):
+            value=[arg[7:]]
+            del sys.argv[n]
+        else:
+            continue
+        try:
+            jobs=int(value[0])
+        except (IndexError,ValueError):
+            jobs=0
+        if jobs<1:
+            print("volume.py - --jobs requires a positive number of threads")
+            usage(1)
+        break
+    return jobs
+
 # Checks command line arguments and instantiates the DASDDEFN instance
 def check_args():
     global debugsw
     debugsw=False
     filepath=None
+    jobs=jobs_arg()
     if len(sys.argv)==4 and sys.argv[3]=="debug":
         filepath=sys.argv[2]
         if sys.argv[3]=="debug":
@@ -1413,7 +1534,7 @@ def check_args():
     if debugsw:
         print("volume.py - DEBUG - sys.argv: %s" % sys.argv)
     try:
-        return DASDDEFN(sys.argv[1],filename=filepath,debug=debugsw)
+        return DASDDEFN(sys.argv[1],filename=filepath,jobs=jobs,debug=debugsw)
     except ValueError:
         print("volume.py - Volume creation terminated due to specification error")
         sys.exit(1)
@@ -23,6 +23,10 @@
 
 # Python imports:
 import functools  # Access to compare function to key function
+import hashlib    # Access the grammar hash of a parse table
+import json       # Access parse table encoding
+import os         # Access parse table file replacement
+import sys        # Access the modules of the parse table code fingerprint
 
 # SATK imports:
 import lexer
@@ -83,10 +87,17 @@ class GLexer(lexer.Lexer):
 #   debug    Specify True to debug the Grammar class.  Default is False.
 #   ldebug   Specify True to debug the GLexer.  Default is False.
 #   tdebug   Specify True to debug the GLexer token types.  Default is False.
+#   analyzer The Prods subclass performing the LL(1) analysis of the grammar.
+#            Default is LL1Prods3.
 class Grammar(object):
-    def __init__(self,debug=False,ldebug=False,tdebug=False,LL1debug=False):
+    def __init__(self,debug=False,ldebug=False,tdebug=False,LL1debug=False,\
+                 analyzer=None):
         self.debug=debug
         self.LL1debug=LL1debug  # Debug LL(1) analysis
+        if analyzer is None:
+            self.analyzer=LL1Prods3
+        else:
+            self.analyzer=analyzer
 
         self.lex=None      # Instance of lexer.Lexer supplied by lexer() method
         self.prods=None    # Instance of LL1Prods created by lexer() method
@@ -281,7 +292,9 @@ class Grammar(object):
 
     # This method processes a grammar specification creating a dictionary of PRD
     # instances.  The PRD instances contain ID instances linked to the parser
-    # for processing.
+    # for processing.  When parse tables are enabled, the PRD instances are
+    # restored from the grammar's parse table if it exists.  Otherwise the parse
+    # table is written after the grammar is successfully processed.
     def spec(self,start,string,parser):
         if not isinstance(start,str):
             raise ValueError("LL1grammar.py - Grammar.spec() - 'start' argument "
@@ -293,6 +306,17 @@ class Grammar(object):
         self.glines=[]                  # Individual lines of the spec.
         aline=[]
 
+        # Restore the productions from a parse table when one is available
+        tables=Tables.directory is not None \
+            and not (self.debug or self.LL1debug)
+        if tables:
+            key=Tables.key(string,start,self.lex,self.analyzer)
+            prods=Tables.load(key,self.lex,parser)
+            if prods is not None:
+                self.gp=prods.gp
+                self.prods=prods
+                return self.prods
+
         # Tokenize the grammar specification
         for x in self.glexer.tokenize(self.specification,lines=True,fail=False):
             if self.debug:
@@ -330,8 +354,10 @@ class Grammar(object):
                 continue
 
         #self.prods=LL1Prods1(self.gp,debug=self.LL1debug)
-        self.prods=LL1Prods2(self.gp,debug=self.LL1debug)
+        self.prods=self.analyzer(self.gp,debug=self.LL1debug)
         self.prods.validate()  # Check out and process the productions
+        if tables and not self.errors:
+            Tables.save(key,self.prods,parser)
 
         return self.prods  # Return this to the Parser
 
@@ -603,11 +629,23 @@ class GrammarPy(object):
 # slicing), iteration and len() built-in.  The mutable list operations append(),
 # extend() and index are suppored.  When a list extends or an item appends to the
 # list, duplicate TID's are ignored.
+#
+# Membership is tested using a set of the TID's in the list.  The list itself
+# preserves the sequence in which the TID's were added.
 class List(object):
+    # Returns a new List of TID's known not to contain duplicates.
+    @staticmethod
+    def unique(tids):
+        new=List()
+        new.tids=tids
+        new.members=set(tids)
+        return new
+
     def __init__(self,items=[]):
         # This list is used to detect duplicate TID's.  Duplicates are ignored.
         # A tid in this list more than once does not matter
         self.tids=[]     # List of TID's of the LL1Term instances
+        self.members=set()  # Set of the TID's in the list
         
         # Instances supplied when the 'list' is created are added here.
         if isinstance(items,list):
@@ -620,11 +658,12 @@ class List(object):
         if not isinstance(item,str):
             raise ValueError("LL1grammar.py - List.__contains__() - "
                 "'item' argument must be a string: %s" % item)
-        return item in self.tids
+        return item in self.members
 
     # Deletes an element from the list.  It assumes the value has been returned
     # by the index() method.
     def __delitem__(self,index):
+        self.members.discard(self.tids[index])
         del self.tids[index]
 
     def __getitem__(self,index):
@@ -634,7 +673,9 @@ class List(object):
         return len(self.tids)
 
     def __setitem__(self,key,value):
+        self.members.discard(self.tids[key])
         self.tids[key]=value
+        self.members.add(value)
         
     def __str__(self):
         return self.print()
@@ -644,18 +685,20 @@ class List(object):
         if not isinstance(item,str):
             raise ValueError("LL1grammar.py - List.append() - 'item' "
                 "argument must be a string: %s" % item)
-        if item in self.tids:
+        if item in self.members:
             return
         self.tids.append(item)
+        self.members.add(item)
         
     # Same as append but returns True if the list was changed, False otherwise.
     def cappend(self,item):
         if not isinstance(item,str):
             raise ValueError("LL1grammar.py - List.cappend() - 'item' "
                 "argument must be a string: %s" % item)
-        if item in self.tids:
+        if item in self.members:
             return False
         self.tids.append(item)
+        self.members.add(item)
         return True
         
     # Same as extend but returns True if the list was changed, False otherwise.
@@ -2010,6 +2053,644 @@ class LL1Prods2(Prods):
             raise ValueError("LL1grammar.py - LL1Prods2.validate() - Grammar "
                 "contains ambiguous productions")
 
+# This class performs the same analysis as LL1Prods2 using integer bit sets and
+# work lists.  Each TID and PID is interned as a small integer, its symbol number.
+# TID's are numbered first so that a set of terminals is an integer whose bit n is
+# set when the TID with symbol number n is a member.  Each production alternative
+# is recognized by its index in the list of all RH instances.
+#
+# Rather than repeatedly scanning every production until nothing changes, each
+# step only revisits the productions or symbols affected by a change:
+#   nullable   A production alternative becomes nullable when its count of
+#              symbols not yet nullable reaches zero.
+#   FIRST      A production alternative is revisited when the FIRST set of a
+#              PID in its nullable prefix grows.
+#   FOLLOW     A symbol ending a production alternative, or followed only by
+#              nullable symbols, inherits the FOLLOW set of the left-hand PID.
+#              The FOLLOW set of the PID is pushed to each such symbol when it
+#              grows.
+#
+# The results are converted into the List objects of the PRD, RH and ID instances
+# used by the parser, as they are by LL1Prods2.  The FIRST, FOLLOW, selection and
+# director sets are the same as those of LL1Prods2.
+#
+# Instance arguments: see class Prods.
+class LL1Prods3(Prods):
+    def __init__(self,gp,debug=False):
+        super().__init__(gp,debug=debug)
+
+        # This is a list of all of the productions (RH instances) in the grammar.
+        self.prods=[]
+        for prdo in self.gp.iter_prods():
+            for rh in prdo.alts:
+                self.prods.append(rh)
+
+        self.start_pid=self.gp.start()
+        self.empty_tid=self.gp.Empty()
+        self.eos_tid=self.gp.EOS()
+
+        # Interned grammar symbols.  The EMPTY TID is not a grammar symbol.
+        self.symbols=[]      # Symbol strings by symbol number
+        self.number={}       # Symbol numbers by symbol string
+        for tid in self.gp.iter_tids():
+            self.__intern(tid)
+        if self.eos_tid not in self.number:
+            self.__intern(self.eos_tid)
+        self.ntids=len(self.symbols)  # Number of TID's, the bits of a terminal set
+        for pid in self.gp.iter_pids():
+            self.__intern(pid)
+
+        # Productions encoded as symbol numbers, set by __encode()
+        self.lhs=[]          # Left-hand PID symbol number of each production
+        self.rhs=[]          # List of right-hand symbol numbers of each production
+
+        # Results of the analysis by symbol number or production index
+        self.isnull=[]       # Whether each symbol is nullable
+        self.first_bits=[]   # FIRST set of each symbol
+        self.follow_bits=[]  # FOLLOW set of each symbol
+        self.rh_bits=[]      # FIRST set of each production alternative
+        self.select_bits=[]  # Selection set of each production alternative
+
+        # The analysis results as List objects, the same as LL1Prods2
+        self.nullable=List() # Nullable non-terminals
+        self.first={}        # FIRST set List by TID or PID
+        self.follow={}       # FOLLOW set List by TID or PID
+
+    # Returns the List of TID's in a terminal set
+    def __list(self,bits):
+        symbols=self.symbols
+        tids=[]
+        while bits:
+            low=bits & -bits
+            tids.append(symbols[low.bit_length()-1])
+            bits^=low
+        return List.unique(tids)
+
+    def __intern(self,symbol):
+        self.number[symbol]=len(self.symbols)
+        self.symbols.append(symbol)
+
+    # Determine the alive non-terminals: those with an alternative whose
+    # non-terminals are all alive.
+    def __alive(self):
+        number=self.number
+        prds=self.gp.iter_prods()
+        isalive=[False]*len(self.symbols)
+        users={}             # Productions by each non-terminal they use
+        pending=[]           # Non-terminals of each production not yet alive
+        work=[]
+
+        for n,rh in enumerate(self.prods):
+            count=0
+            for ido in rh.ids:
+                if ido.typ=="TID":
+                    continue
+                count+=1
+                try:
+                    users[ido.tpid].append(n)
+                except KeyError:
+                    users[ido.tpid]=[n,]
+            pending.append(count)
+            if not count:
+                work.append(n)
+
+        while work:
+            pid=self.prods[work.pop()].lhpid
+            sym=number[pid]
+            if isalive[sym]:
+                continue
+            isalive[sym]=True
+            for n in users.get(pid,[]):
+                pending[n]-=1
+                if not pending[n]:
+                    work.append(n)
+
+        # Alive and dead non-terminals are reported in grammar sequence
+        alive=[]
+        dead=[]
+        for prd in prds:
+            if isalive[number[prd.pid]]:
+                prd.alive=True
+                alive.append(prd.pid)
+            else:
+                dead.append(prd.pid)
+                print("LL1grammar.py - LL1Prods3.__alive() - WARNING: PID '%s' is "
+                    "dead" % prd.pid)
+        self.alive=alive
+        self.dead=dead
+
+    # Encode the productions as symbol numbers.  An EMPTY alternative has no
+    # symbols.
+    def __encode(self):
+        number=self.number
+        for rh in self.prods:
+            self.lhs.append(number[rh.lhpid])
+            if rh.ids[0].isempty:
+                self.rhs.append([])
+            else:
+                self.rhs.append([number[ido.tpid] for ido in rh.ids])
+
+    def __first(self):
+        isnull=self.isnull
+        ntids=self.ntids
+        lhs=self.lhs
+        nsyms=len(self.symbols)
+        nprods=len(self.rhs)
+
+        first=[0]*nsyms
+        for sym in range(ntids):
+            first[sym]=1<<sym
+
+        # Each production alternative's FIRST set depends upon the symbols of its
+        # nullable prefix, through the first symbol that is not nullable.
+        prefixes=[]
+        users=[[] for sym in range(nsyms)]
+        for n,rhs in enumerate(self.rhs):
+            prefix=[]
+            for sym in rhs:
+                prefix.append(sym)
+                if sym>=ntids:
+                    users[sym].append(n)
+                if not isnull[sym]:
+                    break
+            prefixes.append(prefix)
+
+        rh_bits=[0]*nprods
+        queued=[True]*nprods
+        work=list(range(nprods-1,-1,-1))
+        while work:
+            n=work.pop()
+            queued[n]=False
+            bits=0
+            for sym in prefixes[n]:
+                bits|=first[sym]
+            rh_bits[n]=bits
+            pid=lhs[n]
+            new=first[pid] | bits
+            if new!=first[pid]:
+                first[pid]=new
+                for user in users[pid]:
+                    if not queued[user]:
+                        queued[user]=True
+                        work.append(user)
+
+        self.first_bits=first
+        self.rh_bits=rh_bits
+
+    def __follow(self):
+        isnull=self.isnull
+        first=self.first_bits
+        lhs=self.lhs
+        nsyms=len(self.symbols)
+
+        follow=[0]*nsyms
+        follow[self.number[self.start_pid]]=1<<self.number[self.eos_tid]
+
+        # A symbol's FOLLOW set includes the FIRST set of the next symbol and, as
+        # LL1Prods2 does, that of each nullable symbol after it.
+        # A symbol at the end of the production alternative, or followed only by
+        # nullable symbols, inherits the FOLLOW set of the left-hand PID.
+        inherit=[[] for sym in range(nsyms)]
+        for n,rhs in enumerate(self.rhs):
+            pid=lhs[n]
+            last=len(rhs)-1
+            nullable_first=0   # FIRST sets of the nullable symbols after i+1
+            tail=True          # Whether all of the symbols after i are nullable
+            for i in range(last,-1,-1):
+                sym=rhs[i]
+                if i<last:
+                    nxt=rhs[i+1]
+                    follow[sym]|=first[nxt] | nullable_first
+                    if isnull[nxt]:
+                        nullable_first|=first[nxt]
+                if tail and sym!=pid:
+                    inherit[pid].append(sym)
+                tail=tail and isnull[sym]
+
+        # Push each PID's FOLLOW set to the symbols inheriting it
+        queued=[True]*nsyms
+        work=list(range(nsyms-1,-1,-1))
+        while work:
+            sym=work.pop()
+            queued[sym]=False
+            bits=follow[sym]
+            for heir in inherit[sym]:
+                new=follow[heir] | bits
+                if new!=follow[heir]:
+                    follow[heir]=new
+                    if not queued[heir]:
+                        queued[heir]=True
+                        work.append(heir)
+
+        self.follow_bits=follow
+
+    def __nullable(self):
+        lhs=self.lhs
+        nsyms=len(self.symbols)
+        isnull=[False]*nsyms
+        users=[[] for sym in range(nsyms)]
+        pending=[]           # Symbols of each production not yet nullable
+        work=[]
+        for n,rhs in enumerate(self.rhs):
+            pending.append(len(rhs))
+            for sym in rhs:
+                users[sym].append(n)
+            if not rhs:
+                work.append(n)
+
+        while work:
+            n=work.pop()
+            self.prods[n].nullable=True
+            pid=lhs[n]
+            if isnull[pid]:
+                continue
+            isnull[pid]=True
+            for user in users[pid]:
+                pending[user]-=1
+                if not pending[user]:
+                    work.append(user)
+
+        self.isnull=isnull
+        nullable=[]
+        for prdo in self.gp.iter_prods():
+            if isnull[self.number[prdo.pid]]:
+                prdo.nullable=True
+                nullable.append(prdo.pid)
+        self.nullable=List.unique(nullable)
+
+    # Update the PRD, RH and ID instances with the analysis results
+    def __propogate(self):
+        number=self.number
+        symbols=self.symbols
+        lhs=self.lhs
+        first=self.first_bits
+        follow=self.follow_bits
+
+        # Each distinct set is converted once.  Each List receives its own copy.
+        converted={}
+        def tidlist(bits):
+            try:
+                tids=converted[bits]
+            except KeyError:
+                tids=converted[bits]=self.__list(bits).tids
+            return List.unique(list(tids))
+
+        for sym,symbol in enumerate(symbols):
+            self.first[symbol]=tidlist(first[sym])
+            self.follow[symbol]=tidlist(follow[sym])
+
+        for prdo in self.gp.iter_prods():
+            prdo.first=self.first[prdo.pid]
+            prdo.follow=tidlist(follow[number[prdo.pid]])
+
+        select=[]
+        for n,rh in enumerate(self.prods):
+            pid_follow=follow[lhs[n]]
+            bits=self.rh_bits[n]
+            if rh.nullable:
+                bits|=pid_follow
+                rh.follow=tidlist(pid_follow)
+            rh.first=tidlist(bits)
+            rh.select=tidlist(bits)
+            select.append(bits)
+        self.select_bits=select
+
+        for n,rh in enumerate(self.prods):
+            pid_follow=follow[lhs[n]]
+            for ido in rh.ids:
+                self.gp.idinit(ido)
+                if self.gp.isEmpty(ido.tpid):
+                    ido.follow=tidlist(pid_follow)
+                else:
+                    ido.follow=tidlist(follow[number[ido.tpid]])
+
+    # Determine the reachable non-terminals: the start PID and every PID used
+    # by a production alternative, the same test as that of Prods.
+    def __reachable(self):
+        reachable=[self.pid_start,]
+        found=set(reachable)
+        for rh in self.prods:
+            for ido in rh.ids:
+                if ido.typ=="TID":
+                    continue
+                nt=ido.tpid
+                if nt not in found:
+                    found.add(nt)
+                    reachable.append(nt)
+
+        unreachable=[]
+        for prd in self.gp.iter_prods():
+            if prd.pid in found:
+                prd.reachable=True
+            else:
+                unreachable.append(prd.pid)
+        self.reachable=reachable
+        self.unreachable=unreachable
+
+    # Build the director set of each non-terminal from the selection set bits
+    def director(self):
+        ambiguous=[]
+        n=0
+        for prd in self.gp.iter_prods():
+            ds=prd.ds
+            seen=0
+            conflict=0
+            for rhn in range(len(prd.alts)):
+                bits=self.select_bits[n+rhn]
+                conflict|=seen & bits
+                seen|=bits
+                for tid in self.__list(bits & ~conflict).tids:
+                    ds[tid]=rhn
+            if conflict:
+                ambig={}
+                for tid in self.__list(conflict).tids:
+                    bit=1 << self.number[tid]
+                    ambig[tid]=ds[tid]=[rhn for rhn in range(len(prd.alts)) \
+                        if self.select_bits[n+rhn] & bit]
+                prd.ambig=ambig
+                prd.ambigous=True
+                ambiguous.append(prd.pid)
+            n+=len(prd.alts)
+        self.ambiguous=ambiguous
+
+    def print_nullable(self):
+        print("NULLABLES: %s" % self.nullable)
+
+    def sensible(self):
+        self.__alive()
+        if self.debug:
+            self.print_alive()
+        if self.debug or len(self.dead)>0:
+            self.print_dead()
+        self.__reachable()
+        if self.debug:
+            self.print_reachable()
+        if self.debug or len(self.unreachable)>0:
+            self.print_unreachable()
+        if len(self.dead)>0 or len(self.unreachable)>0:
+            raise ValueError("LL1grammar.py - LL1Prods3.sensible() - grammar "
+                "processing terminated due to presence of dead or unreachable "
+                "non-terminals")
+
+    def validate(self):
+        self.sanity_checks()    # Check the output Grammar object for sanity
+        self.sensible()         # Check that the grammar makes sense
+
+        self.__encode()         # Encode the productions as symbol numbers
+        self.__nullable()       # Determine nullable non-terminals
+        if self.debug:
+            self.print_nullable()
+        self.__first()          # Determine production and PID first sets.
+        self.__follow()         # Determine TID and PID follow sets
+        self.__propogate()
+        if self.debug:
+            self.print_first(details=True)
+            self.print_follow(details=True)
+        self.director()
+        if self.debug:
+            self.print_director()
+        if self.debug or len(self.ambigous)>0:
+            self.print_ambigous()
+        if len(self.ambiguous)>0:
+            raise ValueError("LL1grammar.py - LL1Prods3.validate() - Grammar "
+                "contains ambiguous productions")
+
+# +----------------------------------+
+# |  Serialized LL(1) Parse Tables   |
+# +----------------------------------+
+
+# This class restores the productions of a previously validated grammar from a
+# parse table.  The grammar specification is neither parsed nor analyzed.  The PRD,
+# RH and ID instances carry only the attributes used by the parser: alternatives,
+# director sets, nullable and EMPTY alternative indicators, tracing and the FOLLOW
+# sets used for resynchronization.
+#
+# Instance arguments:
+#   gp        The GrammarPy instance rebuilt from the parse table
+#   key       The grammar hash of the parse table
+#   bindings  The callback bindings recorded with the parse table
+#   debug     Enable debugging.
+class LL1Table(Prods):
+    def __init__(self,gp,key,bindings=[],debug=False):
+        super().__init__(gp,debug=debug)
+        self.key=key              # Grammar hash of the parse table
+        self.bindings=bindings    # List of [point,pid,method name] lists
+        self.alive=list(gp.iter_pids())
+        self.reachable=list(gp.iter_pids())
+
+    # The grammar was validated when the parse table was created.
+    def validate(self):
+        pass
+
+# This class saves and restores the results of the LL(1) analysis of a grammar.
+# Each parse table is a JSON file in the tables directory.  The file is named by a
+# hash of the grammar specification, its start production and the token types of
+# the lexer.  A change to any of these selects a different file, so a stale table
+# is never used.  A missing or unreadable table causes the grammar to be processed
+# and the table to be written.
+#
+# A parse table records for each production its alternatives and director set,
+# and the callback bindings registered by the parser when the table was created.
+# The bindings are informational.  Callbacks are always those registered by the
+# parser using the table.
+#
+# Parse tables are disabled until a directory is supplied by the enable() method.
+# Grammars processed with grammar or LL(1) analysis debugging enabled never use
+# parse tables.
+#
+# Instance methods:
+#   bindings    Returns the callback bindings registered by a parser
+#   disable     Stop using parse tables
+#   enable      Use parse tables in a directory, optionally rebuilding them
+#   key         Returns the grammar hash of a grammar specification
+#   load        Restores a LL1Table object from its parse table
+#   save        Writes the parse table of a validated grammar
+#   table_file  Returns the path of a parse table
+class ParseTables(object):
+    version=1           # Change when the parse table format changes
+    ext="ll1"           # Parse table file extension
+
+    # Returns the grammar hash, a string of hexadecimal digits.  The hash includes
+    # the analyzer class and a fingerprint of the code of this module and of the
+    # analyzer's module, so a parse table is only used by the code that wrote it.
+    # Method Arguments:
+    #   string   The grammar specification
+    #   start    The start PID
+    #   lex      The lexer.Lexer object recognizing the grammar's terminals
+    #   analyzer The Prods subclass performing the LL(1) analysis of the grammar
+    @staticmethod
+    def key(string,start,lex,analyzer):
+        modules=[sys.modules[__name__],sys.modules[analyzer.__module__]]
+        code=satkutil.CacheFile(modules).code
+        ident=[ParseTables.version,code,\
+            "%s.%s" % (analyzer.__module__,analyzer.__qualname__),start,\
+            sorted(lex.tids),lex.empty_tid(),lex.eos_tid(),string]
+        return hashlib.sha256(json.dumps(ident).encode("utf-8")).hexdigest()
+
+    def __init__(self):
+        self.directory=None   # Directory of parse tables.  None disables tables
+        self.regen=False      # Whether existing parse tables are ignored
+        self.loaded=0         # Parse tables restored
+        self.saved=0          # Parse tables written
+
+    # Returns a list of the callback bindings registered by a parser.  Each
+    # binding is a list: [point,pid,method name].
+    def bindings(self,parser):
+        cbm=getattr(parser,"cbm",None)
+        if cbm is None:
+            return []
+        bindings=[]
+        for point,cbo in cbm.cbp.items():
+            for pid,method in cbo.cbs.items():
+                name="%s.%s" % satkutil.method_name(method)
+                bindings.append([point,pid,name])
+        return sorted(bindings)
+
+    # Returns a parse table dictionary from the analyzed productions.  Each
+    # distinct FOLLOW set is stored once and referenced by its index.
+    def __encode(self,key,prods,parser):
+        gp=prods.gp
+        sets=[]        # Distinct FOLLOW sets
+        index={}       # Index of each FOLLOW set, keyed by its tuple of TID's
+        def setndx(follow):
+            tids=tuple(follow)
+            try:
+                return index[tids]
+            except KeyError:
+                n=index[tids]=len(sets)
+                sets.append(tids)
+                return n
+
+        productions=[]
+        for prd in gp.iter_prods():
+            alts=[]
+            for rh in prd.alts:
+                ids=[]
+                for ido in rh.ids:
+                    ids.append([ido.tpid,ido.typ,ido.repstr,ido.resync,ido.trace,\
+                        setndx(ido.follow)])
+                alts.append({"trace":rh.trace,"ids":ids})
+            productions.append({"pid":prd.pid,"nullable":prd.nullable,\
+                "empty":prd.empty,"follow":setndx(prd.follow),"ds":prd.ds,\
+                "alts":alts})
+        return {"version":ParseTables.version,"key":key,"start":gp.start(),\
+            "bindings":self.bindings(parser),"sets":sets,"prods":productions}
+
+    # Returns a LL1Table object from a parse table dictionary.  The parser only
+    # inspects the FOLLOW sets, so each distinct set is a single List object.
+    def __restore(self,table,lex,parser):
+        gp=GrammarPy(lex,parser,START(table["start"]))
+        sets=[List.unique(tids) for tids in table["sets"]]
+        for p in table["prods"]:
+            prd=PRD(p["pid"],sync=[],flags=[])
+            for ids in p["alts"]:
+                lst=[]
+                for tpid,typ,repstr,resync,trace,follow in ids["ids"]:
+                    ido=ID(tpid,rep=repstr,rsync=resync,string=True)
+                    ido.typ=typ
+                    if typ=="TID":
+                        ido.istid=True
+                        ido.trace=trace
+                        ido.empty=gp.isEmpty(tpid)
+                    else:
+                        ido.isprd=True
+                    ido.follow=sets[follow]
+                    lst.append(ido)
+                rh=RH(None,lst=lst,trace=ids["trace"])
+                prd.rhand(rh)
+            prd.nullable=p["nullable"]
+            empty=p["empty"]
+            if empty is not None:
+                prd.isempty=True
+                prd.empty=empty
+                rh=prd.alts[empty]
+                rh.isempty=rh.empty=True
+                rh.ids[0].isempty=True
+            prd.follow=sets[p["follow"]]
+            prd.ds=p["ds"]
+            gp.append(prd)
+
+        for prd in gp.iter_prods():
+            prd.alive=prd.reachable=True
+            for rh in prd.alts:
+                for ido in rh.ids:
+                    gp.idinit(ido)
+        return LL1Table(gp,table["key"],bindings=table["bindings"])
+
+    # Stop using parse tables
+    def disable(self):
+        self.directory=None
+        self.regen=False
+
+    # Use parse tables in a directory
+    # Method Arguments:
+    #   directory  The directory containing the parse tables
+    #   regen      Specify True to process each grammar and rewrite its parse
+    #              table regardless of an existing table.  Default is False.
+    def enable(self,directory,regen=False):
+        self.directory=directory
+        self.regen=regen
+
+    # Returns a LL1Table object restored from a parse table or None if the table
+    # does not exist, can not be read or does not match the grammar hash.
+    # Method Arguments:
+    #   key      The grammar hash of the grammar
+    #   lex      The lexer.Lexer object recognizing the grammar's terminals
+    #   parser   The parser using the grammar
+    def load(self,key,lex,parser):
+        if self.directory is None or self.regen:
+            return None
+        try:
+            with open(self.table_file(key),"rt") as fo:
+                table=json.load(fo)
+            if table["version"]!=ParseTables.version or table["key"]!=key:
+                return None
+            prods=self.__restore(table,lex,parser)
+        except Exception:
+            # Any problem with the parse table causes the grammar to be processed
+            return None
+        self.loaded+=1
+        return prods
+
+    # Writes the parse table of a grammar.  The file is written under a temporary
+    # name and then renamed so that concurrent processes never see a partial
+    # parse table.  Failure to write the parse table is not an error.
+    # Method Arguments:
+    #   key      The grammar hash of the grammar
+    #   prods    The Prods object of the validated grammar
+    #   parser   The parser using the grammar
+    # Returns:
+    #   the path of the parse table or None if it was not written
+    def save(self,key,prods,parser):
+        if self.directory is None:
+            return None
+        try:
+            tablefile=self.table_file(key)
+            os.makedirs(self.directory,exist_ok=True)
+        except OSError:
+            return None
+        table=self.__encode(key,prods,parser)
+        tmpfile="%s.%s.tmp" % (tablefile,os.getpid())
+        try:
+            with open(tmpfile,"wt") as fo:
+                json.dump(table,fo,separators=(",",":"))
+            os.replace(tmpfile,tablefile)
+        except Exception:
+            try:
+                os.remove(tmpfile)
+            except OSError:
+                pass
+            return None
+        self.saved+=1
+        return tablefile
+
+    # Returns the path of the parse table for a grammar hash
+    def table_file(self,key):
+        return os.path.join(self.directory,"%s.%s" % (key[:32],ParseTables.ext))
+
+# The process-wide parse tables
+Tables=ParseTables()
+
 class LL1Relationship(object):
     def __init__(self,keys,init=False):
         if not isinstance(keys,list):
@@ -1075,7 +1075,9 @@ class Parser(object):
         self.dm.flag(dflag)
 
     # This method is used to create the parser from a supplied lexer and grammar.
-    # It is intended to called from a subclass init() method
+    # It is intended to called from a subclass init() method.  When parse tables
+    # are enabled by LL1grammar.Tables, the productions are restored from the
+    # grammar's parse table rather than processing the grammar.
     def generate(self,grammar,lexer,start):
         gdebug=self.isdebug("gdebug")
         gldebug=self.isdebug("gldebug")
@@ -44,6 +44,7 @@
 # particularly true where multiple lines may occur.
 
 # Python imports:
+import collections
 import re
 
 this_module="%s.py" % __name__
@@ -139,6 +140,11 @@ class LexerError(Exception):
 #   groups()  Returns the match object's group list.
 #   match()   Returns the match object itself.
 class Token(object):
+    # Token instances are numerous and long lived.  Slots avoid a per-instance
+    # dictionary.  A subclass that does not define __slots__ still has one.
+    __slots__=("tid","string","beg","end","line","linepos","eols","ignore","mo",\
+               "tmo","eolpos","info")
+
     @staticmethod
     def compare(a,b):
         if a.line is None and b.line is None:
@@ -273,6 +279,81 @@ class Token(object):
             raise LexerError()
         return self.mo
 
+# This class is a frozen copy of a Regular Expression match object.  Python match
+# objects can not be serialized by the pickle module, so a Token that preserves
+# its match object can not be pickled.  A pickler replaces each match object with
+# an instance of this class by registering the MatchState.reduce() static method
+# in its dispatch_table for re.Match.  The instance supports the match object
+# methods and attributes used with Token instances.
+#
+# Instance Arguments:
+#   string     The string matched against
+#   pos        The match object's pos attribute
+#   endpos     The match object's endpos attribute
+#   groupindex The regular expression's dictionary of group names and numbers
+#   spans      A tuple of the spans of each group, group 0 included
+#   lastindex  The match object's lastindex attribute
+class MatchState(object):
+
+    # Returns the reduction tuple used by a pickler for a re.Match object
+    @staticmethod
+    def reduce(mo):
+        spans=tuple(mo.span(n) for n in range(len(mo.groups())+1))
+        return (MatchState,(mo.string,mo.pos,mo.endpos,dict(mo.re.groupindex),\
+            spans,mo.lastindex))
+
+    def __init__(self,string,pos,endpos,groupindex,spans,lastindex):
+        self.string=string
+        self.pos=pos
+        self.endpos=endpos
+        self.groupindex=groupindex
+        self.spans=spans
+        self.lastindex=lastindex
+        self.lastgroup=None
+        for name,n in groupindex.items():
+            if n==self.lastindex:
+                self.lastgroup=name
+
+    def __getitem__(self,g):
+        return self.group(g)
+
+    def __index(self,g):
+        if isinstance(g,str):
+            return self.groupindex[g]
+        return g
+
+    def __value(self,n,default=None):
+        beg,end=self.spans[n]
+        if beg<0:
+            return default
+        return self.string[beg:end]
+
+    def end(self,g=0):
+        return self.spans[self.__index(g)][1]
+
+    def group(self,*args):
+        if len(args)==0:
+            return self.__value(0)
+        if len(args)==1:
+            return self.__value(self.__index(args[0]))
+        return tuple(self.__value(self.__index(g)) for g in args)
+
+    def groupdict(self,default=None):
+        d={}
+        for name,n in self.groupindex.items():
+            d[name]=self.__value(n,default=default)
+        return d
+
+    def groups(self,default=None):
+        return tuple(self.__value(n,default=default) \
+            for n in range(1,len(self.spans)))
+
+    def span(self,g=0):
+        return self.spans[self.__index(g)]
+
+    def start(self,g=0):
+        return self.spans[self.__index(g)][0]
+
 class Empty(Token):
     def __init__(self):
         super().__init__()
@@ -375,7 +456,6 @@ class Type(object):
         if self.debug:
             print("Type '%s' match(string,pos=%s,line=%s,eolpos=%s)" \
                 % (self.tid,pos,line,eolpos))
-        eols=0
         res=None
 
         # Try to recognize a token with my Regular Expression match pattern
@@ -393,9 +473,26 @@ class Type(object):
         string=mo.group()
         if self.mo:
             res=mo
+        return self.token(string,mo.start(),mo.end(),line=line,linepos=pos-eolpos,\
+            mo=res)
+
+    # Accessor method to dynamically set debug status
+    def setDebug(self,value):
+        self.debug=value
+
+    # Creates the Token instance for a recognized string.  Used by the match()
+    # method and by a Scanner that has already recognized the string.
+    # Method arguments:
+    #   string   The recognized string
+    #   beg      Starting position of the string in the scanned string
+    #   end      Ending position of the string in the scanned string
+    #   line     The line number of the token
+    #   linepos  The position of the token relative to the start of its line
+    #   mo       The match object preserved in the token or None
+    def token(self,string,beg,end,line=0,linepos=0,mo=None):
         if self.debug:
             print("matched string '%s' creating tcls: %s" % (string,self.tcls))
-            
+
         # Note excpetions occurring within an iterator behave differently.  This
         # try block attemps to provide some indication of the failure.
         # Is this a bug in the Lexer interator code??  Don't know.
@@ -411,9 +508,8 @@ class Type(object):
         if self.debug:
             print("created token: %s()" % tok.__class__.__name__)
 
-        relpos=pos-eolpos
-        tok.init(self.tid,string,mo.start(),mo.end(),\
-            line=line,linepos=relpos,eols=eols,ignore=self.ignore,mo=res)
+        tok.init(self.tid,string,beg,end,\
+            line=line,linepos=linepos,eols=0,ignore=self.ignore,mo=mo)
 
         if self.eol:
             tok._newline()
@@ -421,10 +517,6 @@ class Type(object):
         if self.debug:
             print("Type '%s' match(): recognized Token:\n   %s" % (self.tid,tok))
         return tok
-        
-    # Accessor method to dynamically set debug status
-    def setDebug(self,value):
-        self.debug=value
 
 class EmptyType(Type):
     def __init__(self,tid="EMPTY",tcls=Empty,debug=False):
@@ -442,6 +534,92 @@ class EOSType(Type):
         tok.init(self.tid,pos,line,0)
         return tok
 
+# +------------------------------------+
+# |                                    |
+# |  THE COMPILED MASTER TYPE SCANNER  |
+# |                                    |
+# +------------------------------------+
+
+# This class combines the regular expressions of a list of Type instances into a
+# single regular expression, one alternative per Type in the order of the list.
+# Python's regular expression alternation selects the first alternative that
+# matches at a position.  This is exactly the Type selected when each Type is
+# tried in sequence.  A single match of the combined regular expression replaces
+# the sequence of failed matches, each of which raises a LexerError.
+#
+# Named groups within a Type's pattern are converted to unnamed groups in the
+# combined regular expression.  The recognizing Type still matches its own
+# compiled regular expression when its tokens preserve the match object, so
+# Token.groups() and Token.dict() are unchanged.
+#
+# Use the Scanner.build() static method to create a Scanner.  It returns None when
+# the Type instances can not be combined.  The Lexer or Recognizer then tries each
+# Type in sequence.  Types can not be combined when:
+#   - a Type overrides the match() method,
+#   - a Type has debugging enabled,
+#   - the Types use different regular expression compilation flags, or
+#   - a pattern uses a back reference or fails to compile when combined.
+#
+# Instance Arguments:
+#   typs   The list of Type instances being combined
+#   cre    The compiled combined regular expression
+class Scanner(object):
+    backref=re.compile(r"\(\?P=|\\[1-9]")   # Detects back references
+    named=re.compile(r"\(\?P<[A-Za-z_][A-Za-z0-9_]*>")  # Detects named groups
+
+    # Returns a Scanner for a list of Type instances or None if the types can
+    # not be combined.
+    @staticmethod
+    def build(typs):
+        if len(typs)==0:
+            return None
+        flags=typs[0].flags
+        alts=[]
+        for typ in typs:
+            if typ.cre is None or typ.debug or typ.flags!=flags \
+               or type(typ).match is not Type.match:
+                return None
+            pattern=typ.pattern
+            if Scanner.backref.search(pattern) is not None:
+                return None
+            alts.append("(%s)" % Scanner.named.sub("(",pattern))
+        try:
+            cre=re.compile("|".join(alts),flags)
+        except re.error:
+            return None
+        # Map each alternative's outermost group number to its Type
+        grptyp={}
+        grp=1
+        for typ in typs:
+            grptyp[grp]=typ
+            grp+=typ.cre.groups+1
+        if grp!=cre.groups+1:
+            return None
+        return Scanner(typs,cre,grptyp)
+
+    def __init__(self,typs,cre,grptyp):
+        self.typs=typs      # Combined Type instances
+        self.cre=cre        # Combined compiled regular expression
+        self.grptyp=grptyp  # Maps outermost group number to its Type instance
+
+    # Returns an instance of Token when one of the combined types is recognized.
+    # Otherwise None is returned, allowing the caller to report the failure as it
+    # does when none of its types is recognized.  Arguments are the same as the
+    # Type.match() method.
+    def match(self,string,pos=0,line=0,eolpos=0):
+        mo=self.cre.match(string,pos)
+        if mo is None:
+            return None
+        # The outermost group of the matching alternative closes last
+        grp=mo.lastindex
+        typ=self.grptyp[grp]
+        if typ.mo:
+            # The token needs the Type's own match object
+            return typ.match(string,pos,line,eolpos)
+        return typ.token(mo.group(grp),mo.start(grp),mo.end(grp),\
+            line=line,linepos=pos-eolpos)
+
+
 # +--------------------------------------------+
 # |                                            |
 # |  THE CONTEXT INSENSITIVE LEXICAL ANALYZER  |
@@ -486,11 +664,15 @@ class EOSType(Type):
 #              specification
 #    ucls      The class that is instantiated for unrecognized character strings.
 #              Defaults to Unrecognized.
+#    compiled  Specify True to recognize tokens with a Scanner combining the
+#              regular expressions of all types.  Specify False to try each type
+#              in sequence.  Defaults to True.  See the Scanner class.
 class Lexer(object):
-    def __init__(self,dup=False,grammar=False,ucls=Unrecognized):
+    def __init__(self,dup=False,grammar=False,ucls=Unrecognized,compiled=True):
         self.dup=dup   # Indicate whether duplicate token type id's are allowed
         self.ucls=ucls # Class instantiated for unrecognized character sequences
         self.grammar=grammar # Ensure Type instance tis is an uppercase name
+        self.compiled=compiled # Use a Scanner for recognition when possible
         
         # Parser compatible token type tid's must start with a letter and may be
         # by any number of letters, 'a'-'z' or 'A'-'Z', numbers, '0'-'9' or 
@@ -504,7 +686,10 @@ class Lexer(object):
         self.eos=False      # Set to true if EOSType is registered for recognition
         self.eostype=None   # The Type instance being used for EOS.
         self.emptytype=None # The Type instance beign usef for the Empty string
-        
+        # Scanner for the registered types, built upon first recognition
+        self.scanner=None   # Scanner instance or None if not combined
+        self.scanned=False  # Whether the Scanner build has been attempted
+
         # Values maintained while acting as an iterator
         self._reset()   # Initialize the attributes
         
@@ -530,10 +715,8 @@ class Lexer(object):
         while True:
             # Determine if iteration is done
             # provide a token if one is in the list of recognized tokens
-            if len(self.recog) > 0:
-                tok=self.recog[0]
-                self.recog=self.recog[1:]
-                yield tok
+            if self.recog:
+                yield self.recog.popleft()
                 continue
             # Stop the iteration if the recognizer has reached the string's end
             if self.pos == self.length:
@@ -611,7 +794,20 @@ class Lexer(object):
         self.length=None
         self.recognizer=None
         self.stopped=True
-        self.recog=[]
+        self.recog=collections.deque()
+
+    # This internal method returns a Scanner for the registered types or None if
+    # compiled recognition is disabled or not possible.
+    def _scanner(self):
+        self.scanned=True
+        if not self.compiled:
+            return None
+        typs=[]
+        for typ in self.typs:
+            if self.eos and isinstance(typ,EOSType):
+                continue
+            typs.append(typ)
+        return Scanner.build(typs)
 
     # This internal method validates Type tid's for compatibility with the parser
     # module.  For a compatible tid, the method returns the compatible tid.  It 
@@ -672,13 +868,20 @@ class Lexer(object):
     #    line    The line number associated with the pos argument.  Defaults to 0.
     #    linepos The position within the current being recognized. Defaults to 0.
     def recognize(self,string,pos=0,line=0,linepos=0):
-        for typ in self.typs:
-            if self.eos and isinstance(typ,EOSType):  # put pseudo token type test here
-                continue
-            try:
-                return typ.match(string,pos,line,linepos)
-            except LexerError:
-                continue
+        if not self.scanned:
+            self.scanner=self._scanner()
+        if self.scanner is not None:
+            tok=self.scanner.match(string,pos,line,linepos)
+            if tok is not None:
+                return tok
+        else:
+            for typ in self.typs:
+                if self.eos and isinstance(typ,EOSType):  # pseudo token type test
+                    continue
+                try:
+                    return typ.match(string,pos,line,linepos)
+                except LexerError:
+                    continue
         # None of the associated types matches the string
         raise LexerError(pos=pos,line=line,linepos=linepos)
 
@@ -752,6 +955,7 @@ class Lexer(object):
         else:
             self.typs.append(t)
         self.tids.append(t.tid)
+        self.scanned=False     # Rebuild the Scanner with the new type
 
     # Print the list of registered tokens
     def types(self):
@@ -769,11 +973,14 @@ class Lexer(object):
 # determines if any of its registered token types matches.  It provides a single
 # 'context' in which recognition occurs.
 class Recognizer(object):
-    def __init__(self, name,debug=False):
+    def __init__(self, name,debug=False,compiled=True):
         self.name=name      # Name of the context specific recognizer
         self.debug=debug    # Recognizer debug flag
         self.typs=[]        # List of Type instances for recognized tokens
         self.tids=[]        # List of Type tids for detection of duplicates
+        self.compiled=compiled  # Use a Scanner for recognition when possible
+        self.scanner=None   # Scanner for the types, built upon first recognition
+        self.scanned=False  # Whether the Scanner build has been attempted
 
     # Returns an instance of Token when one of the associated types is recognized
     # in the supplied string.  Othewise, a LexerError exception is raised.
@@ -788,13 +995,22 @@ class Recognizer(object):
     # Exception:
     #    LexerError if no match is found and fail is True
     def recognize(self,string,pos=0,line=0,linepos=0,fail=False):
-        for typ in self.typs:
-            # Recognition of the EOS (end-of-string) condition occurs before entry
-            # to this method
-            try:
-                return typ.match(string,pos,line,linepos)
-            except LexerError:
-                continue
+        if not self.scanned:
+            self.scanned=True
+            if self.compiled:
+                self.scanner=Scanner.build(self.typs)
+        if self.scanner is not None:
+            tok=self.scanner.match(string,pos,line,linepos)
+            if tok is not None:
+                return tok
+        else:
+            for typ in self.typs:
+                # Recognition of the EOS (end-of-string) condition occurs before
+                # entry to this method
+                try:
+                    return typ.match(string,pos,line,linepos)
+                except LexerError:
+                    continue
 
         # None of the token types associated with this context matches the string
         if fail:
@@ -834,6 +1050,7 @@ class Recognizer(object):
 
         self.typs.append(t)
         self.tids.append(t.tid)
+        self.scanned=False      # Rebuild the Scanner with the new type
         
     # Print the list of registered tokens
     def types(self):
@@ -845,9 +1062,15 @@ class Recognizer(object):
 # Context Sensitive Lexical Analyzer.  Expects to be subclassed.
 # It is the responsibility of the user of the subclass to determine when the 
 # recognition context changes.
+#
+# Instance Arguments:
+#   eostype   The Type class used to create the end-of-string token
+#   compiled  Specify False to have each context try its types in sequence rather
+#             than using a Scanner.  Defaults to True.
 class CSLA(object):
-    def __init__(self,eostype=EOSType):
+    def __init__(self,eostype=EOSType,compiled=True):
         self.ctxs={}      # Defined stateless recognizers
+        self.compiled=compiled  # Whether contexts use a Scanner when possible
         
         # Current string being recognized under different contexts
         # See start() method
@@ -874,7 +1097,7 @@ class CSLA(object):
             cls_str="%s - %s.ctx() -" % (this_module,self.__class__.__name__)
             raise ValueError("%s context already created: %s" % (cls_str,name))
         except KeyError:
-            self.ctxs[name]=Recognizer(name,debug=debug)
+            self.ctxs[name]=Recognizer(name,debug=debug,compiled=self.compiled)
 
     # Allows the subclass to initalize the various contexts.  Must return self
     # if expected to be used with the syntax subclass().init()
@@ -198,6 +198,18 @@ class PToken(object):
         raise NotImplementedError("%s subclass %s must implement led() method" \
             % (eloc(self,"__init__"),self.__class__.__name__))
 
+    # Infix compiler.  See the PParser.compile() method.
+    # Its actual signature is: compile_led(self,ctx,left)
+    def compile_led(self,*args,**kwds):
+        raise NotImplementedError("%s subclass %s must implement compile_led() "
+            "method" % (eloc(self,"compile_led"),self.__class__.__name__))
+
+    # Unary compiler.  See the PParser.compile() method.
+    # Its actual signature is: compile_nud(self,ctx)
+    def compile_nud(self,*args,**kwds):
+        raise NotImplementedError("%s subclass %s must implement compile_nud() "
+            "method" % (eloc(self,"compile_nud"),self.__class__.__name__))
+
 
 # Base class for all infix only operators.
 # This class does the generic operator precedence management of operators.  Parsing
@@ -304,6 +316,55 @@ class Operator(PToken):
 
         return res
 
+    # Compiles the infix operator.  The right-hand operand is compiled here, as
+    # led() evaluates it.
+    # Returns:
+    #   a function of the PEvalCtx object of an evaluation returning the operator's
+    #   result
+    def compile_led(self,ctx,left):
+        if not self.isinfix:
+            raise PParserError(ptok=self,msg="is not an infix operator")
+        right=ctx.parser._compile(ctx,bp=self.lbp)
+        calc_led=self.calc_led
+
+        def led(ectx):
+            lval=left(ectx)
+            rval=right(ectx)
+            try:
+                res=calc_led(ectx,lval,rval)
+            except PEvaluationError as ee:
+                raise PParserError(ptok=self,msg=ee.msg) from None
+            if res is None:
+                raise ValueError("%s %s.led expression -> %s" \
+                    % (eloc(self,"compile_led"),self.__class__.__name__,res))
+            return res
+
+        return led
+
+    # Compiles the unary operator.  The right-hand operand is compiled here, as
+    # nud() evaluates it.
+    # Returns:
+    #   a function of the PEvalCtx object of an evaluation returning the operator's
+    #   result
+    def compile_nud(self,ctx):
+        if not self.isunary:
+            raise PParserError(ptok=self,msg=" is not a unary operator")
+        right=ctx.parser._compile(ctx,bp=self.rbp)
+        calc_nud=self.calc_nud
+
+        def nud(ectx):
+            rval=right(ectx)
+            try:
+                res=calc_nud(ectx,rval)
+            except PEvaluationError as ee:
+                raise PParserError(ptok=self,msg=ee.msg) from None
+            if res is None:
+                raise ValueError("%s %s.nud expression -> %s" \
+                    % (eloc(self,"compile_nud"),self.__class__.__name__,res))
+            return res
+
+        return nud
+
     # Override either of these methods to modify the results of a trace
     def trace_led(self,left,right,res):
         print("%s %s %s -> %s" % (left,self.symbol,right,res))
@@ -359,6 +420,25 @@ class PLit(PToken):
     def value(self,*args,**kwds):
         return self.src
 
+    # Compiles the literal.
+    # Returns:
+    #   a function of the PEvalCtx object of an evaluation returning the literal's
+    #   value
+    def compile_nud(self,ctx):
+        value=self.value
+
+        def nud(ectx):
+            try:
+                res=value(external=ectx.external)
+            except PEvaluationError as ee:
+                raise PParserError(ptok=self,msg=ee.msg) from None
+            if res is None:
+                raise ValueError("%s %s.nud expression -> %s" \
+                    % (eloc(self,"compile_nud"),self.__class__.__name__,res))
+            return res
+
+        return nud
+
 # This subclass of PLit assumes the source is a lexer.Token instance.
 class PLitTID(PLit):
     def __init__(self,token,external=None):
@@ -565,6 +645,15 @@ class PLParen(Operator):
         ctx.pexp-=1
         return right
 
+    # Compiles the parenthesized sub-expression.  The right parenthesis is matched
+    # once, here, rather than each time the expression is evaluated.
+    def compile_nud(self,ctx):
+        right=ctx.parser._compile(ctx,bp=self.rbp)
+        ctx.pexp+=1
+        ctx.match(PRParen)
+        ctx.pexp-=1
+        return right
+
 
 class PRParen(Operator):
     def __init__(self,src=None):
@@ -914,6 +1003,20 @@ class PCtx(object):
                 print("PCtx.next() returning [%s]: %s" % (curndx,r))
         return r
 
+
+# This class is the context of one evaluation of a compiled expression.  It is
+# passed to the calc_led() and calc_nud() methods of operators in place of the
+# PCtx object used by the PParser.run() method.  Token consumption and parenthesis
+# tracking occur when the expression is compiled, so only the parser and the
+# evaluation's external helper object are available.  See the PParser.compile()
+# method.
+class PEvalCtx(object):
+    __slots__=["parser","external"]
+    def __init__(self,parser,external=None):
+        self.parser=parser        # Parser that compiled the expression
+        self.external=external    # External helper object of this evaluation
+
+
 # This class defines an expression that will be evalutated.  It is the primary
 # interface for the presentation of an expression that will be evualted one or 
 # more times by the PParser object.  It only understand PToken objects.  If some
@@ -932,6 +1035,9 @@ class PExpr(object):
 
         # If True, binding attributes have been applied to the Operator objects.
         self._isinit=False
+        # Function evaluating the expression created by the compile() method or
+        # None when the expression is evaluated by the PParser object.
+        self.compiled=None
         if not isinstance(tokens,list):
             self.toks=[tokens,]
         else:
@@ -943,6 +1049,13 @@ class PExpr(object):
             string="%s\n    %s" % (string,tok.__class__.__name__)
         return string
 
+    # Compiled functions can not be pickled.  A restored expression is evaluated
+    # by its PParser object until compiled again.
+    def __getstate__(self):
+        state=self.__dict__.copy()
+        state["compiled"]=None
+        return state
+
     # This method performs error checks on the supplied tokens.  Initialization occurs
     # once for the object.  Because operator binding values are performed here,
     # once the object is initialized it is expected to be evalutated using the same
@@ -979,6 +1092,21 @@ class PExpr(object):
                     from None
 
         self._isinit=True  # Expression is initialized and ready for use.
+
+    # Compiles the expression into a function for repeated evaluation.  See the
+    # PParser.compile() method.  An expression that can not be compiled remains
+    # evaluated by the PParser object, which reports any error when the
+    # expression is evaluated.
+    # Method Arguments:
+    #   pparser   The PParser object that evaluates the expression
+    # Returns:
+    #   the compiled function or None
+    def compile(self,pparser):
+        try:
+            self.compiled=pparser.compile(self)
+        except Exception:
+            self.compiled=None
+        return self.compiled
         
     # Used to identify an return the only token when the expression is just one
     # token.  The user must know how to invoke the token's value() method.
@@ -993,6 +1121,7 @@ class PExpr(object):
         else:
             self.toks.append(tok)
         self._isinit=False
+        self.compiled=None
 
 
 # This class is the base class of the operator precedence evaluator.
@@ -1194,6 +1323,42 @@ class PParser(object):
 
         return left
 
+    # Compiles a sub expression bounded by PToken binding properties.  The same
+    # operator precedence decisions made by the _expression() method are made
+    # here, once, with each token's compile_nud() or compile_led() method creating
+    # a function in place of a value.
+    # Method Arguments:
+    #   ctx     PCtx object containing the compilation state
+    #   bp      PTokens whose left binding property exceed this binding property
+    #           are compiled.  See the _expression() method.
+    # Returns:
+    #   a function of the external helper object returning the sub expression's
+    #   result
+    def _compile(self,ctx,bp=0):
+        t=ctx.ptoken
+        next_tok=ctx.ptoken=ctx.next()
+
+        if isinstance(t,Operator) and t.isunary and isinstance(next_tok,PEnd):
+            raise PParserError(ptok=t,msg="operand required for operator")
+        left=t.compile_nud(ctx)
+
+        while True:
+            if isinstance(ctx.ptoken,PLit):
+                raise PParserError(ptok=ctx.ptoken,msg="not an operator")
+            if not bp < ctx.ptoken.lbp:
+                break
+            t=ctx.ptoken
+            if isinstance(t,PEnd):
+                break
+            next_token=ctx.next()
+            if isinstance(next_token,PEnd):
+                raise PParserError(ptok=ctx.ptoken,\
+                    msg="operand required for operator")
+            ctx.ptoken=next_token
+            left=t.compile_led(ctx,left)
+
+        return left
+
     # Occasionally this class needs to create a PToken object.  This method
     # applies the same processes to it as does the Expr._init() method.
     #def _gen(self,tokcls):
@@ -1314,6 +1479,33 @@ class PParser(object):
         except KeyError:
             self.bindings[bnd.cls]=bnd  
 
+    # Compiles an expression into a Python function.  The function performs the
+    # same operator calculations in the same sequence as does the run() method,
+    # but operator precedence and parenthesis matching are resolved once, here,
+    # rather than on each evaluation.  Use the PExpr.compile() method to have the
+    # run() method use the compiled function.
+    # Method Argument:
+    #   expr      A PExpr object defining an expression for evaluation
+    # Returns:
+    #   a function whose single argument is the external helper object and whose
+    #   result is that of the expression's evaluation.
+    # Exception:
+    #   PParserError if the expression is not syntactically valid
+    def compile(self,expr):
+        ctx=PCtx(self,expr)
+        func=self._compile(ctx,bp=0)
+        ctx.ck_parens()
+        if ctx.pexp!=0:
+            raise PParserError(msg="unbalanced parenthesis")
+
+        # The compile time PCtx object is not passed to the compiled operator
+        # calculations.  Each evaluation supplies its own context with its external
+        # helper object.
+        def run(external):
+            return func(PEvalCtx(self,external))
+
+        return run
+
     # Evalutes an expression based upon defined operator precedence rules
     # Method Arguments:
     #   expr      A PExpr object defining an expression for evaluation
@@ -1333,6 +1525,9 @@ class PParser(object):
     #   PParserError if the object detects an error during evaluation.
     #   Other exceptions are possible if subclasses implement them.
     def run(self,expr,external=None,debug=False,trace=False,_test=False):
+        if expr.compiled is not None and not (debug or trace or _test):
+            return expr.compiled(external)
+
         ctx=PCtx(self,expr,external=external,debug=debug)
         #self._start(expr)
 
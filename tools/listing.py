@@ -325,8 +325,9 @@ class Title(object):
 # This class manages creation of listings.  It is expected to be subclassed by a user
 # that instantiates other classes or their subclasses found in this module.  It deals
 # strictly in entire output lines.  It expects to provide all line formatting
-# characters.  The report is built in memory and returned to the subclass or written
-# to a file.  It operates on a "pull" design.  The lines are requested from the
+# characters.  The report is either built in memory and returned to the subclass or
+# streamed to a file, each line being written as it is created.  It operates on a
+# "pull" design.  The lines are requested from the
 # subclass as the listing file needs them, hence "pulling" them from the subclass.
 #
 # There is no requirement to utilize the various Column related classes when using
@@ -340,41 +341,57 @@ class Listing(object):
         self.pagelines=0          # Number of detail lines on this page
         self.first_page=True      # Indicates whether this is the first new page
 
-    # Completes the listing file by returning the report as a string or, if
-    # filename is provided, writes the report to the file.  In this latter case
-    # None is returned.
-    def __eor(self,filename=None,filemode="wt"):
+        # When a listing is streamed, lines are written to this open file object
+        # as they are created rather than being accumulated in the report list.
+        self.out=None             # Open file object of a streamed listing
+        self.written=False        # Whether a line has been written to the file
+
+    # Completes the listing by returning the report as a string or, if streamed
+    # to a file, by writing the final FF.  In this latter case None is returned.
+    def __eor(self):
+        if self.out is not None:
+            # Add a final FF to the streamed report
+            if self.written:
+                self.out.write("\f")
+            self.out=None
+            return None
+
         # Add a final FF to report
         if self.report:
             self.report.append("\f")
-        lines="".join(self.report)
-        if filename is None:
-            return lines
+        return "".join(self.report)
 
-        try:
-            fo=open(filename,filemode)
-        except IOError:
-            raise ValueError("%s could not open listing file for writing: %s"\
-                % (eloc(self,"__eor"),filename)) from None
+    # Add text to the report or write it to the streamed listing file
+    def __emit(self,text):
+        if self.out is None:
+            self.report.append(text)
+        else:
+            self.out.write(text)
+            self.written=True
 
-        try:
-            fo.write(lines)
-        except IOError:
-            raise ValueError("%s could not completely write listing file: %s" \
-                % (eloc(self,"__eor"),filename)) from None
+    # Generate the listing one line at a time
+    # Method Argument:
+    #   fo    An open file object to which the listing is written as created, or
+    #         None to return the listing as a string.
+    def __generate(self,fo):
+        self.report=[]
+        self.pagelines=0
+        self.out=fo
+        self.written=False
 
-        try:
-            fo.close()
-        except IOError:
-            raise ValueError("%s could not close listing file: %s" \
-                % (eloc(self,"__eor"),filename))
+        while True:
+            det=self.detail()
+            #print("listing.generates det: '%s'" % det)
+            if det is None:
+                return self.__eor()
+            self.__line(det)
 
     # Output a single line, while performing top of form output.
     def __line(self,line):
         if self.pagelines==0:
             self.__new_page()
         outline="%s\n" % line.rstrip()
-        self.report.append(outline)
+        self.__emit(outline)
         self.pagelines+=1
         if self.pagelines>self.lines:
             self.pagelines=0  # Generate a title next time around
@@ -389,7 +406,7 @@ class Listing(object):
         else:
             ff="\f"
         line="%s%s\n" % (ff,title)
-        self.report.append(line)
+        self.__emit(line)
         self.pagelines=1
         self.space(n=1)
         line=self.heading()
@@ -408,18 +425,31 @@ class Listing(object):
     def eject(self):
         self.pagelines=0
 
-    # Generate the report and return it as a string if filename is not provided,
-    # otherwise write the listing to the supplied filenmame with supplied filemode.
-    def generate(self,filename=None,filemode="wt"):
-        self.report=[]
-        self.pagelines=0
+    # Generate the report and return it as a string if neither filename nor fo is
+    # provided.  Otherwise the report is streamed, each line being written as it is
+    # created, to the open file object fo or to the supplied filename opened with
+    # the supplied filemode.  None is returned when the report is streamed.
+    def generate(self,filename=None,filemode="wt",fo=None):
+        if fo is not None or filename is None:
+            return self.__generate(fo)
 
-        while True:
-            det=self.detail()
-            #print("listing.generates det: '%s'" % det)
-            if det is None:
-                return self.__eor(filename,filemode=filemode)
-            self.__line(det)
+        try:
+            fo=open(filename,filemode)
+        except IOError:
+            raise ValueError("%s could not open listing file for writing: %s"\
+                % (eloc(self,"generate"),filename)) from None
+
+        try:
+            self.__generate(fo)
+        except IOError:
+            raise ValueError("%s could not completely write listing file: %s" \
+                % (eloc(self,"generate"),filename)) from None
+        finally:
+            try:
+                fo.close()
+            except IOError:
+                raise ValueError("%s could not close listing file: %s" \
+                    % (eloc(self,"generate"),filename))
 
     # Subclass must generate a heading line when requested.
     def heading(self):
@@ -0,0 +1,124 @@
+#!/usr/bin/python3
+# Copyright (C) 2026 The SATK contributors
+#
+# This file is part of SATK.
+#
+#     SATK is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     SATK is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with SATK.  If not, see <http://www.gnu.org/licenses/>.
+
+# This module regenerates the LL(1) parse tables of the SATK language processors.
+# A parse table holds the analyzed productions of a language's grammar.  A tool
+# supplied with the table directory restores its parser from the table rather
+# than processing the grammar each time it starts.  Tables are named by a hash of
+# the grammar, so a changed grammar never uses a stale table.  Regenerating the
+# tables after a grammar changes avoids processing the grammar on the next use.
+#
+# Languages are selected by name on the command line.  All languages are
+# regenerated when none are named.
+
+this_module="ll1tables.py"
+copyright="%s Copyright (C) %s The SATK contributors" % (this_module,"2026")
+
+# Python imports:
+import sys               # Access the exit method
+if sys.hexversion<0x03030000:
+    raise NotImplementedError("%s requires Python version 3.3 or higher, "
+        "found: %s.%s" % (this_module,sys.version_info[0],sys.version_info[1]))
+import argparse          # Access the command line parser
+
+# Setup PYTHONPATH
+import satkutil          # Access utility functions
+satkutil.pythonpath("tools/lang")
+
+# SATK imports:
+import LL1grammar        # Access the parse tables
+
+
+#
+#  +-------------------------+
+#  |                         |
+#  |   Language Processors   |
+#  |                         |
+#  +-------------------------+
+#
+
+# Each function creates a language processor.  Creating the processor processes
+# its grammar and writes its parse table.  The function returns the
+# LL1parser.Parser object of the language.
+
+# The saconfig.py configuration language
+def saconfig():
+    import saconfig
+    dm=satkutil.DM(parser=True,langutil=True,lexer=True)
+    return saconfig.SACFG(dm).lang
+
+# Languages by command line name
+LANGUAGES={"saconfig":saconfig}
+
+
+#
+#  +-----------------------------+
+#  |                             |
+#  |   Command Line Processing   |
+#  |                             |
+#  +-----------------------------+
+#
+
+# Parse the command line arguments
+def parse_args():
+    parser=argparse.ArgumentParser(prog=this_module,
+        epilog=copyright,
+        description="regenerate the LL(1) parse tables of SATK languages")
+
+    names=sorted(LANGUAGES.keys())
+    parser.add_argument("language",nargs="*",metavar="LANGUAGE",default=[],\
+        help="language whose parse table is regenerated.  Multiple may be "
+             "specified.  Defaults to all languages: %s" % ", ".join(names))
+
+    parser.add_argument("-d","--dir",required=True,metavar="DIR",\
+        help="directory of the parse tables")
+
+    parser.add_argument("-b","--bindings",action="store_true",default=False,\
+        help="list the callback bindings recorded in each parse table")
+
+    args=parser.parse_args()
+    for name in args.language:
+        if name not in LANGUAGES:
+            parser.error("unrecognized language: %s" % name)
+    return args
+
+if __name__ == "__main__":
+    args=parse_args()
+    names=args.language
+    if not names:
+        names=sorted(LANGUAGES.keys())
+    LL1grammar.Tables.enable(args.dir,regen=True)
+    failed=0
+    for name in names:
+        saved=LL1grammar.Tables.saved
+        lang=LANGUAGES[name]()
+        if LL1grammar.Tables.saved==saved:
+            print("%s: parse table not written" % name)
+            failed+=1
+            continue
+        prods=lang.prds
+        key=LL1grammar.ParseTables.key(lang.go.specification,\
+            prods.gp.start(),lang.lex,lang.go.analyzer)
+        pids=len(prods.gp.iter_pids())
+        print("%s: %s  %d productions" \
+            % (name,LL1grammar.Tables.table_file(key),pids))
+        if args.bindings:
+            for point,pid,method in LL1grammar.Tables.bindings(lang):
+                print("    %-8s %-32s %s" % (point,pid,method))
+    if failed:
+        sys.exit(1)
@@ -32,23 +32,31 @@
 # file containing EBCDIC data records of 80 bytes without intervening line
 # terminating characters between each record.
 #
-# This module exposes two module functions and one class to the user of this
-# module.  The three module functions are:
+# This module exposes these module functions to the user of this module:
 #
 #   objlib.read()      - reads a file as a binary byte sequence returning each
 #                        record as either a RAWREC or OBJREC object without
 #                        separation of records into individual modules
 #   objlib.read_deck() - reads a file returning a DECK object containing one
 #                        or more MODULE objects
+#   objlib.records()   - iterates over the 80-byte records of a file without
+#                        decoding them
+#   objlib.scan()      - iterates over the OBJREC objects of only the requested
+#                        record types, decoding no other records
 #   objlib.write()     - writes a byte sequence to a host file from a list
 #                        of OBJREC objects, a MODULE object or a DECK
 #                        object containing multiple modules.
 #
 # Language translators or linkage editor processes are expected to use
-# objlib.read_deck() and objlib.write().  The objutil.py module uses all
-# of these module functions.
+# objlib.read_deck() and objlib.write().  The objutil.py module uses
+# objlib.read(), objlib.read_deck() and objlib.write().  The objlib.read()
+# function reads its records using objlib.records().  No tool currently calls
+# objlib.records() or objlib.scan() directly.  They are provided for tools that
+# only need some of the records, for example, an inventory of external symbols
+# from the ESD records.  Records are written in large blocks by the RecordWriter
+# class.
 #
-# These two functions may raise OBJFileError or OBJRecordError exceptions.
+# These functions may raise OBJFileError or OBJRecordError exceptions.
 #
 # The library is intended to be used by a language translator that creates
 # an object module or by a linkage editor process that manipulates object
@@ -57,9 +65,28 @@
 
 this_module="objlib.py"
 
+# Python imports:
+import bisect       # Access position-sorted indexes
+import mmap         # Access memory mapped object deck files
+import os           # Access file status
+
+# SATK imports:
+import satkutil     # Access the PYTHONPATH utility
+satkutil.pythonpath("tools/lang",nodup=True)  # codepage requires the sopl module
+import codepage     # Access shared translation tables
+
 # Python EBCDIC code page used for conversion to/from ASCII
 # Change this value to use a different Python codepage.
 EBCDIC="cp037"
+CPTRANS=codepage.codec(EBCDIC)   # Shared translator of the code page
+
+# Translation of EBCDIC to printable ASCII used by print_ebcdic().  A code point
+# whose ASCII equivalent is not printable is replaced by a period, '.'
+PRINTABLE=codepage.TransTable(table="".join(\
+    [c if c.isprintable() else "." for c in bytes(range(256)).decode(EBCDIC)]))
+
+# Number of 80-byte records read or written by a single I/O operation
+BLOCK=1024
 
 #
 #  +-----------------------------+
@@ -76,33 +103,13 @@ EBCDIC="cp037"
 #   an ASCII printable string of each EBCDIC code point converted to ASCII or
 #   where the code point is not EBCDIC, is replaced by a period '.'
 def print_ebcdic(byts):
-    assert isinstance(byts,(bytes,bytearray)),\
+    assert isinstance(byts,(bytes,bytearray,memoryview)),\
         "'byts' argument must be a byte sequence: %s" % byts
 
-    cp=EBCDIC    # Python EBCDIC encoding name
-    chars=[]     # list of ASCII single character strings
-    for n in range(len(byts)):
-        # Extract each byte as a sequence of one byte.
-        byt=byts[n:n+1]
-        # Convert the single byte from EBCDIC to ASCII
-        ch=byt.decode(cp)
-        # The decode method returns an ASCII character that is the
-        # equivalent of the source binary EBCDIC code point when one exists.
-        # If the source byte is not recognized the character is returned
-        # unchanged.
-
-        # In some cases the returned single character string is not a printable
-        # ASCII character.  When the print built-in function is called, such
-        # unprintable characters are removed from the printed result. In these
-        # cases the unprintable ASCII character is also replaced by a printable
-        # period, '.'
-        if not ch.isprintable():
-            ch="."
-        chars.append(ch)
-
-    # Convert the list of characters into a string of characters and
-    # return the result
-    return "".join(chars)
+    # The whole sequence is translated by the precompiled table.  Unprintable
+    # characters would be removed by the print built-in function, so the table
+    # replaces them with a printable period, '.'
+    return PRINTABLE.translate_s(byts)
 
 # Read a single object module host file
 # Function Arguments:
@@ -136,56 +143,24 @@ def read(filepath,raw=False,items=True):
     assert isinstance(filepath,str),\
         "'filepath' argument must be a string: %s" % filepath
 
-    fo=None     # The file object created when the file is opened
     recs=[]     # Accumulates each 80-byte EBCDIC object record as byte seq.
-    recnum=0    # Record number
     errors=0    # Number of errors during decode
 
-    # Open and read the object module file
-    try:
-        fo=open(filepath,"rb")
-    except IOError as ie:
-        raise OBJFileError(\
-            msg="object module file %s could not be opened for reading: %s"\
-                % (filepath,ie)) from None
-
     # Read the object module file's records.
-    while True:
-        recnum+=1
-        try:
-            byts=fo.read(80)
-        except IOError as ie:
-            raise OBJFileError(\
-                msg="object module file %s could not be read record %s: %s" \
-                % (filepath,recnum,ie)) from None
-        if len(byts)==0:
-            break
-
-        if len(byts)!=80:
-            raise OBJFileError(\
-                msg="object module file %s last record %s truncated: %s" \
-                    % (filepath,recnum,len(byts)))
-
+    for recnum,byts in records(filepath):
         # Accumulate output records
         if raw:
             # Return the raw bytes from the file as a RAWREC object
-            recs.append(RAWREC(byts,recnum=recnum))
+            recs.append(RAWREC(bytes(byts),recnum=recnum))
         else:
             # Return a list of OBJREC objects
             try:
-                recs.append(OBJREC.decode(byts,recnum=recnum,items=items))
+                recs.append(OBJREC.decode(bytes(byts),recnum=recnum,items=items))
             except OBJRecordError as oe:
                 print("OBJ error [%s] %s" % (recnum,oe.msg))
                 errors+=1
                 continue
 
-    # Close the object module file
-    try:
-        fo.close()
-    except IOError as ie:
-        raise OBJFileError(msg="object module file %s could not be closed: %s"\
-            % (filepath,ie)) from None
-
     if errors:
         raise OBJFileError(\
             msg="object module file %s contains record errors: %s" \
@@ -210,6 +185,141 @@ def read_deck(filepath):
     return DECK(recs=read(filepath),filepath=filepath)
 
 
+# Iterate over the records of an object deck file.  The file is read in blocks of
+# records or, when requested, memory mapped.  No record is decoded.
+# Function Arguments:
+#   filepath   A string of the path to the object deck file being read.
+#   mapped     Specify True to memory map the file.  Specify False to read the
+#              file in blocks.  Defaults to False.
+#   block      The number of records read by each read operation when the file is
+#              not memory mapped.  Defaults to BLOCK.
+# Returns:
+#   a generator of tuples of the record number and a memoryview of the record's
+#   80 bytes.  The memoryview is only valid until the next record is requested.
+#   Use bytes() to retain the record's content.
+# Exceptions:
+#   OBJFileError   if I/O errors occur or a truncated record is encountered.
+def records(filepath,mapped=False,block=BLOCK):
+    assert isinstance(filepath,str),\
+        "'filepath' argument must be a string: %s" % filepath
+    assert isinstance(block,int) and block>0,\
+        "'block' argument must be a positive integer: %s" % block
+
+    # Open the object module file
+    try:
+        fo=open(filepath,"rb")
+    except IOError as ie:
+        raise OBJFileError(\
+            msg="object module file %s could not be opened for reading: %s"\
+                % (filepath,ie)) from None
+
+    try:
+        if mapped:
+            yield from _records_mapped(filepath,fo)
+        else:
+            yield from _records_read(filepath,fo,block)
+    finally:
+        # Close the object module file
+        try:
+            fo.close()
+        except IOError as ie:
+            raise OBJFileError(\
+                msg="object module file %s could not be closed: %s"\
+                    % (filepath,ie)) from None
+
+# Iterate over the records of a memory mapped object deck file.
+def _records_mapped(filepath,fo):
+    try:
+        size=os.fstat(fo.fileno()).st_size
+        if size==0:
+            # An empty file can not be mapped and has no records
+            return
+        mm=mmap.mmap(fo.fileno(),0,access=mmap.ACCESS_READ)
+    except (IOError,ValueError) as ie:
+        raise OBJFileError(\
+            msg="object module file %s could not be mapped: %s" \
+                % (filepath,ie)) from None
+
+    view=memoryview(mm)
+    try:
+        yield from _records_split(filepath,view,len(view),1)
+    finally:
+        view.release()
+        mm.close()
+
+# Iterate over the records of an object deck file read in blocks.
+def _records_read(filepath,fo,block):
+    buf=bytearray(80*block)
+    view=memoryview(buf)
+    recnum=1       # Record number of the first record in the block
+    try:
+        while True:
+            try:
+                length=fo.readinto(buf)
+            except IOError as ie:
+                raise OBJFileError(\
+                    msg="object module file %s could not be read record %s: %s" \
+                    % (filepath,recnum,ie)) from None
+            if not length:
+                break
+            yield from _records_split(filepath,view,length,recnum)
+            recnum+=length//80
+    finally:
+        view.release()
+
+# Iterate over the 80-byte records of a buffer.
+# Function Arguments:
+#   filepath   The path of the file from which the buffer was read
+#   view       A memoryview of the buffer
+#   length     The number of bytes in the buffer containing file content
+#   recnum     The record number of the first record in the buffer
+def _records_split(filepath,view,length,recnum):
+    for ndx in range(0,length,80):
+        if length-ndx<80:
+            raise OBJFileError(\
+                msg="object module file %s last record %s truncated: %s" \
+                    % (filepath,recnum,length-ndx))
+        rec=view[ndx:ndx+80]
+        try:
+            yield (recnum,rec)
+        finally:
+            # Released even when the consumer stops early, so that the mapped
+            # file can be closed
+            rec.release()
+        recnum+=1
+
+
+# Iterate over the object records of the requested types in an object deck file.
+# Records of other types are not decoded.
+# Function Arguments:
+#   filepath   A string of the path to the object deck file being read.
+#   types      A list of the OBJREC subclasses whose records are decoded, for
+#              example [ESD] for a scan of the external symbols.  Specify None
+#              to decode all records.  Defaults to None.
+#   items      Specify True to decode record items into Python objects.
+#              Specify False to inhibit record item decodes.  Default is True.
+#   mapped     Specify True to memory map the file.  Defaults to False.
+# Returns:
+#   a generator of OBJREC objects
+# Exceptions:
+#   OBJFileError   if I/O errors occur or a truncated record is encountered.
+#   OBJRecordError if an error is encountered while decoding a requested record.
+def scan(filepath,types=None,items=True,mapped=False):
+    if types is None:
+        ids=None
+    else:
+        ids=set()
+        for cls in types:
+            assert issubclass(cls,OBJREC),\
+                "'types' argument must contain OBJREC subclasses: %s" % cls
+            ids.add(cls.ID)
+
+    for recnum,byts in records(filepath,mapped=mapped):
+        if ids is not None and bytes(byts[:4]) not in ids:
+            continue
+        yield OBJREC.decode(bytes(byts),recnum=recnum,items=items)
+
+
 # Write a singe object module host file. If the file already exists it will
 # be truncated to an empty file before writing begins.
 # Function arguments:
@@ -228,49 +338,108 @@ def write(filepath,lst,raw=False):
         "'filepath' argument must be a string: %s" % filepath
     assert isinstance(lst,list),"'lst' argument must be a list: %s" % lst
 
-    bytes=None   # A binary object file record being written
-
-    try:
-        fo=open(filepath,"wb")
-    except IOError as ie:
-        raise OBJFileError(\
-            msg="object module file %s could not be opened for writing: %s"\
-                % (filepath,ie)) from None
+    byts=None    # A binary object file record being written
 
+    wo=RecordWriter(filepath)
     for n,entry in enumerate(lst):
         if raw:
             assert isinstance(entry,bytes),\
                 "'lst' entry %s must be a byte sequence: %s" \
                     % (n,entry)
-            bytes=entry
+            byts=entry
         else:
             assert isinstance(entry,OBJREC),\
                 "'lst' entry %s must be an OBJREC object: %s" \
                     % (n,entry)
             try:
-                bytes=entry.encode()
+                entry.encode()
             except OBJRecordError as oe:
                 raise OBJRecordError(\
                     msg="record %s could not be encoded: %s: %s"\
                         % (n+1,oe.msg,entry))
+            byts=entry.ebin
 
-        if len(bytes)!=80:
-            raise OBJRecordError(msg="record %s not 80 bytes in length: %s" \
-                % (n+1,len(bytes)))
+        wo.write(byts)
+
+    wo.close()
+
+
+# This class writes 80-byte records to an object deck file.  Records are
+# accumulated and written in blocks rather than individually.  If the file already
+# exists it will be truncated to an empty file before writing begins.
+#
+# Instance Arguments:
+#   filepath   The path of the file being written
+#   block      The number of records written by each write operation.  Defaults
+#              to BLOCK.
+# Exceptions:
+#   OBJFileError if I/O errors occur while writing the file
+class RecordWriter(object):
+    def __init__(self,filepath,block=BLOCK):
+        assert isinstance(filepath,str),\
+            "'filepath' argument must be a string: %s" % filepath
+        assert isinstance(block,int) and block>0,\
+            "'block' argument must be a positive integer: %s" % block
+
+        self.filepath=filepath
+        self.size=80*block      # Number of bytes written by each write operation
+        self.buf=bytearray()    # Accumulated records not yet written
+        self.recnum=0           # Number of records accepted
+
+        try:
+            self.fo=open(filepath,"wb")
+        except IOError as ie:
+            raise OBJFileError(\
+                msg="object module file %s could not be opened for writing: %s"\
+                    % (filepath,ie)) from None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self,exc_type,exc_value,traceback):
+        self.close()
 
+    # Write the accumulated records.
+    def __flush(self):
         try:
-            fo.write(bytes)
+            self.fo.write(self.buf)
         except IOError as ie:
             raise OBJFileError(\
                 msg="object module file %s record %s could be written: %s" \
-                    % (filepath,n+1,ie))
+                    % (self.filepath,self.recnum,ie)) from None
+        self.buf.clear()
 
-    try:
-        fo.close()
-    except IOError as ie:
-        raise OBJFileError(\
-            msg="object module file %s could not be closed: %s"\
-                % (filepath,ie))
+    # Write any remaining records and close the file.
+    def close(self):
+        if self.fo is None:
+            return
+        if self.buf:
+            self.__flush()
+        try:
+            self.fo.close()
+        except IOError as ie:
+            raise OBJFileError(\
+                msg="object module file %s could not be closed: %s"\
+                    % (self.filepath,ie)) from None
+        self.fo=None
+
+    # Add a record to the file.
+    # Method Argument:
+    #   byts   a bytes-like object of length 80 or an OBJREC object
+    # Exceptions:
+    #   OBJRecordError if the record is not 80 bytes in length
+    #   OBJFileError if I/O errors occur while writing the file
+    def write(self,byts):
+        if isinstance(byts,OBJREC):
+            byts.encode()
+            byts=byts.ebin
+        self.recnum+=1
+        if len(byts)!=80:
+            raise OBJRecordError(msg="record %s not 80 bytes in length: %s" \
+                % (self.recnum,len(byts)))
+        self.buf+=byts
+        if len(self.buf)>=self.size:
+            self.__flush()
 
 
 #
@@ -299,12 +468,12 @@ def addr2bin(addr):
 def a2e(string):
     assert isinstance(string,str),\
         "'string' argument must be a string: %s" % string
-    return string.encode(EBCDIC)
+    return CPTRANS.a2eb(string)
 
 def e2a(byt):
-    assert isinstance(byt,(bytes,bytearray)),\
+    assert isinstance(byt,(bytes,bytearray,memoryview)),\
         "'byt' argument must be a byte sequence: %s" % byt
-    return byt.decode(EBCDIC)
+    return CPTRANS.e2as(byt)
 
 # Converts a lit of two bytes into an signed or unsigned integer
 def hword(binary,signed=False):
@@ -610,6 +779,10 @@ class MODULE(PMOD):
 
         self.txtitems=[]                   # TXTITEMS in the order presented
 
+        # RLD items that the populate() method could not resolve, as tuples of
+        # the RLDITEM object and the reason.  See ExternalSymbolDict.resolve_RLDs()
+        self.rejected=[]
+
     # Add items to External Symbol Dictionary
     # This internal method is used when the MODULE object is being populated
     # from a series of OBJREC objects supplied to the instantiated PMOD
@@ -836,7 +1009,10 @@ class MODULE(PMOD):
         self.curarea=area
         return area
 
-    # Populate this MODULE object from the superclass PMOD object records
+    # Populate this MODULE object from the superclass PMOD object records.  As when
+    # the deck was read, RLD items are not validated.  An RLD item whose pointers
+    # are undefined or whose address is outside of its position area is not added
+    # to an area and is recorded in the rejected attribute instead.
     # Returns:
     #   Number of records populating the module
     def populate(self):
@@ -849,6 +1025,7 @@ class MODULE(PMOD):
             self._add_item(item)
         for txt in self.txts:
             self._add_text(txt)
+        self.esdict.resolve_RLDs(self.rlditems,rejected=self.rejected)
         return len(self.recs)
 
   # 
@@ -1107,6 +1284,10 @@ class ExternalSymbolDict(object):
         # Symbols in creation sequence. This is the sequence in ESD records
         self.items=[]
 
+        # SD and PC items sorted by starting address.  See area_at() method
+        self.starts=[]          # Sorted starting addresses of the areas
+        self.areas=[]           # Area objects in the same sequence
+
     # Overload:  self[symbol]
     #            self[ESDID]
     #            self[None]    - for PC item access
@@ -1245,7 +1426,7 @@ class ExternalSymbolDict(object):
         return (rarea,parea,atyp)
 
     # This internal method returns the next available ESD ID
-    def _next_esdid():
+    def _next_esdid(self):
         return len(self.esdids)+1
 
     # This method is used to add ESDITEM objects to the External Symbol
@@ -1282,6 +1463,12 @@ class ExternalSymbolDict(object):
             self[item.symbol]=item      # Add the item to the dictionary
             self[item.esdid]=item       # Add the item to the ESDID
 
+        # Add an SD or PC item to the position-sorted index
+        if isinstance(item,(SD,PC)) and item.address is not None:
+            ndx=bisect.bisect_right(self.starts,item.address)
+            self.starts.insert(ndx,item.address)
+            self.areas.insert(ndx,item)
+
         self.items.append(item)         # Add the item to the list of items
 
     # This method, similar to the add_ESD() method, is used to add RLD items
@@ -1291,9 +1478,88 @@ class ExternalSymbolDict(object):
         assert isinstance(rld,RLDITEM),\
             "%s.%s.add_RLD() - 'rld' argument must be an RLDITEM object: %s" \
                 % (this_module,self.__class__.__name__,rld)
-        parea=self[rld.p]
+        parea=self[rld.pptr]
         parea.RLD(rld)
 
+    # Returns the SD or PC item containing an address.
+    # Method Argument:
+    #   address   the address being located
+    # Exception:
+    #   KeyError if no SD or PC item contains the address
+    def area_at(self,address):
+        ndx=bisect.bisect_right(self.starts,address)-1
+        while ndx>=0:
+            area=self.areas[ndx]
+            if area.iswithin(address):
+                return area
+            if area.length:
+                # Areas do not overlap, so no earlier area contains the address
+                break
+            ndx-=1
+        raise KeyError("%s.%s.area_at() - address not within an area: %06X" \
+            % (this_module,self.__class__.__name__,address))
+
+    # Resolves all of the RLD items of a module in one pass.  Each item's position
+    # and relocation pointers are located by ESDID and the item is added to its
+    # position area.  Consecutive RLD items normally share their pointers, so a
+    # pointer is only located when it changes.
+    # Method Arguments:
+    #   rlds      a list of RLDITEM objects
+    #   rejected  a list to which each RLD item that can not be resolved is added
+    #             as a tuple of the RLDITEM object and the reason.  The item is
+    #             otherwise ignored.  Specify None to raise an OBJError instead.
+    #             Defaults to None.
+    # Returns:
+    #   a list of tuples, one per resolved RLD item in the same sequence:
+    #     [0] - the RLDITEM object
+    #     [1] - the ESDITEM object of the relocation pointer or None for CXD items
+    #     [2] - the Area object of the position pointer
+    # Exception:
+    #   OBJError if a pointer is undefined or the position is not within an SD
+    #   or PC item and rejected is None.
+    def resolve_RLDs(self,rlds,rejected=None):
+        esdids=self.esdids
+        resolved=[]
+        rptr=pptr=None      # The pointers of the previous RLD item
+        rarea=parea=None    # The items of the previous RLD item's pointers
+        for rld in rlds:
+            error=None
+            if rld.pptr!=pptr:
+                pptr=rld.pptr
+                try:
+                    parea=esdids[pptr]
+                    if not isinstance(parea,(SD,PC)):
+                        error="RLD item position ESDID %s not a SD/PC: %s"\
+                            % (pptr,parea.__class__.__name__)
+                except KeyError:
+                    error="RLD item position ESDID undefined: %s" % pptr
+                if error:
+                    # Locate the pointer again for the next item
+                    pptr=parea=None
+            if error is None and rld.rptr!=rptr:
+                rptr=rld.rptr
+                if rptr==0:
+                    # CXD items have no relocation pointer
+                    rarea=None
+                else:
+                    try:
+                        rarea=esdids[rptr]
+                    except KeyError:
+                        error="RLD item relocation ESDID undefined: %s" % rptr
+                        rptr=rarea=None
+            if error is None and not parea.iswithin(rld.address):
+                error="RLD item address %06X not within ESDID %s" \
+                    % (rld.address,pptr)
+
+            if error is not None:
+                if rejected is None:
+                    raise OBJError(msg=error)
+                rejected.append((rld,error))
+                continue
+            parea.rlds.append(rld)
+            resolved.append((rld,rarea,parea))
+        return resolved
+
   #
   #  MODULE to External Symbol Dictionary Interface
   #
@@ -1584,7 +1850,7 @@ class ESDITEM(object):
 
     @staticmethod
     def decode_symbol(binary):
-        return binary.decode(EBCDIC).rstrip()
+        return CPTRANS.e2as(binary).rstrip()
 
     def __init__(self,styp,esdid,ignore=False):
         assert isinstance(esdid,int) and esdid>0 or esdid is None,\
@@ -1788,6 +2054,10 @@ class Area(ESDITEM):
         # List of TXTITEM objects associated with this area in the order
         # provided
         self.txts=[]
+        # TXTITEM objects sorted by address.  See text_at() method
+        self.txtaddrs=[]      # Sorted starting addresses of the TXTITEMs
+        self.txtsort=[]       # TXTITEM objects in the same sequence
+        self.txtmax=0         # Length of the longest TXTITEM
 
         # List of RLDITEM objects associated with this area in the order
         # provided.  The position ESDID of the RLD item determines its
@@ -2016,6 +2286,39 @@ class Area(ESDITEM):
         # Note: this is done to allow easy stand-alone images to be built by
         # the linkage editor.
 
+        # Add the TXTITEM to the position-sorted index.  Text is normally
+        # presented in ascending address sequence.
+        address=txt.address
+        self.txtmax=max(self.txtmax,len(txt))
+        if not self.txtaddrs or address>=self.txtaddrs[-1]:
+            self.txtaddrs.append(address)
+            self.txtsort.append(txt)
+        else:
+            ndx=bisect.bisect_right(self.txtaddrs,address)
+            self.txtaddrs.insert(ndx,address)
+            self.txtsort.insert(ndx,txt)
+
+    # Returns the TXTITEM containing an address.  When text overlays the same
+    # address, the TXTITEM starting nearest the address is returned.  An earlier,
+    # longer TXTITEM may contain the address when the nearest one does not, so the
+    # search continues back over each TXTITEM starting within the length of the
+    # longest one.
+    # Method Argument:
+    #   address   the address within the area being located
+    # Exception:
+    #   KeyError if no TXTITEM contains the address
+    def text_at(self,address):
+        ndx=bisect.bisect_right(self.txtaddrs,address)-1
+        lowest=address-self.txtmax    # No TXTITEM starting here reaches address
+        txtaddrs=self.txtaddrs
+        while ndx>=0 and txtaddrs[ndx]>lowest:
+            txt=self.txtsort[ndx]
+            if address<txt.address+len(txt):
+                return txt
+            ndx-=1
+        raise KeyError("%s %s.text_at() - Area '%s' has no text at address: %06X"\
+            % (this_module,self.__class__.__name__,self.symbol,address))
+
     # This method validates than an address is within the range of the Area
     def iswithin(self,address):
         assert isinstance(address,int) and address>=0,\
@@ -2711,12 +3014,12 @@ class IDR(object):
                 % (this_module,len(binary))
 
         trans=binary[0:10]
-        trans=trans.decode(EBCDIC).rstrip()
+        trans=CPTRANS.e2as(trans).rstrip()
 
         V=[]
         for beg,end in [(10,12),(12,14),(14,16),(16,19)]:
             ebcdic=binary[beg:end]
-            ascii=ebcdic.decode(EBCDIC)
+            ascii=CPTRANS.e2as(ebcdic)
             try:
                 value=int(ascii)
             except ValueError:
@@ -3103,7 +3406,7 @@ class PSW(OBJREC):
     # Returns a PSW object containing the record's content
     @classmethod
     def decode(binary):
-        ascii=binary.decode(EBCDIC)
+        ascii=CPTRANS.e2as(binary)
         entry=ascii[7:15].rstrip()
 
         # Process format field
@@ -3172,7 +3475,7 @@ class RGN(OBJREC):
     # Returns an RGN object containing the record's content
     @classmethod
     def decode(binary):
-        ascii=binary.decode(EBCDIC)
+        ascii=CPTRANS.e2as(binary)
         region=ascii[5:14].strip()
 
         # Process load address
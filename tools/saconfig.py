@@ -83,6 +83,7 @@ import os
 import satkutil
 satkutil.pythonpath("tools/lang")   # Dynamically add language tools to PYTHONPATH
 from langutil import *
+import LL1grammar                   # Access the parse tables
 
 # The key-word language processor for SA configuration
 class SACFG(KWLang):
@@ -132,6 +133,8 @@ class SACONFIG(object):
         self.cfgtext=""     # Input configuration file text string
         self.statements=[]  # List of recognized statements, KWStatement instance
 
+        if self.args.tables:
+            LL1grammar.Tables.enable(self.args.tables)
         self.kwlang=SACFG(dm=self.dm,\
                           case=self.args.case,\
                           recovery=self.args.recovery)
@@ -230,6 +233,9 @@ def parse_args(dm):
         help="target directory, defaults to current working directory")
     parser.add_argument("--print",action="store_true",default=False,
         help="display recognized statements as seen by the processor")
+    parser.add_argument("--tables",default=None,metavar="DIR",
+        help="directory of parse tables used in place of processing the "
+             "configuration language grammar.  See ll1tables.py")
     parser.add_argument("--satk",default=False,
         help="Stand-alone Toolkit root directory overriding 'SATK' environment "
              "variable")
@@ -238,7 +244,7 @@ def parse_args(dm):
              "'XTOOLS' environment variable.  Defaults to "
              "'$HOME/crossbuild/run/bin' if neither are available")
     # Add debug argument(s) using the debug manager
-    dm.add_argument(parser)
+    dm.add_argument(parser,"--debug")
     return parser.parse_args()   
 
 dm=satkutil.DM(cmdline="debug",appl=["bdebug","sdebug"],langutil=True)
@@ -0,0 +1,669 @@
+#!/usr/bin/python3
+# Copyright (C) 2026 The SATK contributors
+#
+# This file is part of SATK.
+#
+#     SATK is free software: you can redistribute it and/or modify
+#     it under the terms of the GNU General Public License as published by
+#     the Free Software Foundation, either version 3 of the License, or
+#     (at your option) any later version.
+#
+#     SATK is distributed in the hope that it will be useful,
+#     but WITHOUT ANY WARRANTY; without even the implied warranty of
+#     MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#     GNU General Public License for more details.
+#
+#     You should have received a copy of the GNU General Public License
+#     along with SATK.  If not, see <http://www.gnu.org/licenses/>.
+
+# This module provides performance benchmarks of SATK tool internals.  Each
+# benchmark measures an operation in its original form and its optimized form,
+# when both exist, and reports the rates achieved.  Benchmarks are selected by
+# name on the command line.  All benchmarks are run when none are named.
+
+this_module="satkbench.py"
+copyright="%s Copyright (C) %s The SATK contributors" % (this_module,"2026")
+
+# Python imports:
+import sys               # Access the exit method
+if sys.hexversion<0x03030000:
+    raise NotImplementedError("%s requires Python version 3.3 or higher, "
+        "found: %s.%s" % (this_module,sys.version_info[0],sys.version_info[1]))
+import argparse          # Access the command line parser
+import glob              # Locate benchmark input files
+import os                # Access child process resource usage
+import os.path           # Access path manipulation
+import subprocess        # Access child processes
+import tempfile          # Access temporary directories
+import time              # Access the process timer
+
+# Setup PYTHONPATH
+import satkutil          # Access utility functions
+satkutil.pythonpath("asma")
+satkutil.pythonpath("tools/lang")
+satkutil.pythonpath("tools/ipl")
+
+
+#
+#  +--------------------------+
+#  |                          |
+#  |   Benchmark Base Class   |
+#  |                          |
+#  +--------------------------+
+#
+
+# Base class for all benchmarks.  A subclass provides the run() method and
+# registers itself in the BENCHMARKS dictionary.
+#
+# Instance Arguments:
+#   name     The name of the benchmark as used on the command line
+#   desc     A short description of what is measured
+#   args     The argparse Namespace object of the command line
+class Benchmark(object):
+    def __init__(self,name,desc,args):
+        self.name=name
+        self.desc=desc
+        self.args=args
+        self.repeat=args.repeat   # Number of times each measurement is repeated
+
+    # Run a function the requested number of times returning the best process
+    # time in seconds and the function's last result.
+    def measure(self,func,*args,**kwds):
+        best=None
+        result=None
+        for n in range(self.repeat):
+            start=time.process_time()
+            result=func(*args,**kwds)
+            elapsed=time.process_time()-start
+            if best is None or elapsed<best:
+                best=elapsed
+        return (best,result)
+
+    # Assembles a source file without a listing in a child process the requested
+    # number of times.
+    # Returns:
+    #   the best user and system processor time of the child processes in seconds
+    def cpu(self,source):
+        asma=os.path.join(satkutil.satkdir("tools"),"asma.py")
+        env=dict(os.environ)
+        env["MACLIB"]=satkutil.satkdir("maclib")
+        best=None
+        for n in range(self.repeat):
+            proc=subprocess.Popen([sys.executable,asma,"-t","s390",source],\
+                stdout=subprocess.DEVNULL,stderr=subprocess.DEVNULL,env=env)
+            pid,status,usage=os.wait4(proc.pid,0)
+            seconds=usage.ru_utime+usage.ru_stime
+            if best is None or seconds<best:
+                best=seconds
+        return best
+
+    # Print a rate line
+    def rate(self,label,count,unit,seconds):
+        if seconds:
+            per_sec="%14.1f %s/sec" % (count/seconds,unit)
+        else:
+            per_sec="%14s %s/sec" % ("-",unit)
+        print("    %-24s %10d %-8s %9.4f sec %s" \
+            % (label,count,unit,seconds,per_sec))
+
+    # Print a comparison of two times
+    def speedup(self,before,after):
+        if after:
+            print("    %-24s %10.2fx" % ("speedup",before/after))
+
+    # Perform the benchmark
+    def run(self):
+        raise NotImplementedError("%s subclass %s must provide run() method" \
+            % (this_module,self.__class__.__name__))
+
+
+#
+#  +-----------------------------------+
+#  |                                   |
+#  |   Lexical Analyzer Benchmark      |
+#  |                                   |
+#  +-----------------------------------+
+#
+
+# Tokenizes the operand fields of all macro library statements with the macro
+# statement lexical analyzer, trying each token type in sequence and with the
+# compiled Scanner.
+class LexerBench(Benchmark):
+    def __init__(self,args):
+        super().__init__("lexer","macro operand tokenization",args)
+
+    # Returns a list of operand field strings from the macro library sources
+    @staticmethod
+    def operands(directory):
+        opnds=[]
+        for filename in sorted(glob.glob(os.path.join(directory,"*.mac"))):
+            with open(filename,"rt",errors="replace") as fo:
+                for line in fo:
+                    line=line.rstrip("\n")[:71]
+                    if len(line)==0 or line[0]=="*" or line.startswith(".*"):
+                        continue
+                    fields=line.split(None,2)
+                    if line[0]==" ":
+                        if len(fields)==2:
+                            opnds.append(fields[1])
+                    elif len(fields)==3:
+                        opnds.append(fields[2])
+        return opnds
+
+    @staticmethod
+    def tokenize(lexer,opnds):
+        count=0
+        for opnd in opnds:
+            for tok in lexer.tokenize(opnd,fail=False):
+                count+=1
+        return count
+
+    def run(self):
+        import assembler         # Access the debug manager
+        import macopnd           # Access the macro statement lexical analyzer
+
+        opnds=LexerBench.operands(satkutil.satkdir("maclib"))
+        dm=assembler.Assembler.DM()
+        times=[]
+        for label,compiled in [("sequential types",False),("compiled scanner",True)]:
+            lexer=macopnd.MacroLexer(dm).init()
+            lexer.compiled=compiled
+            seconds,count=self.measure(LexerBench.tokenize,lexer,opnds)
+            self.rate(label,count,"tokens",seconds)
+            times.append(seconds)
+        self.speedup(times[0],times[1])
+
+
+#
+#  +-----------------------------------+
+#  |                                   |
+#  |   Assembly Memory Benchmark       |
+#  |                                   |
+#  +-----------------------------------+
+#
+
+# Assembles a generated source of the requested number of statements in a separate
+# process and reports its peak resident set size (RSS).  The per statement memory
+# is the difference between the peak RSS of the large assembly and that of a
+# minimal assembly, divided by the number of added statements.
+class MemoryBench(Benchmark):
+    def __init__(self,args):
+        super().__init__("memory","assembly peak memory per statement",args)
+        self.lines=args.lines     # Number of generated statements
+
+    # Writes a generated assembly source file with approximately the requested
+    # number of statements: machine instructions and constants in groups of four
+    # with a new USING every 256 statements.
+    @staticmethod
+    def generate(filename,lines):
+        with open(filename,"wt") as fo:
+            fo.write("BIG      START 0\n")
+            for n in range(lines//4):
+                if n%64==0:
+                    fo.write("         USING *,12\n")
+                fo.write("L%06d  LA    1,L%06d          load address\n" % (n,n))
+                fo.write("         L     2,F%06d\n" % n)
+                fo.write("         MVC   0(8,1),F%06d\n" % n)
+                fo.write("F%06d  DC    F'%d'\n" % (n,n))
+            fo.write("         END\n")
+
+    # Assembles a source file with a listing in a child process
+    # Returns:
+    #   the child process's peak RSS in bytes
+    @staticmethod
+    def peak(source,listing):
+        asma=os.path.join(satkutil.satkdir("tools"),"asma.py")
+        env=dict(os.environ)
+        env["MACLIB"]=satkutil.satkdir("maclib")
+        proc=subprocess.Popen([sys.executable,asma,"-t","s390","-l",listing,source],\
+            stdout=subprocess.DEVNULL,stderr=subprocess.DEVNULL,env=env)
+        pid,status,usage=os.wait4(proc.pid,0)
+        if sys.platform=="darwin":
+            return usage.ru_maxrss     # Reported in bytes
+        return usage.ru_maxrss*1024    # Reported in kilobytes
+
+    def run(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            listing=os.path.join(tmpdir,"big.lst")
+            results=[]
+            for name,lines in [("base.asm",0),("big.asm",self.lines)]:
+                source=os.path.join(tmpdir,name)
+                MemoryBench.generate(source,lines)
+                results.append(MemoryBench.peak(source,listing))
+        base,big=results
+        stmts=max(4*(self.lines//4),1)
+        print("    %-24s %10d KB" % ("minimal assembly",base//1024))
+        print("    %-24s %10d KB %10d statements" % ("large assembly",big//1024,stmts))
+        print("    %-24s %10d bytes/stmt" % ("per statement",(big-base)//stmts))
+
+
+#
+#  +-----------------------------------+
+#  |                                   |
+#  |   Macro Invocation Benchmark      |
+#  |                                   |
+#  +-----------------------------------+
+#
+
+# Assembles a generated source invoking the ARCHLVL macro library macro the
+# requested number of times in a separate process and reports the rate of macro
+# invocations.  The macro generates no statements, so the invocation rate reflects
+# the creation of each invocation's symbols and the interpretation of its macro
+# directives.  The processor time of a minimal assembly is subtracted from that of
+# the generated source.
+class MacroBench(Benchmark):
+    def __init__(self,args):
+        super().__init__("macro","macro invocation rate",args)
+        self.invocations=args.invocations   # Number of generated invocations
+
+    # Writes a generated assembly source file with the requested number of macro
+    # invocations.
+    @staticmethod
+    def generate(filename,invocations):
+        with open(filename,"wt") as fo:
+            fo.write("MAC      START 0\n")
+            for n in range(invocations):
+                fo.write("         ARCHLVL ARCHIND=NO,MNOTE=NO\n")
+            fo.write("         END\n")
+
+    def run(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results=[]
+            for name,invocations in [("base.asm",0),("mac.asm",self.invocations)]:
+                source=os.path.join(tmpdir,name)
+                MacroBench.generate(source,invocations)
+                results.append(self.cpu(source))
+        base,big=results
+        print("    %-24s %29.4f sec" % ("minimal assembly",base))
+        self.rate("invocations",self.invocations,"macros",max(big-base,0.0))
+
+
+#
+#  +-----------------------------------+
+#  |                                   |
+#  |   DC/DS Constant Benchmark        |
+#  |                                   |
+#  +-----------------------------------+
+#
+
+# Assembles a generated source of page tables and buffers, constants and storage
+# with large duplication factors, in a separate process and reports the rate of
+# assembled bytes.  The processor time of a minimal assembly is subtracted from
+# that of the generated source.
+class ConstantBench(Benchmark):
+    def __init__(self,args):
+        super().__init__("dcds","DC/DS large duplication factors",args)
+        self.tables=args.tables     # Number of generated page tables and buffers
+
+    # Writes a generated assembly source file with the requested number of page
+    # tables and buffers.
+    # Returns:
+    #   the number of bytes assembled by the source
+    @staticmethod
+    def generate(filename,tables):
+        size=0
+        with open(filename,"wt") as fo:
+            fo.write("PGT      START 0\n")
+            for n in range(tables):
+                fo.write("SEGT%04d DC    256F'0'           segment table\n" % n)
+                fo.write("PAGT%04d DC    256XL4'00000400'  page table\n" % n)
+                fo.write("BUFR%04d DC    4096X'00'         buffer\n" % n)
+                fo.write("WORK%04d DS    4096X             work area\n" % n)
+                fo.write("FILL%04d DC    64CL16'EMPTY'     fill\n" % n)
+                size+=1024+1024+4096+4096+1024
+            fo.write("         END\n")
+        return size
+
+    def run(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results=[]
+            for name,tables in [("base.asm",0),("pgt.asm",self.tables)]:
+                source=os.path.join(tmpdir,name)
+                size=ConstantBench.generate(source,tables)
+                results.append(self.cpu(source))
+        base,big=results
+        print("    %-24s %29.4f sec" % ("minimal assembly",base))
+        self.rate("page tables and buffers",size,"bytes",max(big-base,0.0))
+
+
+#
+#  +-----------------------------------+
+#  |                                   |
+#  |   Object Module Link Benchmark    |
+#  |                                   |
+#  +-----------------------------------+
+#
+
+# Links a generated object module of fullword address constants, each with its
+# own RLD item, at a load address.  The RLD items are resolved in one pass and
+# each address constant is relocated in the TXT data located by its address.
+class LinkBench(Benchmark):
+    def __init__(self,args):
+        super().__init__("rld","object module RLD resolution and relocation",args)
+        self.rlds=args.rlds       # Number of generated RLD items
+
+    # Returns a tuple of the ExternalSymbolDict object of a generated module and
+    # its list of RLD items.  The module has a single SD and one ER item for every
+    # 100 RLD items.  Even numbered address constants are A-type constants of
+    # their own address and odd numbered constants are V-type constants.
+    @staticmethod
+    def generate(rlds):
+        import objlib            # Access the object module library
+
+        esdict=objlib.ExternalSymbolDict()
+        length=rlds*4
+        sd=objlib.SD("MAIN",0,length=length,esdid=1)
+        esdict.add_ESD(sd)
+        externals=max(rlds//100,1)
+        for n in range(externals):
+            esdict.add_ESD(objlib.ER("EXT%05d" % n,esdid=n+2))
+
+        data=bytearray(length)
+        items=[]
+        for n in range(rlds):
+            address=n*4
+            if n % 2:
+                rld=objlib.RLDITEM(2+(n//2) % externals,1,address,1,4,1)
+            else:
+                data[address:address+4]=address.to_bytes(4,byteorder="big")
+                rld=objlib.RLDITEM(1,1,address,0,4,1)
+            items.append(rld)
+        for address in range(0,length,56):
+            sd.TXT(objlib.TXTITEM(1,address,data[address:address+56]))
+        return (esdict,items)
+
+    # Resolves and relocates the RLD items at a load address.  External symbols
+    # are assigned addresses following the SD.
+    # Returns:
+    #   the number of relocated address constants
+    @staticmethod
+    def link(esdict,rlds,load):
+        import objlib            # Access the object module library
+
+        resolved=esdict.resolve_RLDs(rlds)
+        count=0
+        for rld,rarea,parea in resolved:
+            if isinstance(rarea,objlib.Area):
+                target=load+rarea.address
+            else:
+                target=load+esdict[1].length+8*(rarea.esdid-2)
+            txt=parea.text_at(rld.address)
+            ndx=rld.address-txt.address
+            end=ndx+rld.length
+            value=int.from_bytes(txt.bin[ndx:end],byteorder="big")
+            value=(value+rld.sign*target) & 0xFFFFFFFF
+            txt.bin[ndx:end]=value.to_bytes(rld.length,byteorder="big")
+            count+=1
+        return count
+
+    def run(self):
+        esdict,rlds=LinkBench.generate(self.rlds)
+        sd=esdict[1]
+
+        def resolve():
+            resolved=esdict.resolve_RLDs(rlds)
+            sd.rlds=[]
+            return len(resolved)
+
+        def link():
+            count=LinkBench.link(esdict,rlds,0x10000)
+            sd.rlds=[]
+            return count
+
+        seconds,count=self.measure(resolve)
+        self.rate("resolve",count,"RLDs",seconds)
+        seconds,count=self.measure(link)
+        self.rate("resolve and relocate",count,"RLDs",seconds)
+
+
+#
+#  +-----------------------------------+
+#  |                                   |
+#  |   Floating Point Benchmark        |
+#  |                                   |
+#  +-----------------------------------+
+#
+
+# Converts a generated corpus of EB, DB, LB, E, D and L constant literals with the
+# digit list reference conversion and with the exact scaled integer conversion.
+class FloatBench(Benchmark):
+    def __init__(self,args):
+        super().__init__("fpconv","BFP and HFP constant conversion",args)
+        self.constants=args.constants   # Number of generated constants
+
+    # Returns a list of tuples of a DC constant type and a decimal literal.  The
+    # literals have up to 20 significant digits, an optional fraction and an
+    # optional exponent.
+    @staticmethod
+    def generate(types,constants):
+        import random
+        rand=random.Random(0)
+        corpus=[]
+        for n in range(constants):
+            typ=types[n % len(types)]
+            digits=rand.randint(1,20)
+            literal="%s%s" % (rand.choice(["","-"]),\
+                rand.randrange(10**(digits-1),10**digits))
+            point=rand.randint(0,digits)
+            if point<digits:
+                literal="%s.%s" % (literal[:len(literal)-point],\
+                    literal[len(literal)-point:])
+            if rand.randint(0,1):
+                literal="%sE%d" % (literal,rand.randint(-30,30))
+            corpus.append((typ,literal))
+        return corpus
+
+    @staticmethod
+    def convert(types,corpus,reference):
+        for typ,literal in corpus:
+            cls,length=types[typ]
+            cls(literal,length=length,reference=reference).to_bytes()
+        return len(corpus)
+
+    def run(self):
+        import fp                # Access the floating point conversions
+
+        types=fp.exact_types()
+        corpus=FloatBench.generate(sorted(types.keys()),self.constants)
+        times=[]
+        for label,reference in [("digit list reference",True),\
+                                ("scaled integers",False)]:
+            seconds,count=self.measure(FloatBench.convert,types,corpus,reference)
+            self.rate(label,count,"consts",seconds)
+            times.append(seconds)
+        self.speedup(times[0],times[1])
+
+
+#
+#  +-----------------------------------+
+#  |                                   |
+#  |   LL(1) Grammar Analysis          |
+#  |                                   |
+#  +-----------------------------------+
+#
+
+# Analyzes a generated LL(1) grammar of the requested number of production
+# alternatives with the LL1grammar list based analysis, LL1Prods2, and the bit set
+# analysis, LL1Prods3.  Only the analysis is timed, not the recognition of the
+# grammar specification.  Parser startup is then timed processing the complete
+# grammar specification and restoring its productions from a parse table.
+class GrammarBench(Benchmark):
+    def __init__(self,args):
+        super().__init__("ll1","LL(1) grammar FIRST/FOLLOW analysis",args)
+        self.productions=args.productions  # Number of production alternatives
+
+    # Supplies the Parser.idinit() method used by the analysis
+    class Parser(object):
+        def idinit(self,ido,empty=False):
+            pass
+
+    # Returns a tuple: the lexer.Lexer object and the grammar specification string
+    # of a generated grammar with the requested number of production alternatives.
+    # Each statement type is introduced by its own keyword followed by a nullable
+    # list of names and an optional assignment:
+    #
+    #   stmt_n  -> KWn names_n value_n SEMI
+    #   names_n -> NAME names_n
+    #   names_n -> EMPTY
+    #   value_n -> EQUAL NUMBER
+    #   value_n -> EMPTY
+    @staticmethod
+    def generate(productions):
+        import lexer             # Access the lexical analyzer
+        stmts=max(1,(productions-3)//6)
+        lex=lexer.Lexer()
+        for n in range(stmts):
+            lex.type(lexer.Type("KW%d" % n,"kw%d" % n))
+        lex.type(lexer.Type("NAME","[a-z]+"))
+        lex.type(lexer.Type("NUMBER","[0-9]+"))
+        lex.type(lexer.Type("EQUAL","="))
+        lex.type(lexer.Type("SEMI",";"))
+        lex.type(lexer.EOSType())
+        lex.type(lexer.EmptyType())
+
+        lines=["prog -> stmts","stmts -> stmt stmts","stmts -> EMPTY"]
+        for n in range(stmts):
+            lines.append("stmt -> stmt_%d" % n)
+        for n in range(stmts):
+            lines.append("stmt_%d -> KW%d names_%d value_%d SEMI" % (n,n,n,n))
+            lines.append("names_%d -> NAME names_%d" % (n,n))
+            lines.append("names_%d -> EMPTY" % n)
+            lines.append("value_%d -> EQUAL NUMBER" % n)
+            lines.append("value_%d -> EMPTY" % n)
+        return (lex,"\n".join(lines))
+
+    # Returns the GrammarPy object of a recognized grammar specification without
+    # performing its analysis
+    @staticmethod
+    def recognize(lex,spec):
+        import LL1grammar        # Access the LL(1) grammar processor
+
+        class Recognized(LL1grammar.Prods):
+            def validate(self):
+                pass
+
+        grammar=LL1grammar.Grammar(analyzer=Recognized)
+        grammar.lexer(lex)
+        grammar.spec("prog",spec,GrammarBench.Parser())
+        return grammar.gp
+
+    def run(self):
+        import LL1grammar        # Access the LL(1) grammar processor
+
+        lex,spec=GrammarBench.generate(self.productions)
+        count=len(GrammarBench.recognize(lex,spec).iter_pids())
+        alts=len(spec.splitlines())
+        times=[]
+        for label,analyzer in [("lists (LL1Prods2)",LL1grammar.LL1Prods2),\
+                               ("bit sets (LL1Prods3)",LL1grammar.LL1Prods3)]:
+            best=None
+            for n in range(self.repeat):
+                gp=GrammarBench.recognize(lex,spec)
+                start=time.process_time()
+                analyzer(gp,debug=False).validate()
+                elapsed=time.process_time()-start
+                if best is None or elapsed<best:
+                    best=elapsed
+            self.rate(label,alts,"prods",best)
+            times.append(best)
+        print("    %-24s %10d PIDs" % ("non-terminals",count))
+        self.speedup(times[0],times[1])
+
+        # Parser startup: processing the grammar specification versus restoring
+        # the productions from its parse table
+        times=[]
+        with tempfile.TemporaryDirectory() as tables:
+            LL1grammar.Tables.enable(tables)
+            try:
+                for label,regen in [("grammar spec()",True),\
+                                    ("parse table",False)]:
+                    LL1grammar.Tables.regen=regen
+                    best=None
+                    for n in range(self.repeat):
+                        grammar=LL1grammar.Grammar()
+                        grammar.lexer(lex)
+                        start=time.process_time()
+                        grammar.spec("prog",spec,GrammarBench.Parser())
+                        elapsed=time.process_time()-start
+                        if best is None or elapsed<best:
+                            best=elapsed
+                    self.rate(label,alts,"prods",best)
+                    times.append(best)
+            finally:
+                LL1grammar.Tables.disable()
+        self.speedup(times[0],times[1])
+
+
+# Benchmarks by command line name
+BENCHMARKS={"dcds":ConstantBench,
+            "fpconv":FloatBench,
+            "lexer":LexerBench,
+            "ll1":GrammarBench,
+            "macro":MacroBench,
+            "memory":MemoryBench,
+            "rld":LinkBench}
+
+
+#
+#  +-----------------------------+
+#  |                             |
+#  |   Command Line Processing   |
+#  |                             |
+#  +-----------------------------+
+#
+
+# Parse the command line arguments
+def parse_args():
+    parser=argparse.ArgumentParser(prog=this_module,
+        epilog=copyright,
+        description="performance benchmarks of SATK tools")
+
+    names=sorted(BENCHMARKS.keys())
+    parser.add_argument("benchmark",nargs="*",metavar="BENCHMARK",default=[],\
+        help="benchmark being run.  Multiple may be specified.  Defaults to all "
+             "benchmarks: %s" % ", ".join(names))
+
+    parser.add_argument("-r","--repeat",type=int,default=3,metavar="N",\
+        help="times each measurement is repeated.  The best time is reported.  "
+             "Defaults to 3")
+
+    parser.add_argument("--lines",type=int,default=20000,metavar="N",\
+        help="statements in the generated source of the memory benchmark.  "
+             "Defaults to 20000")
+
+    parser.add_argument("--tables",type=int,default=200,metavar="N",\
+        help="page tables and buffers in the generated source of the dcds "
+             "benchmark.  Defaults to 200")
+
+    parser.add_argument("--invocations",type=int,default=100000,metavar="N",\
+        help="macro invocations in the generated source of the macro benchmark.  "
+             "Defaults to 100000")
+
+    parser.add_argument("--constants",type=int,default=6000,metavar="N",\
+        help="floating point constants converted by the fpconv benchmark.  "
+             "Defaults to 6000")
+
+    parser.add_argument("--productions",type=int,default=2000,metavar="N",\
+        help="production alternatives in the generated grammar of the ll1 "
+             "benchmark.  Defaults to 2000")
+
+    parser.add_argument("--rlds",type=int,default=50000,metavar="N",\
+        help="RLD items in the generated object module of the rld benchmark.  "
+             "Defaults to 50000")
+
+    args=parser.parse_args()
+    for name in args.benchmark:
+        if name not in BENCHMARKS:
+            parser.error("unrecognized benchmark: %s" % name)
+    return args
+
+if __name__ == "__main__":
+    args=parse_args()
+    print(copyright)
+    names=args.benchmark
+    if len(names)==0:
+        names=sorted(BENCHMARKS.keys())
+    for name in names:
+        bench=BENCHMARKS[name](args)
+        print("\n%s - %s" % (bench.name,bench.desc))
+        bench.run()
@@ -32,6 +32,7 @@
 # Note: none of these object are enabled for use of environment path strings.
 #
 # The mdoule includes the following individual classes:
+#   CacheFile    Reads and writes the files of a persistent cache.
 #   dir_tree     Class useful in managing directory trees.
 #   DTYPES       A class providing various mainframe device types for various
 #                families of devices.
@@ -56,8 +57,11 @@
 this_module="satkutil.py"
 
 # Python imports
+import gc        # Suspend garbage collection while loading a cache file
+import hashlib   # Access SHA-1 digests of cache file sources and code
 import os
 import os.path
+import pickle    # Access the cache file format
 import re
 import sys
 
@@ -1609,6 +1613,159 @@ class Text_Print(object):
         print(s)          # string=False so print the string here
 
 
+#
+# +----------------------------+
+# |                            |
+# |   Persistent Cache Files   |
+# |                            |
+# +----------------------------+
+#
+
+# This class reads and writes the files of a persistent cache, for example, the
+# ASMA expanded MSL CPU, macro library and floating point conversion caches.  A
+# cache file holds a pickled header dictionary followed by the cached object.
+#
+# Each header identifies the code that created the cached object: the Python
+# version and a fingerprint of the source files of the modules supplied when the
+# CacheFile object is created.  A cache file created by different code is never
+# loaded, so a change to that code requires no cache version to be maintained.
+# The header also holds the items supplied by the cache, for example, the
+# source() tuple of each file from which the cached object was built.
+#
+# A cache file is written under a temporary name and then renamed so that
+# concurrent processes never see a partial file.  Any problem reading a cache file
+# causes the cached object to be built again.  Failure to write a cache file is not
+# an error.
+#
+# Instance Argument:
+#   modules   The list of module objects whose code creates the cached objects
+class CacheFile(object):
+    codes={}     # SHA-1 digest of each module source file by path
+
+    # Returns the SHA-1 digest of a file's content as a hexadecimal string
+    @staticmethod
+    def digest(filepath):
+        with open(filepath,"rb") as fo:
+            return hashlib.sha1(fo.read()).hexdigest()
+
+    # Returns a tuple of a file's size, modification time and SHA-1 digest
+    @staticmethod
+    def source(filepath):
+        st=os.stat(filepath)
+        return (st.st_size,st.st_mtime_ns,CacheFile.digest(filepath))
+
+    # Returns whether a file matches its source() tuple.  A file whose modification
+    # time differs but whose content is the same is unchanged.
+    @staticmethod
+    def unchanged(filepath,size,mtime,digest):
+        try:
+            st=os.stat(filepath)
+        except OSError:
+            return False
+        if st.st_size!=size:
+            return False
+        if st.st_mtime_ns==mtime:
+            return True
+        try:
+            return CacheFile.digest(filepath)==digest
+        except OSError:
+            return False
+
+    def __init__(self,modules):
+        code=hashlib.sha1()
+        for module in modules:
+            filepath=os.path.abspath(module.__file__)
+            try:
+                digest=CacheFile.codes[filepath]
+            except KeyError:
+                digest=CacheFile.codes[filepath]=CacheFile.digest(filepath)
+            code.update(digest.encode("ascii"))
+        self.code=code.hexdigest()    # Fingerprint of the modules' code
+
+    # Returns a short digest of a cache file's identifying items for use in its
+    # file name.  The code fingerprint is included, so different code uses
+    # different cache files.
+    def key(self,*items):
+        key="|".join([str(item) for item in items]+[self.code,str(sys.hexversion)])
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+    # Loads the cached object of a cache file
+    # Method Arguments:
+    #   cachefile  The path of the cache file
+    #   expect     A dictionary of the items the header must contain
+    #   valid      A function accepting the header and returning whether the cached
+    #              object is still valid, or None.  Defaults to None.
+    #   loader     A function accepting the open file and returning the cached
+    #              object.  Defaults to pickle.load.
+    # Returns:
+    #   the cached object
+    #   None if the cache file is missing, created by other code, stale or
+    #   unreadable
+    def load(self,cachefile,expect,valid=None,loader=pickle.load):
+        try:
+            fo=open(cachefile,"rb")
+        except OSError:
+            return None
+        with fo:
+            try:
+                header=pickle.load(fo)
+                if header.get("code")!=self.code \
+                   or header.get("python")!=sys.hexversion:
+                    return None
+                for item,value in expect.items():
+                    if header.get(item)!=value:
+                        return None
+                if valid is not None and not valid(header):
+                    return None
+                # Garbage collection is pointless for the many objects being
+                # created and dominates the load time.
+                enabled=gc.isenabled()
+                gc.disable()
+                try:
+                    return loader(fo)
+                finally:
+                    if enabled:
+                        gc.enable()
+            except Exception:
+                # Any problem with the cache file simply causes a rebuild
+                return None
+
+    # Saves an object in a cache file
+    # Method Arguments:
+    #   cachefile  The path of the cache file.  Its directory is created if needed.
+    #   header     A dictionary of the items identifying the cached object
+    #   obj        The object being cached
+    #   dumper     A function accepting the open file and the object and writing
+    #              the object.  Defaults to None, the object is pickled.
+    # Returns:
+    #   True if the cache file was written
+    #   False if it was not
+    def save(self,cachefile,header,obj,dumper=None):
+        header=dict(header)
+        header["code"]=self.code
+        header["python"]=sys.hexversion
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(cachefile)),exist_ok=True)
+        except OSError:
+            return False
+        tmpfile="%s.%s.tmp" % (cachefile,os.getpid())
+        try:
+            with open(tmpfile,"wb") as fo:
+                pickle.dump(header,fo,protocol=pickle.HIGHEST_PROTOCOL)
+                if dumper is None:
+                    pickle.dump(obj,fo,protocol=pickle.HIGHEST_PROTOCOL)
+                else:
+                    dumper(fo,obj)
+            os.replace(tmpfile,cachefile)
+        except Exception:
+            try:
+                os.remove(tmpfile)
+            except OSError:
+                pass
+            return False
+        return True
+
+
 #
 # +--------------------+
 # |                    |
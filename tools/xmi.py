@@ -47,7 +47,11 @@ import satkutil
 
 # Setup PYTHONPATH
 satkutil.pythonpath("tools/ipl")
+satkutil.pythonpath("tools/lang")
 from hexdump import dump
+import codepage                   # Access shared translation tables
+
+CP037=codepage.codec("cp037")     # Shared EBCDIC translator
 
 
 #
@@ -538,7 +542,7 @@ class TextUnitChr(TextUnit):
 
     def value(self):
         data=self.check_pairs("C",1)
-        return data.decode("cp037")
+        return CP037.e2as(data)
 
 
 class TextUnitDec(TextUnit):
@@ -589,7 +593,7 @@ class TextUnitFile(TextUnit):
     def value(self):
         data=[]
         for item in self.pairs:
-            data.append(item.decode("cp037"))
+            data.append(CP037.e2as(item))
         data=".".join(data)
         return data
 
@@ -1025,7 +1029,7 @@ class XMIREC(object):
         # Extract control record ID
         ctlid=self.bdata[:6] 
         # Convert it to ASCII
-        ctlid=ctlid.decode("cp037")
+        ctlid=CP037.e2as(ctlid)
         try:
             ctlcls=XMIREC.ctlcls[ctlid]
         except KeyError:
@@ -1142,7 +1146,7 @@ class XMISEG(object):
         else:
             error=" "
         if self.isctl and len(self.bdata)>=6:
-            ctltyp=self.bdata[0:6].decode("cp037")
+            ctltyp=CP037.e2as(self.bdata[0:6])
             ctlrec=": %s" % ctltyp
         else:
             ctlrec=""
@@ -1696,7 +1700,7 @@ class DIRNTRY(structure):
         super().__init__(bdata,ndx=ndx)
         #                             +0  8  Member name in EBCDIC
         ebcdic=self.bdata[ndx:ndx+8]
-        ascii=ebcdic.decode("cp037")
+        ascii=CP037.e2as(ebcdic)
         name=ascii.rstrip()
         self.member=name
         self.ttr=TTR(self.bdata[ndx+8:ndx+11])  #  +8  3  TTR of members first block
@@ -1841,16 +1845,15 @@ class MEMBER(object):
     def image(self):
         return self.blocks()
 
-    # Returns a list of logical records converted to ASCII strings
+    # Returns a list of logical records converted to ASCII strings.  Each block
+    # is translated as a whole and then divided into its records.
     def records(self):
         recs=[]
         lrecl=self.lrecl
         for blk in self.ckd:
-            data=blk.data()
+            data=CP037.e2as(blk.data())
             for ndx in range(0,blk.dlen-1,lrecl):
-                rec=data[ndx:ndx+lrecl]
-                rec=rec.decode("cp037")
-                recs.append(rec)
+                recs.append(data[ndx:ndx+lrecl])
         return recs
 
     # Returns a list of ASCII strings without sequence numbers